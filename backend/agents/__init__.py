@@ -15,6 +15,7 @@ from backend.agents.client import (
     get_chat_client,
     get_shared_chat_client,
     get_orchestrator_chat_client,
+    close_chat_clients,
     get_deployment_info,
 )
 
@@ -35,5 +36,6 @@ __all__ = [
     "get_chat_client",
     "get_shared_chat_client",
     "get_orchestrator_chat_client",  # For orchestrator/manager (gpt-5-mini)
+    "close_chat_clients",
     "get_deployment_info",
 ]
@@ -7,12 +7,19 @@ Supports separate model deployments for:
 - Orchestrator: AZURE_OPENAI_ORCHESTRATOR_DEPLOYMENT (default: gpt-5-mini)
 """
 
+import hashlib
 import os
-from functools import lru_cache
 from typing import Literal, Optional
 
-from azure.identity import DefaultAzureCredential, AzureCliCredential
+from azure.identity import (
+    DefaultAzureCredential,
+    AzureCliCredential,
+    ManagedIdentityCredential,
+    get_bearer_token_provider,
+)
 from agent_framework.azure import AzureOpenAIChatClient
+from openai import AsyncAzureOpenAI
+import httpx
 import structlog
 
 logger = structlog.get_logger()
@@ -22,6 +29,10 @@ AZURE_OPENAI_ENDPOINT = os.getenv("AZURE_OPENAI_ENDPOINT", "")
 AZURE_OPENAI_API_VERSION = os.getenv("AZURE_OPENAI_API_VERSION", "2024-08-01-preview")
 AZURE_OPENAI_KEY = os.getenv("AZURE_OPENAI_KEY", "")
 
+# Skip the DefaultAzureCredential chain in deployed environments
+USE_MANAGED_IDENTITY = os.getenv("USE_MANAGED_IDENTITY", "false").lower() in ("1", "true", "yes")
+AZURE_CLIENT_ID = os.getenv("AZURE_CLIENT_ID", "")
+
 # Separate deployments for agents vs orchestrator
 # Agents use lighter model for individual tasks
 AZURE_OPENAI_AGENT_DEPLOYMENT = os.getenv("AZURE_OPENAI_AGENT_DEPLOYMENT", "gpt-5-nano")
@@ -31,14 +42,48 @@ AZURE_OPENAI_ORCHESTRATOR_DEPLOYMENT = os.getenv("AZURE_OPENAI_ORCHESTRATOR_DEPL
 # Legacy fallback (for backward compatibility)
 AZURE_OPENAI_DEPLOYMENT = os.getenv("AZURE_OPENAI_DEPLOYMENT", AZURE_OPENAI_AGENT_DEPLOYMENT)
 
+# Connection pool shared by every chat client (agents and orchestrator)
+AZURE_OPENAI_MAX_CONNECTIONS = int(os.getenv("AZURE_OPENAI_MAX_CONNECTIONS", "64"))
+AZURE_OPENAI_MAX_KEEPALIVE = int(os.getenv("AZURE_OPENAI_MAX_KEEPALIVE", "32"))
+# Request timeout in seconds for chat completions
+AZURE_OPENAI_TIMEOUT = float(os.getenv("AZURE_OPENAI_TIMEOUT", "60"))
+# Multiplex concurrent calls over one connection (needs the optional h2 package)
+AZURE_OPENAI_HTTP2 = os.getenv("AZURE_OPENAI_HTTP2", "false").lower() in ("1", "true", "yes")
 
-def get_credential():
+# Entra ID scope for Azure OpenAI tokens
+_TOKEN_SCOPE = "https://cognitiveservices.azure.com/.default"
+
+# Chat clients keyed by SHA256 of their resolved configuration
+_CLIENT_CACHE: dict[str, AzureOpenAIChatClient] = {}
+
+# Shared HTTP client, created on first use
+_HTTP_CLIENT: Optional[httpx.AsyncClient] = None
+
+# Shared Azure credential, set on the first successful get_credential()
+_CREDENTIAL = None
+
+
+def _create_credential():
     """
-    Get Azure credential for authentication.
+    Build an Azure credential, or None if every credential type fails.
 
-    Tries DefaultAzureCredential first (works with managed identity, Azure CLI, etc.)
+    When USE_MANAGED_IDENTITY is set, a ManagedIdentityCredential is built
+    directly (using AZURE_CLIENT_ID if present) to skip the credential chain probe.
+    Otherwise tries DefaultAzureCredential first (works with managed identity, Azure CLI, etc.)
     Falls back to API key if DefaultAzureCredential fails and AZURE_OPENAI_KEY is set.
     """
+    if USE_MANAGED_IDENTITY:
+        try:
+            credential = ManagedIdentityCredential(client_id=AZURE_CLIENT_ID or None)
+            logger.info("azure_credential_initialized", method="ManagedIdentityCredential")
+            return credential
+        except Exception as e:
+            logger.warning(
+                "managed_identity_credential_failed",
+                error=str(e),
+                fallback="DefaultAzureCredential"
+            )
+
     try:
         # Try DefaultAzureCredential first (managed identity, Azure CLI, etc.)
         credential = DefaultAzureCredential()
@@ -63,6 +108,56 @@ def get_credential():
             return None
 
 
+def get_credential():
+    """
+    Get Azure credential for authentication.
+
+    Cached for the life of the process so every client shares one credential
+    and its token cache (DefaultAzureCredential caches tokens per instance).
+    Only a successful result is cached; if every credential fails, the next
+    call tries again instead of leaving the process without one.
+    """
+    global _CREDENTIAL
+    if _CREDENTIAL is None:
+        _CREDENTIAL = _create_credential()
+    return _CREDENTIAL
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """
+    Get the HTTP client shared by all chat clients.
+
+    Agents on different deployments still talk to the same endpoint, so one
+    pool lets concurrent agent calls (fan-out, group chat) reuse warm TLS
+    connections instead of each client opening its own.
+    """
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None or _HTTP_CLIENT.is_closed:
+        http2 = AZURE_OPENAI_HTTP2
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                logger.warning("http2_unavailable", reason="h2 package not installed", fallback="http/1.1")
+                http2 = False
+
+        _HTTP_CLIENT = httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=AZURE_OPENAI_MAX_CONNECTIONS,
+                max_keepalive_connections=AZURE_OPENAI_MAX_KEEPALIVE,
+            ),
+            timeout=AZURE_OPENAI_TIMEOUT,
+        )
+    return _HTTP_CLIENT
+
+
+def _client_cache_key(endpoint: str, deployment: str, api_version: str, auth_mode: str) -> str:
+    """SHA256 fingerprint of a resolved client configuration."""
+    raw = "|".join((endpoint, deployment, api_version, auth_mode))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
 def get_chat_client(
     endpoint: Optional[str] = None,
     deployment: Optional[str] = None,
@@ -72,6 +167,11 @@ def get_chat_client(
     """
     Factory for Azure OpenAI chat client.
 
+    Clients are cached per resolved (endpoint, deployment, api_version, auth)
+    configuration, so all agents on the same deployment share one client.
+    Every client, across deployments, sends requests through one shared
+    HTTP connection pool.
+
     Args:
         endpoint: Azure OpenAI endpoint URL (uses env var if not provided)
         deployment: Model deployment name (uses env var if not provided)
@@ -101,48 +201,53 @@ def get_chat_client(
         )
 
     credential = get_credential()
+    auth_mode = "credential" if credential else "api_key"
+
+    cache_key = _client_cache_key(_endpoint, _deployment, _api_version, auth_mode)
+    cached = _CLIENT_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
 
     if credential:
-        # Use credential-based authentication
-        client = AzureOpenAIChatClient(
-            endpoint=_endpoint,
-            credential=credential,
-            deployment_name=_deployment,
-            api_version=_api_version,
-        )
-        logger.info(
-            "chat_client_created",
-            endpoint=_endpoint,
-            deployment=_deployment,
-            auth="credential",
-        )
+        # Use credential-based authentication (tokens refreshed by the provider)
+        auth = {"azure_ad_token_provider": get_bearer_token_provider(credential, _TOKEN_SCOPE)}
     elif AZURE_OPENAI_KEY:
         # Fall back to API key authentication
-        client = AzureOpenAIChatClient(
-            endpoint=_endpoint,
-            api_key=AZURE_OPENAI_KEY,
-            deployment_name=_deployment,
-            api_version=_api_version,
-        )
-        logger.info(
-            "chat_client_created",
-            endpoint=_endpoint,
-            deployment=_deployment,
-            auth="api_key",
-        )
+        auth = {"api_key": AZURE_OPENAI_KEY}
     else:
         raise ValueError(
             "No Azure authentication available. "
             "Set up DefaultAzureCredential or AZURE_OPENAI_KEY."
         )
 
+    async_client = AsyncAzureOpenAI(
+        azure_endpoint=_endpoint,
+        azure_deployment=_deployment,
+        api_version=_api_version,
+        http_client=_get_http_client(),
+        **auth,
+    )
+    client = AzureOpenAIChatClient(
+        endpoint=_endpoint,
+        deployment_name=_deployment,
+        api_version=_api_version,
+        async_client=async_client,
+    )
+
+    _CLIENT_CACHE[cache_key] = client
+    logger.info(
+        "chat_client_created",
+        endpoint=_endpoint,
+        deployment=_deployment,
+        auth=auth_mode,
+    )
+
     return client
 
 
-@lru_cache(maxsize=1)
 def get_shared_chat_client() -> AzureOpenAIChatClient:
     """
-    Get a cached shared chat client instance for agents.
+    Get the shared chat client instance for agents.
 
     Use this when you want to reuse the same client across multiple agents
     to reduce connection overhead. Note: This is cached, so configuration
@@ -153,10 +258,9 @@ def get_shared_chat_client() -> AzureOpenAIChatClient:
     return get_chat_client(role="agent")
 
 
-@lru_cache(maxsize=1)
 def get_orchestrator_chat_client() -> AzureOpenAIChatClient:
     """
-    Get a cached chat client for orchestrator/manager agents.
+    Get the shared chat client for orchestrator/manager agents.
 
     Uses gpt-5-mini (orchestrator deployment) - more capable model
     for planning and coordination tasks.
@@ -164,6 +268,23 @@ def get_orchestrator_chat_client() -> AzureOpenAIChatClient:
     return get_chat_client(role="orchestrator")
 
 
+async def close_chat_clients():
+    """Close all cached chat clients and the shared connection pool."""
+    global _HTTP_CLIENT
+    clients = list(_CLIENT_CACHE.values())
+    _CLIENT_CACHE.clear()
+    for client in clients:
+        try:
+            if client.client is not None:
+                await client.client.close()
+        except Exception as e:
+            logger.warning("chat_client_close_failed", error=str(e))
+
+    if _HTTP_CLIENT is not None:
+        await _HTTP_CLIENT.aclose()
+        _HTTP_CLIENT = None
+
+
 def get_deployment_info() -> dict:
     """Get current deployment configuration info (for debugging/logging)."""
     return {
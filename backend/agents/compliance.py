@@ -9,6 +9,7 @@ from agent_framework import ChatAgent
 import structlog
 
 from backend.agents.client import get_chat_client
+from backend.agents.prompts import build_agent_instructions, log_prompt_cache_usage
 from backend.agents.tools.compliance_tools import (
     check_restrictions,
     validate_weights,
@@ -63,10 +64,11 @@ def create_compliance_agent(
     """
     agent = ChatAgent(
         chat_client=get_chat_client(),
-        instructions=COMPLIANCE_AGENT_INSTRUCTIONS,
+        instructions=build_agent_instructions(COMPLIANCE_AGENT_INSTRUCTIONS),
         name=name,
         description=description or "Checks regulatory and policy compliance",
         tools=[check_restrictions, validate_weights, verify_esg],
+        middleware=[log_prompt_cache_usage],
     )
 
     logger.info(
@@ -9,6 +9,7 @@ from agent_framework import ChatAgent
 import structlog
 
 from backend.agents.client import get_chat_client
+from backend.agents.prompts import build_agent_instructions, log_prompt_cache_usage
 from backend.agents.tools.market_tools import (
     query_universe,
     fetch_prices,
@@ -42,6 +43,7 @@ When given an objective:
 def create_market_agent(
     name: str = "market_agent",
     description: Optional[str] = None,
+    instructions: Optional[str] = None,
 ) -> ChatAgent:
     """
     Create a Market Agent with market data tools.
@@ -49,16 +51,18 @@ def create_market_agent(
     Args:
         name: Agent name/identifier
         description: Optional agent description
+        instructions: Optional system prompt replacing the default market instructions
 
     Returns:
         Configured ChatAgent with market tools
     """
     agent = ChatAgent(
         chat_client=get_chat_client(),
-        instructions=MARKET_AGENT_INSTRUCTIONS,
+        instructions=instructions or build_agent_instructions(MARKET_AGENT_INSTRUCTIONS),
         name=name,
         description=description or "Retrieves market data and builds investment universe",
         tools=[query_universe, fetch_prices, get_fundamentals],
+        middleware=[log_prompt_cache_usage],
     )
 
     logger.info(
@@ -9,6 +9,7 @@ from agent_framework import ChatAgent
 import structlog
 
 from backend.agents.client import get_chat_client
+from backend.agents.prompts import build_agent_instructions, log_prompt_cache_usage
 from backend.agents.tools.optimizer_tools import (
     optimize_allocation,
     check_feasibility,
@@ -61,10 +62,11 @@ def create_optimizer_agent(
     """
     agent = ChatAgent(
         chat_client=get_chat_client(),
-        instructions=OPTIMIZER_AGENT_INSTRUCTIONS,
+        instructions=build_agent_instructions(OPTIMIZER_AGENT_INSTRUCTIONS),
         name=name,
         description=description or "Runs portfolio optimization with constraints",
         tools=[optimize_allocation, check_feasibility, rebalance],
+        middleware=[log_prompt_cache_usage],
     )
 
     logger.info(
@@ -9,6 +9,7 @@ from agent_framework import ChatAgent
 import structlog
 
 from backend.agents.client import get_chat_client
+from backend.agents.prompts import build_agent_instructions, log_prompt_cache_usage
 from backend.agents.tools.return_tools import (
     forecast_returns,
     evaluate_themes,
@@ -61,10 +62,11 @@ def create_return_agent(
     """
     agent = ChatAgent(
         chat_client=get_chat_client(),
-        instructions=RETURN_AGENT_INSTRUCTIONS,
+        instructions=build_agent_instructions(RETURN_AGENT_INSTRUCTIONS),
         name=name,
         description=description or "Estimates expected returns and evaluates investment themes",
         tools=[forecast_returns, evaluate_themes, analyze_factors],
+        middleware=[log_prompt_cache_usage],
     )
 
     logger.info(
@@ -9,6 +9,7 @@ from agent_framework import ChatAgent
 import structlog
 
 from backend.agents.client import get_chat_client
+from backend.agents.prompts import build_agent_instructions, log_prompt_cache_usage
 from backend.agents.tools.risk_tools import (
     compute_var,
     stress_test,
@@ -62,10 +63,11 @@ def create_risk_agent(
     """
     agent = ChatAgent(
         chat_client=get_chat_client(),
-        instructions=RISK_AGENT_INSTRUCTIONS,
+        instructions=build_agent_instructions(RISK_AGENT_INSTRUCTIONS),
         name=name,
         description=description or "Computes risk metrics and validates constraints",
         tools=[compute_var, stress_test, check_limits],
+        middleware=[log_prompt_cache_usage],
     )
 
     logger.info(
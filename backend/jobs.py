@@ -0,0 +1,65 @@
+"""
+IC Autopilot job worker - consumes workflow runs from the Redis job queue.
+
+Run with:
+    arq jobs.WorkerSettings
+
+Workflows execute exactly as they do in the API process and publish their
+events to the same Redis event bus, so clients keep streaming progress from
+the API's SSE endpoint.
+"""
+
+import os
+
+from schemas.policy import InvestorPolicyStatement
+from services.admission import MAX_CONCURRENT_RUNS
+from services.job_queue import JOB_QUEUE_NAME, REDIS_SETTINGS
+
+from main import (
+    app,
+    logger,
+    _prewarm,
+    _shutdown,
+    execute_workflow,
+    execute_orchestrator_workflow,
+)
+
+# Seconds a single workflow run may take before the worker abandons it
+JOB_TIMEOUT = int(os.getenv("JOB_TIMEOUT_SECONDS", "1800"))
+# Attempts per run (retries happen if a worker dies mid-run)
+JOB_MAX_TRIES = int(os.getenv("JOB_MAX_TRIES", "3"))
+
+
+async def run_ic_workflow(ctx: dict, run_id: str):
+    """Execute the 10-stage IC workflow for a run."""
+    await execute_workflow(run_id)
+
+
+async def run_orchestrator_workflow(ctx: dict, run_id: str, policy: dict, workflow_type: str = "handoff"):
+    """Execute an orchestrator workflow for a serialized Investor Policy Statement."""
+    ips = InvestorPolicyStatement.model_validate(policy)
+    await execute_orchestrator_workflow(run_id, ips, workflow_type)
+
+
+async def startup(ctx: dict):
+    """Connect Redis, Postgres, Blob storage and the chat clients before taking jobs."""
+    logger.info("starting_ic_autopilot_worker", queue=JOB_QUEUE_NAME, max_jobs=MAX_CONCURRENT_RUNS)
+    await _prewarm(app)
+
+
+async def shutdown(ctx: dict):
+    """Release connections on worker shutdown (same cleanup as the API)."""
+    logger.info("shutting_down_ic_autopilot_worker")
+    await _shutdown(app)
+
+
+class WorkerSettings:
+    """ARQ worker configuration."""
+    functions = [run_ic_workflow, run_orchestrator_workflow]
+    on_startup = startup
+    on_shutdown = shutdown
+    redis_settings = REDIS_SETTINGS
+    queue_name = JOB_QUEUE_NAME
+    max_jobs = MAX_CONCURRENT_RUNS
+    job_timeout = JOB_TIMEOUT
+    max_tries = JOB_MAX_TRIES
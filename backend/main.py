@@ -5,21 +5,35 @@ Main entry point for the backend API.
 
 import os
 import asyncio
+import hashlib
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
+import orjson
 import structlog
-from fastapi import FastAPI, HTTPException, Request, BackgroundTasks
+from cachetools import TTLCache
+from fastapi import FastAPI, HTTPException, Request, Response, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from sse_starlette.sse import EventSourceResponse
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, TypeAdapter
 
 from schemas import WorkflowEvent, EventKind, RunStatus
 from schemas.runs import RunMetadata
 from services.event_bus import get_event_bus, close_event_bus
 from services.artifact_store import get_artifact_store
 from services.run_store import get_run_store
+from services.admission import admitted, get_admission_controller
+from services.job_queue import JOB_QUEUE_ENABLED, enqueue_job, close_job_pool
+
+try:
+    from worker.workflow import ICWorkflow
+except ModuleNotFoundError as e:
+    # Only tolerate the worker package itself being absent (API-only checkout);
+    # a missing dependency inside it is a real error and must surface.
+    if e.name not in ("worker", "worker.workflow"):
+        raise
+    ICWorkflow = None
 
 # Configure structured logging
 structlog.configure(
@@ -40,20 +54,114 @@ structlog.configure(
 
 logger = structlog.get_logger()
 
+# Seconds allowed for each dependency to warm up at startup
+PREWARM_TIMEOUT = float(os.getenv("PREWARM_TIMEOUT", "10"))
+COGNITIVE_SERVICES_SCOPE = "https://cognitiveservices.azure.com/.default"
+# Seconds each /ready dependency check may take before it counts as failed
+READY_CHECK_TIMEOUT = float(os.getenv("READY_CHECK_TIMEOUT", "1"))
+
+# Max events buffered per SSE connection before the oldest are dropped
+SSE_QUEUE_MAXSIZE = int(os.getenv("SSE_QUEUE_MAXSIZE", "256"))
+# Max buffered events coalesced into one SSE write
+SSE_MAX_BATCH = 32
+# Optional delay before flushing, so more events can coalesce (0 = flush immediately)
+SSE_WRITE_DELAY = int(os.getenv("SSE_WRITE_DELAY_MS", "0")) / 1000
+# Seconds of silence before a keep-alive ping is sent on an SSE connection
+SSE_PING_INTERVAL = 15
+# Stop reverse proxies (Nginx, Front Door) from buffering or caching the stream
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",
+    "Connection": "keep-alive",
+}
+
+# Short-lived cache of serialized run/artifact GET responses (absorbs UI polling)
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "2"))
+RESPONSE_CACHE_MAXSIZE = 1024
+# Cache-Control for responses that can no longer change (finished runs, pinned artifact versions)
+IMMUTABLE_CACHE_CONTROL = "public, max-age=3600"
+FINAL_RUN_STATUSES = {RunStatus.COMPLETED, RunStatus.FAILED, RunStatus.CANCELLED}
+
+
+async def _warm_chat_clients():
+    """Resolve the Azure credential, fetch a token, and build the shared chat clients."""
+    from backend.agents.client import (
+        get_credential,
+        get_shared_chat_client,
+        get_orchestrator_chat_client,
+    )
+
+    credential = await asyncio.to_thread(get_credential)
+    if credential is not None:
+        await asyncio.to_thread(credential.get_token, COGNITIVE_SERVICES_SCOPE)
+    await asyncio.to_thread(get_shared_chat_client)
+    await asyncio.to_thread(get_orchestrator_chat_client)
+
+
+async def _prewarm(app: FastAPI):
+    """
+    Concurrently connect Redis, Postgres, Blob storage and the chat clients.
+
+    Connected stores are kept on app.state so handlers can use them without
+    awaiting the lazy getters.
+    """
+    targets = {
+        "event_bus": get_event_bus(),
+        "run_store": get_run_store(),
+        "artifact_store": get_artifact_store(),
+        "chat_clients": _warm_chat_clients(),
+    }
+    results = await asyncio.gather(
+        *(asyncio.wait_for(coro, timeout=PREWARM_TIMEOUT) for coro in targets.values()),
+        return_exceptions=True,
+    )
+    for name, result in zip(targets, results):
+        if isinstance(result, BaseException):
+            logger.warning("prewarm_failed", target=name, error=str(result) or type(result).__name__)
+        else:
+            logger.info("prewarm_completed", target=name)
+            if name in SERVICE_STATE_KEYS:
+                setattr(app.state, name, result)
+
+
+async def _shutdown(app: FastAPI):
+    """
+    Release everything _prewarm and the workflows opened.
+
+    Shared by the API lifespan and the job worker, which run the same
+    workflow code and so hold the same connections.
+    """
+    await close_event_bus()
+    app.state.event_bus = None
+    await close_job_pool()
+
+    try:
+        from backend.agents.client import close_chat_clients
+        await close_chat_clients()
+    except Exception as e:
+        logger.warning("chat_client_shutdown_failed", error=str(e))
+
+    try:
+        from backend.orchestrator.engine import close_aoai_client
+        await close_aoai_client()
+    except Exception as e:
+        logger.warning("aoai_client_shutdown_failed", error=str(e))
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan - initialize and cleanup resources."""
     logger.info("starting_ic_autopilot_api")
 
-    # Initialize services (lazy - will connect on first use)
-    # Pre-warm connections can be added here if needed
+    # Pre-warm connections so the first requests don't pay connect/auth latency.
+    # Failures are logged only - services still connect lazily on first use.
+    await _prewarm(app)
 
     yield
 
     # Cleanup
     logger.info("shutting_down_ic_autopilot_api")
-    await close_event_bus()
+    await _shutdown(app)
 
 
 # Create FastAPI app
@@ -62,15 +170,30 @@ app = FastAPI(
     description="Investment Committee Autopilot - Real-time workflow orchestration",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-# CORS configuration
+# Service singletons, populated by the lifespan pre-warm. Handlers fall back
+# to the lazy getters when a service wasn't available at startup.
+SERVICE_STATE_KEYS = ("event_bus", "run_store", "artifact_store")
+for _key in SERVICE_STATE_KEYS:
+    setattr(app.state, _key, None)
+
+# CORS configuration - explicit allowlist (a wildcard origin is rejected by
+# browsers when credentials are allowed). Preflights are cached for 24h.
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGINS", "http://localhost:3000").split(",")
+    if origin.strip()
+]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PATCH"],
+    allow_headers=["Authorization", "Content-Type", "Last-Event-ID", "If-None-Match"],
+    expose_headers=["ETag"],
+    max_age=86400,
 )
 
 
@@ -103,6 +226,16 @@ class RunSummary(BaseModel):
     selected_candidate: Optional[str]
 
 
+# Built once at import: serializes run lists in the RunSummary shape
+_RUN_LIST_ADAPTER = TypeAdapter(List[RunMetadata])
+_RUN_SUMMARY_INCLUDE = {"__all__": set(RunSummary.model_fields)}
+
+
+class ConcurrencyUpdate(BaseModel):
+    """Request to resize the workflow admission limit."""
+    max_concurrent_runs: int = Field(ge=1)
+
+
 class OrchestratorRunResponse(BaseModel):
     """Response after starting an orchestrator run."""
     run_id: str
@@ -121,35 +254,62 @@ async def health_check():
     return {"status": "healthy", "timestamp": datetime.utcnow().isoformat()}
 
 
+async def _check_redis():
+    """Ping Redis through the event bus connection."""
+    event_bus = app.state.event_bus or await get_event_bus()
+    await event_bus.redis.ping()
+
+
+async def _check_postgres():
+    """Run a trivial query on a pooled Postgres connection."""
+    run_store = app.state.run_store or await get_run_store()
+    async with run_store.pool.acquire() as conn:
+        await conn.fetchval("SELECT 1")
+
+
 @app.get("/ready")
 async def readiness_check():
-    """Readiness check - verifies dependencies."""
-    checks = {"api": True}
-
-    try:
-        event_bus = await get_event_bus()
-        await event_bus.redis.ping()
-        checks["redis"] = True
-    except Exception as e:
-        checks["redis"] = False
-        logger.error("redis_health_check_failed", error=str(e))
+    """Readiness check - verifies dependencies concurrently, each bounded by READY_CHECK_TIMEOUT."""
+    dependency_checks = {
+        "redis": _check_redis,
+        "postgres": _check_postgres,
+    }
+    results = await asyncio.gather(
+        *(asyncio.wait_for(check(), timeout=READY_CHECK_TIMEOUT) for check in dependency_checks.values()),
+        return_exceptions=True,
+    )
 
-    try:
-        run_store = await get_run_store()
-        async with run_store.pool.acquire() as conn:
-            await conn.fetchval("SELECT 1")
-        checks["postgres"] = True
-    except Exception as e:
-        checks["postgres"] = False
-        logger.error("postgres_health_check_failed", error=str(e))
+    checks = {"api": True}
+    for name, result in zip(dependency_checks, results):
+        checks[name] = not isinstance(result, BaseException)
+        if not checks[name]:
+            logger.error(f"{name}_health_check_failed", error=str(result) or type(result).__name__)
 
     all_healthy = all(checks.values())
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=200 if all_healthy else 503,
         content={"ready": all_healthy, "checks": checks}
     )
 
 
+# ============================================================================
+# Admin Endpoints
+# ============================================================================
+
+@app.get("/admin/concurrency")
+async def get_concurrency():
+    """Get workflow admission controller state."""
+    return get_admission_controller().stats()
+
+
+@app.patch("/admin/concurrency")
+async def update_concurrency(update: ConcurrencyUpdate):
+    """Resize the max number of concurrently executing workflows."""
+    controller = get_admission_controller()
+    await controller.resize(update.max_concurrent_runs)
+    return controller.stats()
+
+
 # ============================================================================
 # IC Run Endpoints
 # ============================================================================
@@ -163,7 +323,7 @@ async def start_run(request: StartRunRequest, background_tasks: BackgroundTasks)
     Returns immediately with run_id - use SSE to track progress.
     """
     try:
-        run_store = await get_run_store()
+        run_store = app.state.run_store or await get_run_store()
 
         # Create run
         run = await run_store.create_run(
@@ -172,8 +332,11 @@ async def start_run(request: StartRunRequest, background_tasks: BackgroundTasks)
             config=request.config,
         )
 
-        # Start workflow in background
-        background_tasks.add_task(execute_workflow, run.run_id)
+        # Hand off to the worker pool, or run in this process when no queue is configured
+        if JOB_QUEUE_ENABLED:
+            await enqueue_job("run_ic_workflow", run.run_id, job_id=run.run_id)
+        else:
+            background_tasks.add_task(execute_workflow, run.run_id)
 
         logger.info("run_started", run_id=run.run_id, mandate_id=request.mandate_id)
 
@@ -188,16 +351,119 @@ async def start_run(request: StartRunRequest, background_tasks: BackgroundTasks)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# (body, etag, cache_control, last_modified) keyed by (endpoint, run_id, artifact_type, version)
+_response_cache: TTLCache = TTLCache(maxsize=RESPONSE_CACHE_MAXSIZE, ttl=RESPONSE_CACHE_TTL)
+
+
+def _cache_entry(payload, cache_control: str = "no-cache", last_modified: Optional[datetime] = None) -> tuple:
+    """Serialize a payload once and compute its ETag."""
+    if isinstance(payload, BaseModel):
+        payload = payload.model_dump(mode="json")
+    body = ORJSONResponse(payload).body
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    last_modified_header = last_modified.strftime("%a, %d %b %Y %H:%M:%S GMT") if last_modified else None
+    return body, etag, cache_control, last_modified_header
+
+
+def _conditional_response(request: Request, entry: tuple) -> Response:
+    """Return 304 if the client's If-None-Match matches the entry's ETag, else the full body."""
+    body, etag, cache_control, last_modified = entry
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if last_modified:
+        headers["Last-Modified"] = last_modified
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (if_none_match.strip() == "*" or etag in [t.strip() for t in if_none_match.split(",")]):
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 @app.get("/api/ic/runs/{run_id}")
-async def get_run(run_id: str):
+async def get_run(run_id: str, request: Request):
     """Get run status and metadata."""
-    run_store = await get_run_store()
-    run = await run_store.get_run(run_id)
+    key = ("run", run_id, None, None)
+    entry = _response_cache.get(key)
+
+    if entry is None:
+        run_store = app.state.run_store or await get_run_store()
+        run = await run_store.get_run(run_id)
+
+        if not run:
+            raise HTTPException(status_code=404, detail="Run not found")
+
+        if run.status in FINAL_RUN_STATUSES:
+            entry = _cache_entry(run.model_dump(), IMMUTABLE_CACHE_CONTROL, run.completed_at)
+        else:
+            entry = _cache_entry(run.model_dump())
+        _response_cache[key] = entry
+
+    return _conditional_response(request, entry)
 
-    if not run:
-        raise HTTPException(status_code=404, detail="Run not found")
 
-    return run.model_dump()
+def _put_drop_oldest(queue: asyncio.Queue, item) -> bool:
+    """Enqueue without blocking, evicting the oldest item when full. Returns True if one was dropped."""
+    try:
+        queue.put_nowait(item)
+        return False
+    except asyncio.QueueFull:
+        queue.get_nowait()
+        queue.put_nowait(item)
+        return True
+
+
+async def _sse_reader(queue: asyncio.Queue, run_id: str, last_event_id: Optional[str]):
+    """
+    Read events from the Redis stream into a bounded per-connection queue.
+
+    Runs as its own task so a slow SSE client never stalls the Redis subscriber.
+    When the queue is full the oldest buffered event is dropped; a ``None``
+    sentinel marks the end of the stream.
+    """
+    dropped = 0
+    try:
+        event_bus = app.state.event_bus or await get_event_bus()
+        async for batch in event_bus.subscribe(run_id, last_event_id):
+            for event in batch:
+                if _put_drop_oldest(queue, event):
+                    dropped += 1
+                    if dropped == 1 or dropped % 100 == 0:
+                        logger.warning("sse_events_dropped", run_id=run_id, dropped=dropped)
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        logger.error("sse_stream_error", run_id=run_id, error=str(e))
+    finally:
+        if dropped:
+            logger.info("sse_reader_finished", run_id=run_id, dropped=dropped)
+        _put_drop_oldest(queue, None)
+
+
+# Retry in 5 seconds on disconnect
+SSE_RETRY_MS = 5000
+_SSE_FRAME = "id: {}\r\nevent: {}\r\ndata: {}\r\nretry: " + str(SSE_RETRY_MS) + "\r\n\r\n"
+
+
+def _encode_sse(event: WorkflowEvent) -> bytes:
+    """
+    Encode a workflow event as an SSE frame.
+
+    Formats the frame directly (same wire format as ServerSentEvent.encode())
+    instead of building a ServerSentEvent per event. Event data is compact
+    JSON, so it never spans multiple lines.
+    """
+    event_id = event.event_id
+    kind = event.kind.value
+    data = event.to_sse_data()
+    return _SSE_FRAME.format(event_id, kind, data).encode()
+
+
+async def _watch_disconnect(request: Request):
+    """Resolve once the client sends http.disconnect, so the SSE loop never polls receive()."""
+    while True:
+        message = await request.receive()
+        if message["type"] == "http.disconnect":
+            return
 
 
 @app.get("/api/ic/runs/{run_id}/events")
@@ -214,62 +480,113 @@ async def stream_events(request: Request, run_id: str, since: Optional[str] = No
     logger.info("sse_connection_started", run_id=run_id, last_event_id=last_event_id)
 
     async def event_generator():
-        """Generate SSE events from Redis stream."""
-        event_bus = await get_event_bus()
+        """Drain the bounded queue filled by the Redis reader task."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SSE_QUEUE_MAXSIZE)
+        reader = asyncio.create_task(_sse_reader(queue, run_id, last_event_id))
+        disconnect_task = asyncio.create_task(_watch_disconnect(request))
+        # Bound once - these run for every event on the stream
+        encode = _encode_sse
+        get_nowait = queue.get_nowait
 
         try:
-            async for event in event_bus.subscribe(run_id, last_event_id):
-                # Check if client disconnected
-                if await request.is_disconnected():
+            while True:
+                # Check if client disconnected (non-awaiting)
+                if disconnect_task.done():
                     logger.info("sse_client_disconnected", run_id=run_id)
                     break
 
-                yield {
-                    "id": event.event_id,
-                    "event": event.kind.value,
-                    "data": event.to_sse_data(),
-                    "retry": 5000,  # Retry in 5 seconds on disconnect
-                }
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=SSE_PING_INTERVAL)
+                except asyncio.TimeoutError:
+                    # Keep idle connections alive through proxies between events
+                    yield {"event": "ping", "data": ""}
+                    continue
+
+                if event is not None and SSE_WRITE_DELAY > 0:
+                    # Trade a little latency for fewer, larger socket writes
+                    await asyncio.sleep(SSE_WRITE_DELAY)
+
+                # Coalesce everything already buffered into a single write
+                frames = []
+                append = frames.append
+                while event is not None:
+                    append(encode(event))
+                    if len(frames) >= SSE_MAX_BATCH or queue.empty():
+                        break
+                    event = get_nowait()
+
+                if frames:
+                    yield b"".join(frames)
+
+                if event is None:
+                    break
 
         except asyncio.CancelledError:
             logger.info("sse_stream_cancelled", run_id=run_id)
-        except Exception as e:
-            logger.error("sse_stream_error", run_id=run_id, error=str(e))
-
-    return EventSourceResponse(event_generator())
+        finally:
+            reader.cancel()
+            disconnect_task.cancel()
+
+    return EventSourceResponse(
+        event_generator(),
+        ping=SSE_PING_INTERVAL,
+        headers=SSE_HEADERS,
+    )
 
 
 @app.get("/api/ic/runs/{run_id}/artifacts")
-async def get_artifacts(run_id: str):
+async def get_artifacts(run_id: str, request: Request):
     """Get artifact index for a run."""
-    artifact_store = await get_artifact_store()
-    artifacts = await artifact_store.list_artifacts(run_id)
+    key = ("artifacts", run_id, None, None)
+    entry = _response_cache.get(key)
 
-    return {
-        "run_id": run_id,
-        "artifacts": artifacts,
-    }
+    if entry is None:
+        artifact_store = app.state.artifact_store or await get_artifact_store()
+        artifacts = await artifact_store.list_artifacts(run_id)
+
+        entry = _cache_entry({
+            "run_id": run_id,
+            "artifacts": artifacts,
+        })
+        _response_cache[key] = entry
+
+    return _conditional_response(request, entry)
 
 
 @app.get("/api/ic/runs/{run_id}/artifacts/{artifact_type}")
-async def get_artifact(run_id: str, artifact_type: str, version: Optional[int] = None):
+async def get_artifact(run_id: str, artifact_type: str, request: Request, version: Optional[int] = None):
     """Get a specific artifact."""
-    artifact_store = await get_artifact_store()
-    artifact = await artifact_store.load(run_id, artifact_type, version)
+    key = ("artifact", run_id, artifact_type, version)
+    entry = _response_cache.get(key)
 
-    if not artifact:
-        raise HTTPException(status_code=404, detail="Artifact not found")
+    if entry is None:
+        artifact_store = app.state.artifact_store or await get_artifact_store()
+        artifact = await artifact_store.load(run_id, artifact_type, version)
 
-    return artifact
+        if not artifact:
+            raise HTTPException(status_code=404, detail="Artifact not found")
+
+        # A pinned version never changes; "latest" can move while the run is active
+        entry = _cache_entry(artifact, IMMUTABLE_CACHE_CONTROL if version is not None else "no-cache")
+        _response_cache[key] = entry
+
+    return _conditional_response(request, entry)
 
 
 @app.get("/api/ic/runs/{run_id}/audit")
-async def get_audit_log(run_id: str):
+async def get_audit_log(run_id: str, request: Request):
     """Get audit bundle for a run."""
-    artifact_store = await get_artifact_store()
-    bundle = await artifact_store.get_audit_bundle(run_id)
+    key = ("audit", run_id, None, None)
+    entry = _response_cache.get(key)
+
+    if entry is None:
+        artifact_store = app.state.artifact_store or await get_artifact_store()
+        bundle = await artifact_store.get_audit_bundle(run_id)
 
-    return bundle
+        entry = _cache_entry(bundle)
+        _response_cache[key] = entry
+
+    return _conditional_response(request, entry)
 
 
 @app.get("/api/ic/runs")
@@ -280,25 +597,19 @@ async def list_runs(
     offset: int = 0,
 ):
     """List IC runs with optional filters."""
-    run_store = await get_run_store()
+    run_store = app.state.run_store or await get_run_store()
 
     status_enum = RunStatus(status) if status else None
     runs = await run_store.list_runs(status_enum, mandate_id, limit, offset)
 
-    return {
-        "runs": [RunSummary(
-            run_id=r.run_id,
-            status=r.status.value,
-            mandate_id=r.mandate_id,
-            created_at=r.created_at,
-            progress_pct=r.progress_pct,
-            current_stage=r.current_stage,
-            selected_candidate=r.selected_candidate,
-        ).model_dump() for r in runs],
+    return ORJSONResponse({
+        # Rows serialized straight from RunMetadata in the RunSummary shape by the
+        # precompiled adapter - no per-row model or dict construction
+        "runs": orjson.Fragment(_RUN_LIST_ADAPTER.dump_json(runs, include=_RUN_SUMMARY_INCLUDE)),
         "count": len(runs),
         "limit": limit,
         "offset": offset,
-    }
+    })
 
 
 # ============================================================================
@@ -345,7 +656,7 @@ async def start_orchestrator_run(
         run_id = f"{workflow_type[:3]}-{uuid.uuid4().hex[:8]}"
 
         # Store run metadata
-        run_store = await get_run_store()
+        run_store = app.state.run_store or await get_run_store()
         await run_store.create_run(
             mandate_id=f"policy:{ips.policy_id}",
             seed=42,
@@ -356,13 +667,22 @@ async def start_orchestrator_run(
             },
         )
 
-        # Start orchestrator in background with selected workflow type
-        background_tasks.add_task(
-            execute_orchestrator_workflow,
-            run_id,
-            ips,
-            workflow_type,
-        )
+        # Start orchestrator with selected workflow type (worker pool or in-process)
+        if JOB_QUEUE_ENABLED:
+            await enqueue_job(
+                "run_orchestrator_workflow",
+                run_id,
+                ips.model_dump(mode="json"),
+                workflow_type,
+                job_id=run_id,
+            )
+        else:
+            background_tasks.add_task(
+                execute_orchestrator_workflow,
+                run_id,
+                ips,
+                workflow_type,
+            )
 
         logger.info(
             "orchestrator_run_started",
@@ -568,19 +888,21 @@ async def chat_with_advisor(message: dict):
 # Workflow Execution (Background Task)
 # ============================================================================
 
+@admitted
 async def execute_workflow(run_id: str):
     """
     Execute the IC workflow for a run.
-    This is called as a background task and emits events via Redis.
+    This is called as a background task or from the job worker and emits events via Redis.
     """
-    from worker.workflow import ICWorkflow
-
     logger.info("workflow_execution_started", run_id=run_id)
 
     try:
-        run_store = await get_run_store()
-        event_bus = await get_event_bus()
-        artifact_store = await get_artifact_store()
+        run_store = app.state.run_store or await get_run_store()
+        event_bus = app.state.event_bus or await get_event_bus()
+        artifact_store = app.state.artifact_store or await get_artifact_store()
+
+        if ICWorkflow is None:
+            raise RuntimeError("worker package is not installed - cannot execute IC workflow")
 
         # Update run status
         await run_store.update_run_status(run_id, RunStatus.RUNNING)
@@ -625,6 +947,7 @@ async def execute_workflow(run_id: str):
             pass
 
 
+@admitted
 async def execute_orchestrator_workflow(run_id: str, policy, workflow_type: str = "handoff"):
     """
     Execute the orchestrator-based workflow using Agent Framework patterns.
@@ -655,16 +978,14 @@ async def execute_orchestrator_workflow(run_id: str, policy, workflow_type: str
     event_bus = None
 
     try:
-        run_store = await get_run_store()
-        event_bus = await get_event_bus()
+        run_store = app.state.run_store or await get_run_store()
+        event_bus = app.state.event_bus or await get_event_bus()
 
         # Update run status
         await run_store.update_run_status(run_id, RunStatus.RUNNING)
 
-        # Create event emitter callback for real-time updates
-        async def emit_event(event_type: str, payload: dict):
-            """Emit events to Redis for SSE streaming."""
-            # Map workflow events to our event kinds
+        def to_workflow_event(event_type: str, payload: dict) -> WorkflowEvent:
+            """Map an orchestrator event onto a WorkflowEvent."""
             event_kind = EventKind.PROGRESS_UPDATE
             if "started" in event_type:
                 event_kind = EventKind.RUN_STARTED
@@ -673,7 +994,7 @@ async def execute_orchestrator_workflow(run_id: str, policy, workflow_type: str
             elif "failed" in event_type:
                 event_kind = EventKind.RUN_FAILED
 
-            await event_bus.publish(WorkflowEvent(
+            return WorkflowEvent(
                 run_id=run_id,
                 kind=event_kind,
                 message=payload.get("reasoning", payload.get("summary", str(event_type))),
@@ -682,7 +1003,18 @@ async def execute_orchestrator_workflow(run_id: str, policy, workflow_type: str
                     "workflow_type": workflow_type,
                     **payload,
                 },
-            ))
+            )
+
+        # Create event emitter callbacks for real-time updates
+        async def emit_event(event_type: str, payload: dict):
+            """Emit events to Redis for SSE streaming."""
+            await event_bus.publish(to_workflow_event(event_type, payload))
+
+        async def emit_events(events: list):
+            """Emit a batch of (event_type, payload) pairs in one Redis round trip."""
+            await event_bus.publish_many([
+                to_workflow_event(event_type, payload) for event_type, payload in events
+            ])
 
         # Emit run started with workflow type
         await event_bus.publish(WorkflowEvent(
@@ -707,6 +1039,7 @@ async def execute_orchestrator_workflow(run_id: str, policy, workflow_type: str
             run_id=run_id,
             event_emitter=emit_event,
             workflow_type=workflow_type,
+            event_batch_emitter=emit_events,
         )
 
         # Run orchestrator - uses Agent Framework workflow patterns internally
@@ -771,4 +1104,14 @@ if __name__ == "__main__":
     import uvicorn
 
     port = int(os.getenv("PORT", "5001"))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    uvicorn.run(
+        "main:app" if workers > 1 else app,
+        host="0.0.0.0",
+        port=port,
+        loop="uvloop",
+        http="httptools",
+        workers=workers,
+        timeout_keep_alive=75,
+        backlog=2048,
+    )
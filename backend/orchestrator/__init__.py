@@ -10,48 +10,65 @@ Supports multiple orchestration strategies:
 - DAG: Custom directed acyclic graph workflows
 """
 
-from backend.orchestrator.engine import (
-    OrchestratorEngine,
-    OrchestratorPlan,
-    OrchestratorTask,
-    OrchestratorDecision,
-    PortfolioAllocation,
-    TaskType,
-    TaskStatus,
-)
-from backend.orchestrator.middleware import (
-    wrap_agent_with_events,
-    AgentEventEmitter,
-    EvidenceCollector,
-    EvidenceContextProvider,
-    WorkflowStateContextProvider,
-)
-from backend.orchestrator.workflows import (
-    WorkflowType,
-    create_workflow,
-    create_sequential_workflow,
-    create_concurrent_risk_return_workflow,
-    create_handoff_workflow,
-    create_magentic_workflow,
-    create_dag_portfolio_workflow,
-    create_group_chat_workflow,
-)
-from backend.orchestrator.executors import (
-    WorkflowState,
-    PolicyParserExecutor,
-    RiskReturnAggregatorExecutor,
-    PortfolioFinalizerExecutor,
-    ComplianceGateExecutor,
-)
-from backend.orchestrator.agent_registry import (
-    AgentDefinition,
-    AgentCondition,
-    AgentSelectionResult,
-    select_agents_for_policy,
-    get_agent_registry,
-    get_agent_by_id,
-)
-from backend.orchestrator.trace_emitter import TraceEmitter
+import importlib
+
+# Exported name -> submodule defining it. Submodules are imported on first
+# attribute access, so importing a light module (checkpoints, trace_emitter,
+# agent_registry) doesn't pull in the workflow and agent stack.
+_EXPORTS = {
+    **dict.fromkeys((
+        "OrchestratorEngine",
+        "OrchestratorPlan",
+        "OrchestratorTask",
+        "OrchestratorDecision",
+        "PortfolioAllocation",
+        "TaskType",
+        "TaskStatus",
+    ), "engine"),
+    **dict.fromkeys((
+        "wrap_agent_with_events",
+        "AgentEventEmitter",
+        "EvidenceCollector",
+        "EvidenceContextProvider",
+        "WorkflowStateContextProvider",
+    ), "middleware"),
+    **dict.fromkeys((
+        "WorkflowType",
+        "create_workflow",
+        "create_sequential_workflow",
+        "create_concurrent_risk_return_workflow",
+        "create_handoff_workflow",
+        "create_magentic_workflow",
+        "create_dag_portfolio_workflow",
+        "create_group_chat_workflow",
+    ), "workflows"),
+    **dict.fromkeys((
+        "WorkflowState",
+        "PolicyParserExecutor",
+        "RiskReturnAggregatorExecutor",
+        "ParallelAgentsExecutor",
+        "PortfolioFinalizerExecutor",
+        "ComplianceGateExecutor",
+    ), "executors"),
+    **dict.fromkeys((
+        "AgentDefinition",
+        "AgentCondition",
+        "AgentSelectionResult",
+        "select_agents_for_policy",
+        "get_agent_registry",
+        "get_agent_by_id",
+    ), "agent_registry"),
+    "TraceEmitter": "trace_emitter",
+}
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     # Engine
@@ -81,6 +98,7 @@ __all__ = [
     "WorkflowState",
     "PolicyParserExecutor",
     "RiskReturnAggregatorExecutor",
+    "ParallelAgentsExecutor",
     "PortfolioFinalizerExecutor",
     "ComplianceGateExecutor",
     # Agent Registry
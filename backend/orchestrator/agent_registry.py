@@ -5,8 +5,10 @@ Defines all available agents with their inclusion/exclusion conditions
 based on the Investor Policy Statement.
 """
 
-from typing import Any, Callable, Dict, List, Optional
-from pydantic import BaseModel
+import operator
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+from pydantic import BaseModel, ConfigDict, PrivateAttr, ValidationInfo, field_validator
 from backend.schemas.policy import InvestorPolicyStatement
 
 
@@ -17,6 +19,25 @@ class AgentCondition(BaseModel):
     value: Any
     reason: str  # Human-readable reason
 
+    # conditions_evaluated labels, formatted once per condition
+    _include_label: str = PrivateAttr(default="")
+    _exclude_label: str = PrivateAttr(default="")
+
+    def model_post_init(self, __context: Any) -> None:
+        self._include_label = f"include:{self.field}"
+        self._exclude_label = f"exclude:{self.field}"
+
+    @field_validator("value")
+    @classmethod
+    def _membership_values_to_frozenset(cls, value: Any, info: ValidationInfo) -> Any:
+        """Store in/not_in value lists as frozensets for O(1) membership checks."""
+        if info.data.get("operator") in ("in", "not_in") and isinstance(value, (list, tuple, set)):
+            try:
+                return frozenset(value)
+            except TypeError:  # unhashable members - keep the list
+                return value
+        return value
+
 
 class AgentDefinition(BaseModel):
     """Definition of an agent in the registry."""
@@ -263,6 +284,13 @@ AGENT_REGISTRY: List[AgentDefinition] = [
 ]
 
 
+# Kept in execution order so selection results come out already sorted
+AGENT_REGISTRY.sort(key=operator.attrgetter("priority"))
+
+# Agent lookup by ID
+_AGENT_BY_ID: Dict[str, AgentDefinition] = {agent.id: agent for agent in AGENT_REGISTRY}
+
+
 def get_agent_registry() -> List[AgentDefinition]:
     """Get the full agent registry."""
     return AGENT_REGISTRY
@@ -270,15 +298,18 @@ def get_agent_registry() -> List[AgentDefinition]:
 
 def get_agent_by_id(agent_id: str) -> Optional[AgentDefinition]:
     """Get an agent definition by ID."""
-    for agent in AGENT_REGISTRY:
-        if agent.id == agent_id:
-            return agent
-    return None
+    return _AGENT_BY_ID.get(agent_id)
+
+
+# Dot paths split once on first use
+_PATH_CACHE: Dict[str, tuple] = {}
 
 
 def _get_nested_value(obj: Any, path: str) -> Any:
     """Get a nested value from an object using dot notation."""
-    parts = path.split(".")
+    parts = _PATH_CACHE.get(path)
+    if parts is None:
+        parts = _PATH_CACHE[path] = tuple(path.split("."))
     current = obj
 
     for part in parts:
@@ -292,38 +323,122 @@ def _get_nested_value(obj: Any, path: str) -> Any:
     return current
 
 
-def _evaluate_condition(policy: InvestorPolicyStatement, condition: AgentCondition) -> bool:
-    """Evaluate a single condition against the policy."""
-    value = _get_nested_value(policy, condition.field)
-
-    if condition.operator == "eq":
-        return value == condition.value
-    elif condition.operator == "ne":
-        return value != condition.value
-    elif condition.operator == "gt":
-        return value is not None and value > condition.value
-    elif condition.operator == "lt":
-        return value is not None and value < condition.value
-    elif condition.operator == "gte":
-        return value is not None and value >= condition.value
-    elif condition.operator == "lte":
-        return value is not None and value <= condition.value
-    elif condition.operator == "in":
-        return value in condition.value
-    elif condition.operator == "not_in":
-        return value not in condition.value
-    elif condition.operator == "contains":
-        return condition.value in (value or [])
-    elif condition.operator == "not_empty":
-        return value is not None and len(value) > 0
-    elif condition.operator == "empty":
-        return value is None or len(value) == 0
-
-    return False
+def _is_in(value: Any, expected: Any) -> bool:
+    """Membership test that treats unhashable values as absent from a frozenset."""
+    try:
+        return value in expected
+    except TypeError:
+        return False
+
+
+# Operator implementations: (policy_value, condition_value) -> bool
+_OP_TABLE: Dict[str, Callable[[Any, Any], bool]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": lambda value, expected: value is not None and value > expected,
+    "lt": lambda value, expected: value is not None and value < expected,
+    "gte": lambda value, expected: value is not None and value >= expected,
+    "lte": lambda value, expected: value is not None and value <= expected,
+    "in": _is_in,
+    "not_in": lambda value, expected: not _is_in(value, expected),
+    "contains": lambda value, expected: expected in (value or []),
+    "not_empty": lambda value, expected: value is not None and len(value) > 0,
+    "empty": lambda value, expected: value is None or len(value) == 0,
+}
+
+
+def _compile_condition(condition: AgentCondition) -> Callable[[Any], bool]:
+    """Bind a condition's operator and value into a predicate over the field value."""
+    op = _OP_TABLE.get(condition.operator)
+    if op is None:
+        return lambda value: False
+    expected = condition.value
+    return lambda value: op(value, expected)
+
+
+# Predicates for registry conditions, keyed by id(condition)
+_COMPILED_CONDITIONS: Dict[int, Callable[[Any], bool]] = {
+    id(condition): _compile_condition(condition)
+    for agent in AGENT_REGISTRY
+    for condition in (*agent.include_conditions, *agent.exclude_conditions)
+}
+
+
+class _CompiledRule(NamedTuple):
+    """A registry condition's predicate, indexed under the field it reads."""
+    condition_id: int
+    predicate: Callable[[Any], bool]
+
+
+def _build_field_index() -> Dict[str, List[_CompiledRule]]:
+    """Group registry conditions by the policy field they read."""
+    index: Dict[str, List[_CompiledRule]] = {}
+    for agent in AGENT_REGISTRY:
+        for condition in (*agent.include_conditions, *agent.exclude_conditions):
+            index.setdefault(condition.field, []).append(
+                _CompiledRule(id(condition), _COMPILED_CONDITIONS[id(condition)])
+            )
+    return index
+
+
+# Policy field path -> every registry condition that reads it
+_FIELD_INDEX: Dict[str, List[_CompiledRule]] = _build_field_index()
+# Fixed condition order for selection cache keys
+_CONDITION_IDS: tuple = tuple(rule.condition_id for rules in _FIELD_INDEX.values() for rule in rules)
+
+
+def _make_field_getter(path: str) -> Callable[[Any], Any]:
+    """
+    Build a C-level attrgetter for a dot path.
+
+    Falls back to _get_nested_value (dict traversal, None when missing) if
+    the attribute walk fails. Root types that failed once go straight to the
+    fallback, so paths absent from the policy model don't raise on every call.
+    """
+    getter = operator.attrgetter(path)
+    fallback_types: set = set()
+
+    def get(obj: Any) -> Any:
+        if type(obj) not in fallback_types:
+            try:
+                return getter(obj)
+            except AttributeError:
+                fallback_types.add(type(obj))
+        return _get_nested_value(obj, path)
+
+    return get
+
+
+# (field getter, conditions on that field) for each referenced policy field
+_FIELD_READERS: List[tuple] = [
+    (_make_field_getter(path), rules) for path, rules in _FIELD_INDEX.items()
+]
+
+
+def _evaluate_registry_conditions(policy: InvestorPolicyStatement) -> Dict[int, bool]:
+    """
+    Evaluate every registry condition against the policy.
+
+    Each referenced field is read once and all predicates on it run against
+    that value. Returns outcomes keyed by id(condition).
+    """
+    outcomes: Dict[int, bool] = {}
+    for get_value, rules in _FIELD_READERS:
+        value = get_value(policy)
+        for condition_id, predicate in rules:
+            outcomes[condition_id] = predicate(value)
+    return outcomes
 
 
 class AgentSelectionResult(BaseModel):
-    """Result of agent selection process."""
+    """
+    Result of agent selection process.
+
+    Frozen, since results are cached and shared between selections. Built with
+    model_construct() from registry data, which needs no validation.
+    """
+    model_config = ConfigDict(frozen=True)
+
     agent_id: str
     agent_name: str
     short_name: str
@@ -334,50 +449,93 @@ class AgentSelectionResult(BaseModel):
     priority: int
 
 
+# Agents with no conditions always resolve to their default - their results
+# are built once (keyed by agent ID) and reused instead of evaluated.
+_UNCONDITIONAL: List[AgentDefinition] = [
+    agent for agent in AGENT_REGISTRY
+    if not agent.include_conditions and not agent.exclude_conditions
+]
+_UNCONDITIONAL_RESULTS: Dict[str, AgentSelectionResult] = {
+    agent.id: AgentSelectionResult(
+        agent_id=agent.id,
+        agent_name=agent.name,
+        short_name=agent.short_name,
+        category=agent.category,
+        included=agent.default_include,
+        reason="Default inclusion" if agent.default_include else "Default exclusion",
+        conditions_evaluated=[],
+        priority=agent.priority,
+    )
+    for agent in _UNCONDITIONAL
+}
+
+
 def select_agents_for_policy(
     policy: InvestorPolicyStatement
 ) -> tuple[List[AgentSelectionResult], List[AgentSelectionResult]]:
     """
     Select which agents to include/exclude based on the policy.
 
+    Selection depends only on the outcome of each registry condition, so
+    results are memoized on those outcomes. Returned results are shared
+    between calls and should be treated as read-only.
+
     Returns:
         Tuple of (included_agents, excluded_agents) with reasons
     """
+    # Outcome of every registry condition, each policy field read once
+    met = _evaluate_registry_conditions(policy)
+    included, excluded = _select_for_outcomes(tuple(met[cid] for cid in _CONDITION_IDS))
+    return list(included), list(excluded)
+
+
+@lru_cache(maxsize=256)
+def _select_for_outcomes(
+    outcomes: tuple,
+) -> tuple[tuple[AgentSelectionResult, ...], tuple[AgentSelectionResult, ...]]:
+    """Build the selection for one combination of condition outcomes (ordered as _CONDITION_IDS)."""
+    met = dict(zip(_CONDITION_IDS, outcomes))
     included = []
     excluded = []
 
+    # AGENT_REGISTRY is sorted by priority, so included comes out in execution order
     for agent in AGENT_REGISTRY:
+        template = _UNCONDITIONAL_RESULTS.get(agent.id)
+        if template is not None:
+            if template.included:
+                included.append(template)
+            else:
+                excluded.append(template)
+            continue
+
         conditions_evaluated = []
         should_include = agent.default_include
         reason = "Default inclusion" if should_include else "Default exclusion"
 
         # Check exclusion conditions first (any true = exclude)
         for condition in agent.exclude_conditions:
-            conditions_evaluated.append(f"exclude:{condition.field}")
-            if _evaluate_condition(policy, condition):
+            conditions_evaluated.append(condition._exclude_label)
+            if met[id(condition)]:
                 should_include = False
                 reason = condition.reason
                 break
 
-        # If not excluded, check inclusion conditions (all must be true)
+        # If not excluded, check inclusion conditions in a single pass
         if should_include or agent.include_conditions:
-            inclusion_met = True
+            any_met = False
             for condition in agent.include_conditions:
-                conditions_evaluated.append(f"include:{condition.field}")
-                if _evaluate_condition(policy, condition):
+                conditions_evaluated.append(condition._include_label)
+                if met[id(condition)]:
+                    any_met = True
                     should_include = True
                     reason = condition.reason
-                else:
-                    inclusion_met = False
 
             # For conditional agents, only include if at least one condition is met
-            if agent.include_conditions and not any(
-                _evaluate_condition(policy, c) for c in agent.include_conditions
-            ):
+            if agent.include_conditions and not any_met:
                 should_include = False
                 reason = f"No inclusion conditions met for {agent.name}"
 
-        result = AgentSelectionResult(
+        result = AgentSelectionResult.model_construct(
             agent_id=agent.id,
             agent_name=agent.name,
             short_name=agent.short_name,
@@ -393,7 +551,4 @@ def select_agents_for_policy(
         else:
             excluded.append(result)
 
-    # Sort included by priority
-    included.sort(key=lambda x: x.priority)
-
-    return included, excluded
+    return tuple(included), tuple(excluded)
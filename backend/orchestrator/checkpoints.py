@@ -0,0 +1,274 @@
+"""
+Checkpoint storage for the orchestrator engine.
+
+Checkpoints are written in two phases: the serialized snapshot is first
+copied into a shared-memory ring (fast, immediately visible to recovery),
+then a background task persists it to a durable backend
+(FileCheckpointStorage). The workflow never waits for durable storage.
+
+Storages deal in opaque payload bytes; the engine encodes and decodes
+them with backend.orchestrator.serde.
+
+Checkpoint files are local to the pod: resume-on-retry works when a run is
+retried by a process that can see the same CHECKPOINT_DIR (in k8s, an
+emptyDir that survives container restarts but not pod rescheduling). A
+run's files are deleted once it completes, and files from runs that never
+complete are pruned after CHECKPOINT_TTL_HOURS.
+"""
+
+import asyncio
+import glob
+import os
+import struct
+import time
+import zlib
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, Dict, Optional, Set
+
+import structlog
+
+logger = structlog.get_logger()
+
+# Number of ring slots (the last N checkpoints stay in memory)
+CHECKPOINT_SLOTS = int(os.getenv("CHECKPOINT_SLOTS", "3"))
+# Bytes per slot, header included
+CHECKPOINT_SLOT_BYTES = int(os.getenv("CHECKPOINT_SLOT_BYTES", str(256 * 1024)))
+# Directory for durable checkpoint files (survive process restarts)
+CHECKPOINT_DIR = os.path.abspath(os.getenv("CHECKPOINT_DIR", "/tmp/ic-checkpoints"))
+# Checkpoint files older than this are pruned (runs that failed and were never retried)
+CHECKPOINT_TTL_HOURS = float(os.getenv("CHECKPOINT_TTL_HOURS", "24"))
+
+# Slot header: version (u64), body length (u32), body crc32 (u32), checkpoint ID length (u16).
+# The body is the UTF-8 checkpoint ID followed by the payload.
+_HEADER = struct.Struct("<QIIH")
+_EMPTY_HEADER = _HEADER.pack(0, 0, 0, 0)
+
+
+class FileCheckpointStorage:
+    """
+    Durable checkpoint storage with one file per checkpoint.
+
+    Writes go to a temp file that is then renamed over the target, so a
+    reader never sees a partial checkpoint and a crash mid-write leaves the
+    previous version intact. File I/O runs in a worker thread, and writes to
+    the same checkpoint are serialized in call order. An in-memory
+    index maps checkpoint IDs to paths for checkpoints written by this
+    process; other IDs resolve to their deterministic path.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._index: Dict[str, Path] = {}
+        # Per-checkpoint locks keep writes to the same ID ordered
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    def _path(self, checkpoint_id: str) -> Path:
+        return self.directory / f"{checkpoint_id.replace(os.sep, '_')}.ckpt"
+
+    async def save(self, checkpoint_id: str, payload: bytes):
+        """Atomically write a checkpoint to disk."""
+        path = self._path(checkpoint_id)
+        lock = self._locks.setdefault(checkpoint_id, asyncio.Lock())
+        async with lock:
+            await asyncio.to_thread(self._write_atomic, path.with_suffix(".tmp"), path, payload)
+        self._index[checkpoint_id] = path
+
+    async def load(self, checkpoint_id: str) -> Optional[bytes]:
+        """Read a checkpoint from disk, or None if it was never written."""
+        path = self._index.get(checkpoint_id) or self._path(checkpoint_id)
+        try:
+            return await asyncio.to_thread(path.read_bytes)
+        except FileNotFoundError:
+            return None
+
+    async def delete_run(self, run_id: str) -> int:
+        """Delete every checkpoint written for a run, returning the number of files removed."""
+        prefix = f"{run_id}:"
+        for checkpoint_id in [c for c in self._locks if c.startswith(prefix)]:
+            del self._locks[checkpoint_id]
+            self._index.pop(checkpoint_id, None)
+
+        pattern = glob.escape(prefix.replace(os.sep, "_")) + "*.ckpt"
+        return await asyncio.to_thread(self._unlink_matching, (pattern,), None)
+
+    async def prune(self, max_age: float) -> int:
+        """Delete checkpoint (and leftover temp) files not modified within max_age seconds."""
+        cutoff = time.time() - max_age
+        return await asyncio.to_thread(self._unlink_matching, ("*.ckpt", "*.tmp"), cutoff)
+
+    def _unlink_matching(self, patterns, cutoff: Optional[float]) -> int:
+        removed = 0
+        for pattern in patterns:
+            for path in self.directory.glob(pattern):
+                try:
+                    if cutoff is None or path.stat().st_mtime < cutoff:
+                        path.unlink()
+                        removed += 1
+                except FileNotFoundError:
+                    pass
+        return removed
+
+    @staticmethod
+    def _write_atomic(tmp: Path, path: Path, payload: bytes):
+        with open(tmp, "wb") as f:
+            f.write(payload)
+        os.replace(tmp, path)
+
+
+class SharedMemCheckpointStorage:
+    """
+    Checkpoint storage backed by a shared-memory ring buffer.
+
+    Each save takes the next version from a monotonically increasing
+    counter and writes into slot `version % slots`. The slot header is
+    cleared before the payload is copied and only rewritten once the copy
+    is complete, so a slot caught mid-write (or corrupted) fails its length
+    or CRC check and is skipped on load.
+
+    Snapshots are handed to `durable` (any object with async save/load) in
+    the background; load falls back to it for checkpoints that have
+    already rotated out of the ring or were too large for a slot.
+    """
+
+    def __init__(
+        self,
+        slots: int = CHECKPOINT_SLOTS,
+        slot_size: int = CHECKPOINT_SLOT_BYTES,
+        durable: Optional[Any] = None,
+        name: Optional[str] = None,
+    ):
+        if slots < 1:
+            raise ValueError("slots must be >= 1")
+        if slot_size <= _HEADER.size:
+            raise ValueError(f"slot_size must be > {_HEADER.size}")
+
+        self.slots = slots
+        self.slot_size = slot_size
+        self.durable = durable
+        self._shm = shared_memory.SharedMemory(name=name, create=True, size=slots * slot_size)
+        self._buf = self._shm.buf
+        self._version = 0
+        self._flush_tasks: Set[asyncio.Task] = set()
+
+    @property
+    def name(self) -> str:
+        """Shared-memory segment name (for attaching from a recovery process)."""
+        return self._shm.name
+
+    async def save(self, checkpoint_id: str, payload: bytes):
+        """Stage a checkpoint in shared memory and schedule its durable write."""
+        key = checkpoint_id.encode()
+        size = len(key) + len(payload)
+
+        if size > self.slot_size - _HEADER.size:
+            logger.warning(
+                "checkpoint_exceeds_slot",
+                checkpoint_id=checkpoint_id,
+                size=size,
+                slot_size=self.slot_size,
+            )
+            # Older ring copies would otherwise shadow the durable write on load
+            self._drop_slots(key)
+        else:
+            self._write_slot(key, payload)
+
+        if self.durable is not None:
+            task = asyncio.create_task(self._persist(checkpoint_id, payload))
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+
+    async def load(self, checkpoint_id: str) -> Optional[bytes]:
+        """Load the newest intact copy of a checkpoint, falling back to durable storage."""
+        key = checkpoint_id.encode()
+        best_version = 0
+        best = None
+
+        for version, slot_key, payload in self._scan_slots():
+            if slot_key == key and version > best_version:
+                best_version = version
+                best = payload
+
+        if best is not None:
+            return best
+        if self.durable is not None:
+            return await self.durable.load(checkpoint_id)
+        return None
+
+    async def flush(self):
+        """Wait for pending durable writes."""
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+
+    async def delete_run(self, run_id: str):
+        """Delete a run's durable checkpoints once its pending writes have landed."""
+        await self.flush()
+        if self.durable is not None:
+            await self.durable.delete_run(run_id)
+
+    async def prune(self, max_age: float):
+        """Prune stale checkpoints from durable storage."""
+        if self.durable is not None:
+            await self.durable.prune(max_age)
+
+    async def close(self):
+        """Flush pending writes and release the shared-memory segment."""
+        await self.flush()
+        self._buf = None
+        self._shm.close()
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _write_slot(self, key: bytes, payload: bytes):
+        self._version += 1
+        offset = (self._version % self.slots) * self.slot_size
+        start = offset + _HEADER.size
+        split = start + len(key)
+        end = split + len(payload)
+        buf = self._buf
+
+        buf[offset:start] = _EMPTY_HEADER
+        buf[start:split] = key
+        buf[split:end] = payload
+        crc = zlib.crc32(payload, zlib.crc32(key))
+        buf[offset:start] = _HEADER.pack(self._version, end - start, crc, len(key))
+
+    def _drop_slots(self, key: bytes):
+        """Clear the header of every slot holding a copy of the checkpoint."""
+        buf = self._buf
+        for slot in range(self.slots):
+            offset = slot * self.slot_size
+            start = offset + _HEADER.size
+            version, _, _, key_len = _HEADER.unpack_from(buf, offset)
+            if version and key_len == len(key) and buf[start:start + key_len] == key:
+                buf[offset:start] = _EMPTY_HEADER
+
+    def _scan_slots(self):
+        """Yield (version, checkpoint ID bytes, payload) for every slot holding a complete checkpoint."""
+        buf = self._buf
+        for slot in range(self.slots):
+            offset = slot * self.slot_size
+            start = offset + _HEADER.size
+            version, length, crc, key_len = _HEADER.unpack_from(buf, offset)
+            if version == 0 or key_len > length or length > self.slot_size - _HEADER.size:
+                continue
+
+            body = bytes(buf[start:start + length])
+            if zlib.crc32(body) != crc:
+                logger.warning("checkpoint_slot_corrupt", slot=slot, version=version)
+                continue
+
+            yield version, body[:key_len], body[key_len:]
+
+    async def _persist(self, checkpoint_id: str, payload: bytes):
+        try:
+            await self.durable.save(checkpoint_id, payload)
+        except Exception as e:
+            logger.warning(
+                "checkpoint_persist_failed",
+                checkpoint_id=checkpoint_id,
+                error=str(e),
+            )
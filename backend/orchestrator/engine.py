@@ -12,12 +12,15 @@ Supports multiple orchestration strategies:
 
 import asyncio
 import os
-import uuid
+import string
+import time
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, AsyncIterator, Callable, Dict, List, Optional
-
-from openai import AsyncAzureOpenAI
+from itertools import chain, islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple
 
 from agent_framework import (
     ChatAgent,
@@ -31,9 +34,8 @@ from agent_framework import (
     ExecutorCompletedEvent,
     AgentRunEvent,
     AgentRunUpdateEvent,
-    InMemoryCheckpointStorage,
 )
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 import structlog
 
 from backend.schemas.policy import InvestorPolicyStatement
@@ -49,10 +51,219 @@ from backend.orchestrator.workflows import (
 )
 from backend.orchestrator.middleware import EvidenceCollector
 from backend.orchestrator.agent_registry import select_agents_for_policy, AgentSelectionResult
-from backend.orchestrator.trace_emitter import TraceEmitter
+from backend.orchestrator.trace_emitter import TraceEmitter, short_id, utc_iso_from_ns, utc_iso_now
+from backend.orchestrator.serde import dumps_ckpt, loads_ckpt
+from backend.orchestrator.checkpoints import (
+    CHECKPOINT_DIR,
+    CHECKPOINT_TTL_HOURS,
+    FileCheckpointStorage,
+    SharedMemCheckpointStorage,
+)
+
+if TYPE_CHECKING:
+    from openai import AsyncAzureOpenAI
 
 logger = structlog.get_logger()
 
+# How long the checkpoint writer waits for more snapshots before writing, so
+# bursts (e.g. repeated runs of the same agent) collapse into one write
+CHECKPOINT_COALESCE = int(os.getenv("CHECKPOINT_COALESCE_MS", "50")) / 1000
+# Per-event info logs (executor/agent lifecycle) are written for 1 in N workflow events
+TRACE_LOG_SAMPLE = max(1, int(os.getenv("TRACE_LOG_SAMPLE", "16")))
+# Workflow events handled between forced yields to the event loop
+STREAM_YIELD_EVERY = int(os.getenv("STREAM_YIELD_EVERY", "16"))
+# Most recent agent responses kept while a workflow runs (evidence goes to the plan)
+AGENT_RESPONSE_WINDOW = 64
+
+# Decisions indexed per type (the earliest N of each), for explanation context
+DECISION_INDEX_DEPTH = 8
+_KEY_DECISION_TYPES = ("include_agent", "select_candidate", "commit")
+
+# Keep-alive connections held by the shared explanation client
+AOAI_MAX_KEEPALIVE = int(os.getenv("AOAI_MAX_KEEPALIVE_CONNECTIONS", "20"))
+
+# Tickers counted toward equity exposure by the compliance gate
+_EQUITY_TICKERS = frozenset({"VTI", "VXUS", "QQQ"})
+
+# Portfolio explanation prompt, parsed once at import
+_EXPLANATION_TEMPLATE = string.Template("""Summarize this portfolio recommendation in 2-3 sentences for an investor.
+$context_section
+Portfolio allocation (top 5 holdings):
+$top_holdings
+
+Key metrics:
+- Expected return: $expected_return%
+- Volatility: $volatility%
+- Sharpe ratio: $sharpe
+
+Investor profile:
+- Risk tolerance: $risk_tolerance
+- Time horizon: $time_horizon
+- Themes: $themes
+- ESG focus: $esg_focus
+
+Explain how this portfolio addresses the investor's specific goals and themes. Reference their original investment thesis if provided. Be concise and professional.""")
+
+# Optional block quoting the investor's own words
+_EXPLANATION_CONTEXT_TEMPLATE = string.Template("""
+The investor originally stated:
+"$user_context"
+
+""")
+
+# Constant gate details, shared by every gate event. Treat as read-only: they are
+# plain dicts/tuples (not MappingProxyType) because event payloads must stay
+# JSON-serializable by pydantic.
+_DEFAULT_STRESS_SCENARIOS = (
+    {"name": "Market Crash -20%", "impact": -0.15, "passed": True},
+    {"name": "Rate Spike +200bp", "impact": -0.08, "passed": True},
+    {"name": "Inflation Surge", "impact": -0.05, "passed": True},
+)
+_STRESS_GATE_DETAILS = {"breaches": 0, "scenarios": _DEFAULT_STRESS_SCENARIOS}
+_LIQUIDITY_GATE_DETAILS = {"turnover": 0.15, "threshold": 0.25, "slippage": 0.001}
+
+# Fallback (allocations, metrics) by risk tolerance, used when the workflow
+# output carries no allocation. Read-only.
+_FALLBACK_PORTFOLIOS = {
+    "conservative": (
+        {"VTI": 0.25, "VXUS": 0.10, "BND": 0.40, "BNDX": 0.15, "VNQ": 0.05, "CASH": 0.05},
+        {"expected_return": 5.5, "volatility": 8.0, "sharpe": 0.44},
+    ),
+    "aggressive": (
+        {"VTI": 0.45, "VXUS": 0.20, "QQQ": 0.15, "BND": 0.10, "VNQ": 0.07, "CASH": 0.03},
+        {"expected_return": 9.5, "volatility": 16.0, "sharpe": 0.47},
+    ),
+    "moderate": (
+        {"VTI": 0.35, "VXUS": 0.15, "BND": 0.30, "BNDX": 0.10, "VNQ": 0.05, "CASH": 0.05},
+        {"expected_return": 7.2, "volatility": 11.5, "sharpe": 0.45},
+    ),
+}
+
+_UTC = timezone.utc
+
+# Class names of the framework events, resolved once for the event_class field
+_EVENT_CLASS_NAMES: Dict[type, str] = {
+    cls: cls.__name__
+    for cls in (
+        WorkflowStartedEvent,
+        WorkflowStatusEvent,
+        WorkflowOutputEvent,
+        WorkflowFailedEvent,
+        ExecutorInvokedEvent,
+        ExecutorCompletedEvent,
+        AgentRunEvent,
+        AgentRunUpdateEvent,
+    )
+}
+
+# Actor block shared by every orchestrator event
+_ORCHESTRATOR_ACTOR = {
+    "kind": "orchestrator",
+    "id": "orchestrator",
+    "name": "Orchestrator",
+}
+
+
+def _fast_utcnow() -> datetime:
+    """Current UTC time."""
+    return datetime.now(_UTC)
+
+
+def _make_evidence(agent_name: str, message_count: int, timestamp: str) -> Dict[str, Any]:
+    """Build the evidence record for a completed agent run."""
+    return {
+        "evidence_id": short_id("ev"),
+        "type": "agent_response",
+        "agent": agent_name,
+        "timestamp": timestamp,
+        "message_count": message_count,
+    }
+
+
+# Workflow input message, parsed once at import. Values are pre-formatted
+# strings supplied by OrchestratorEngine._build_workflow_input.
+_WORKFLOW_INPUT_TEMPLATE = string.Template("""## Portfolio Optimization Task
+
+### Investor Policy Statement
+- Policy ID: $policy_id
+- Investor Type: $investor_type
+- Portfolio Value: $$$portfolio_value
+- Risk Tolerance: $risk_tolerance
+- Time Horizon: $time_horizon
+
+### Risk Constraints
+- Max Volatility: $max_volatility%
+- Max Drawdown: $max_drawdown%
+
+### Allocation Constraints
+- Equity: $min_equity_pct% - $max_equity_pct%
+- Fixed Income: $min_fixed_income_pct% - $max_fixed_income_pct%
+- Max Single Position: $max_single_position_pct%
+
+### Preferences
+- ESG Focus: $esg_focus
+- Themes: $themes
+- Exclusions: $exclusion_count rules
+
+### Benchmark
+- Primary: $benchmark
+- Target Return: $target_return%
+
+### Investment Thesis (User Context)
+$chat_context
+
+### Special Instructions
+$special_instructions
+
+### Instructions
+1. Analyze the investment policy and constraints
+2. Pay special attention to the user's investment thesis above - align fund selection with their stated goals
+3. Gather market data for the investable universe, prioritizing funds that match the user's themes
+4. Compute risk metrics and stress tests
+5. Forecast expected returns with consideration for the user's target return expectations
+6. Optimize the portfolio allocation
+7. Verify compliance with all constraints
+8. Provide the final allocation with supporting evidence that references the user's original goals
+""")
+
+
+# Shared Azure OpenAI client for portfolio explanations
+_AOAI_CLIENT: Optional["AsyncAzureOpenAI"] = None
+_AOAI_CLIENT_LOCK = asyncio.Lock()
+
+
+async def _get_aoai_client() -> "AsyncAzureOpenAI":
+    """
+    Get or create the shared Azure OpenAI client (one connection pool per process).
+
+    openai and httpx are imported on first use to keep them off the
+    API/worker import path.
+    """
+    global _AOAI_CLIENT
+    if _AOAI_CLIENT is None:
+        async with _AOAI_CLIENT_LOCK:
+            if _AOAI_CLIENT is None:
+                import httpx
+                from openai import AsyncAzureOpenAI
+
+                _AOAI_CLIENT = AsyncAzureOpenAI(
+                    azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
+                    api_key=os.getenv("AZURE_OPENAI_API_KEY"),
+                    api_version="2024-02-15-preview",
+                    http_client=httpx.AsyncClient(
+                        limits=httpx.Limits(max_keepalive_connections=AOAI_MAX_KEEPALIVE),
+                    ),
+                )
+    return _AOAI_CLIENT
+
+
+async def close_aoai_client():
+    """Close the shared Azure OpenAI client."""
+    global _AOAI_CLIENT
+    if _AOAI_CLIENT is not None:
+        await _AOAI_CLIENT.close()
+        _AOAI_CLIENT = None
+
 
 class TaskType(str, Enum):
     """Types of tasks the orchestrator can assign."""
@@ -76,9 +287,35 @@ class TaskStatus(str, Enum):
     BLOCKED = "blocked"
 
 
+# Engine-internal models: assignments are not re-validated, unknown keys are dropped
+_MODEL_CONFIG = ConfigDict(extra="ignore", validate_assignment=False)
+
+
+@dataclass(slots=True, frozen=True)
+class TraceEvent:
+    """An orchestrator event recorded in the plan trace."""
+    event_type: str
+    run_id: str
+    ts_ns: int
+    actor_id: str
+    payload: Dict[str, Any]
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Materialize the event in the same shape it was emitted."""
+        return {
+            "event_type": self.event_type,
+            "run_id": self.run_id,
+            "timestamp": utc_iso_from_ns(self.ts_ns),
+            "actor": _ORCHESTRATOR_ACTOR if self.actor_id == "orchestrator" else {"id": self.actor_id},
+            **self.payload,
+        }
+
+
 class OrchestratorTask(BaseModel):
     """A task in the orchestrator's plan."""
-    task_id: str = Field(default_factory=lambda: f"task-{uuid.uuid4().hex[:8]}")
+    model_config = _MODEL_CONFIG
+
+    task_id: str = Field(default_factory=lambda: short_id("task"))
     task_type: TaskType
     description: str
     assigned_agent: Optional[str] = None
@@ -86,15 +323,17 @@ class OrchestratorTask(BaseModel):
     dependencies: List[str] = Field(default_factory=list, description="Task IDs that must complete first")
     priority: int = Field(default=5, ge=1, le=10, description="1=highest, 10=lowest")
     result: Optional[str] = None
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_fast_utcnow)
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
 
 
 class OrchestratorDecision(BaseModel):
     """A decision made by the orchestrator."""
-    decision_id: str = Field(default_factory=lambda: f"dec-{uuid.uuid4().hex[:8]}")
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    model_config = _MODEL_CONFIG
+
+    decision_id: str = Field(default_factory=lambda: short_id("dec"))
+    timestamp: datetime = Field(default_factory=_fast_utcnow)
     decision_type: str = Field(description="delegate, resolve_conflict, checkpoint, commit, workflow_event")
     reasoning: str
     inputs_considered: List[str] = Field(default_factory=list)
@@ -106,14 +345,18 @@ class OrchestratorDecision(BaseModel):
 
 class PortfolioAllocation(BaseModel):
     """Current portfolio allocation state."""
+    model_config = _MODEL_CONFIG
+
     allocations: Dict[str, float] = Field(default_factory=dict, description="Asset -> weight")
     metrics: Dict[str, float] = Field(default_factory=dict, description="Risk/return metrics")
-    last_updated: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    last_updated: datetime = Field(default_factory=_fast_utcnow)
 
 
 class OrchestratorPlan(BaseModel):
     """The orchestrator's dynamic execution plan."""
-    plan_id: str = Field(default_factory=lambda: f"plan-{uuid.uuid4().hex[:8]}")
+    model_config = _MODEL_CONFIG
+
+    plan_id: str = Field(default_factory=lambda: short_id("plan"))
     run_id: str
     policy: InvestorPolicyStatement
     workflow_type: str = WorkflowType.SEQUENTIAL
@@ -122,8 +365,13 @@ class OrchestratorPlan(BaseModel):
     evidence: List[Dict[str, Any]] = Field(default_factory=list, description="Accumulated evidence from agents")
     portfolio: PortfolioAllocation = Field(default_factory=PortfolioAllocation)
     status: str = "planning"  # planning, running, completed, failed
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    trace_events: List[Dict[str, Any]] = Field(default_factory=list)
+    created_at: datetime = Field(default_factory=_fast_utcnow)
+    trace_events: List[TraceEvent] = Field(default_factory=list)
+
+    @field_serializer("trace_events")
+    def _serialize_trace_events(self, events: List[TraceEvent]) -> List[Dict[str, Any]]:
+        """Export trace events in the shape they were emitted."""
+        return [event.as_dict() for event in events]
 
 
 class OrchestratorEngine:
@@ -145,21 +393,53 @@ class OrchestratorEngine:
     - DAG: Custom execution graph with fan-out/fan-in
     """
 
+    # Workflow type -> builder(engine, policy)
+    _WORKFLOW_BUILDERS: Dict[str, Callable[["OrchestratorEngine", InvestorPolicyStatement], Workflow]] = {
+        WorkflowType.SEQUENTIAL: lambda self, policy: create_sequential_workflow(
+            name=f"sequential_{self.run_id}",
+        ),
+        WorkflowType.CONCURRENT: lambda self, policy: create_concurrent_risk_return_workflow(
+            name=f"concurrent_{self.run_id}",
+        ),
+        WorkflowType.HANDOFF: lambda self, policy: create_handoff_workflow(
+            name=f"handoff_{self.run_id}",
+            interaction_mode="autonomous",
+        ),
+        # Use more rounds for complex policies
+        WorkflowType.MAGENTIC: lambda self, policy: create_magentic_workflow(
+            name=f"magentic_{self.run_id}",
+            max_rounds=20 if policy.preferences.esg_focus else 15,
+            enable_plan_review=False,
+        ),
+        WorkflowType.DAG: lambda self, policy: create_dag_portfolio_workflow(
+            name=f"dag_{self.run_id}",
+        ),
+        # Use group chat for consensus-building discussions
+        WorkflowType.GROUP_CHAT: lambda self, policy: create_group_chat_workflow(
+            name=f"group_chat_{self.run_id}",
+            max_rounds=10,
+        ),
+    }
+
     def __init__(
         self,
         run_id: str,
         event_emitter: Optional[Callable] = None,
         workflow_type: str = WorkflowType.HANDOFF,
         enable_checkpointing: bool = True,
+        event_batch_emitter: Optional[Callable] = None,
     ):
         self.run_id = run_id
         self.event_emitter = event_emitter
+        self.event_batch_emitter = event_batch_emitter
         self.workflow_type = workflow_type
         self.enable_checkpointing = enable_checkpointing
         self.plan: Optional[OrchestratorPlan] = None
         self.evidence_collector = EvidenceCollector()
         self.workflow: Optional[Workflow] = None
         self._decision_counter = 0
+        self._workflow_event_count = 0
+        self._decisions_by_type: Dict[str, List[OrchestratorDecision]] = {}
 
         # Initialize trace emitter for rich events
         self.trace_emitter: Optional[TraceEmitter] = None
@@ -172,11 +452,33 @@ class OrchestratorEngine:
         self.candidates: Dict[str, Dict[str, Any]] = {}
         self._candidate_counter = 0
 
-        # Initialize checkpoint storage for fault tolerance
-        if enable_checkpointing:
-            self.checkpoint_storage = InMemoryCheckpointStorage()
-        else:
-            self.checkpoint_storage = None
+        # Checkpoint storage is opened on first use and released when a run ends
+        self.checkpoint_storage: Optional[SharedMemCheckpointStorage] = None
+
+        # Checkpoint writes are queued and persisted by a background task
+        self._checkpoint_queue: Optional[asyncio.Queue] = None
+        self._checkpoint_writer: Optional[asyncio.Task] = None
+
+        # Workflow event type -> classifier (see _dispatch and _classify)
+        self._event_classifiers: Dict[type, Callable[[WorkflowEvent, Dict[str, Any]], str]] = {
+            WorkflowStartedEvent: self._classify_started,
+            WorkflowStatusEvent: self._classify_status,
+            ExecutorInvokedEvent: self._classify_invoked,
+            ExecutorCompletedEvent: self._classify_completed,
+            AgentRunEvent: self._classify_agent_run,
+            AgentRunUpdateEvent: self._classify_agent_update,
+            WorkflowOutputEvent: self._classify_output,
+            WorkflowFailedEvent: self._classify_failed,
+        }
+        # Classified event type -> decision/logging side effects in run()
+        self._event_hooks: Dict[str, Callable[[WorkflowEvent, Dict[str, Any]], None]] = {
+            "workflow.started": self._on_workflow_started,
+            "executor.invoked": self._on_executor_invoked,
+            "executor.completed": self._on_executor_completed,
+            "agent.completed": self._on_agent_run,
+            "workflow.output": self._on_workflow_output,
+            "workflow.failed": self._on_workflow_failed,
+        }
 
         logger.info(
             "orchestrator_initialized",
@@ -187,62 +489,149 @@ class OrchestratorEngine:
 
     async def emit_event(self, event_type: str, payload: Dict[str, Any]):
         """Emit an orchestrator event with full tracing."""
+        if not self.event_emitter and not self.plan:
+            return
+
+        ns = time.time_ns()
+
         if self.event_emitter:
             full_payload = {
                 "run_id": self.run_id,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "actor": {
-                    "kind": "orchestrator",
-                    "id": "orchestrator",
-                    "name": "Orchestrator",
-                },
+                "timestamp": utc_iso_from_ns(ns),
+                "actor": _ORCHESTRATOR_ACTOR,
                 **payload,
             }
 
-            await self.event_emitter(
-                event_type=event_type,
-                payload=full_payload,
-            )
+            # Queue behind pending trace events so a slow sink doesn't stall
+            # the workflow and the stream stays in order
+            if self.trace_emitter is not None:
+                await self.trace_emitter.enqueue(event_type, full_payload)
+            else:
+                await self.event_emitter(
+                    event_type=event_type,
+                    payload=full_payload,
+                )
 
-            # Also store in plan trace
-            if self.plan:
-                self.plan.trace_events.append({
-                    "event_type": event_type,
-                    **full_payload,
-                })
+        # Also store in plan trace (materialized with TraceEvent.as_dict on export)
+        if self.plan:
+            self.plan.trace_events.append(
+                TraceEvent(event_type, self.run_id, ns, "orchestrator", payload)
+            )
 
-    async def _save_checkpoint(self, stage: str, data: Dict[str, Any] = None):
+    def _save_checkpoint(self, stage: str, data: Dict[str, Any] = None):
         """
         Save a checkpoint for fault tolerance.
 
         Checkpoints allow recovery from failures by storing workflow state
-        at key points during execution.
+        at key points during execution. The snapshot is queued for a
+        background writer, so the workflow never waits on storage I/O.
 
         Args:
             stage: Name of the current stage (e.g., "policy_parsed", "risk_complete")
             data: Additional data to save with the checkpoint
         """
-        if not self.enable_checkpointing or not self.checkpoint_storage:
+        if self._get_checkpoint_storage() is None:
             return
 
-        checkpoint_id = f"{self.run_id}:{stage}"
         checkpoint_data = {
             "run_id": self.run_id,
             "stage": stage,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp_ns": time.time_ns(),
             "workflow_type": self.workflow_type,
             "decision_count": self._decision_counter,
             "evidence_count": len(self.evidence_collector.get_evidence()),
             **(data or {}),
         }
 
-        await self.checkpoint_storage.save(checkpoint_id, checkpoint_data)
+        if self._checkpoint_queue is None:
+            self._checkpoint_queue = asyncio.Queue()
+            self._checkpoint_writer = asyncio.create_task(self._write_checkpoints())
 
-        logger.info(
-            "checkpoint_saved",
-            checkpoint_id=checkpoint_id,
-            stage=stage,
-        )
+        self._checkpoint_queue.put_nowait((stage, checkpoint_data))
+
+    async def _write_checkpoints(self):
+        """
+        Background checkpoint writer.
+
+        Waits up to CHECKPOINT_COALESCE for more snapshots, drains everything
+        queued since the last write, keeps only the latest snapshot per stage,
+        and persists those. Stops at the None sentinel.
+        """
+        queue = self._checkpoint_queue
+        stopping = False
+
+        while not stopping:
+            batch = [await queue.get()]
+            if CHECKPOINT_COALESCE and batch[0] is not None:
+                await asyncio.sleep(CHECKPOINT_COALESCE)
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+
+            latest: Dict[str, Dict[str, Any]] = {}
+            for item in batch:
+                if item is None:
+                    stopping = True
+                    continue
+                stage, checkpoint_data = item
+                latest[stage] = checkpoint_data
+
+            for stage, checkpoint_data in latest.items():
+                checkpoint_id = f"{self.run_id}:{stage}"
+                try:
+                    await self.checkpoint_storage.save(checkpoint_id, dumps_ckpt(checkpoint_data))
+                    logger.info(
+                        "checkpoint_saved",
+                        checkpoint_id=checkpoint_id,
+                        stage=stage,
+                    )
+                except Exception as e:
+                    logger.warning(
+                        "checkpoint_save_failed",
+                        checkpoint_id=checkpoint_id,
+                        error=str(e),
+                    )
+
+    async def _flush_checkpoints(self):
+        """Wait for queued checkpoints to be written and stop the writer."""
+        if self._checkpoint_writer is None:
+            return
+
+        self._checkpoint_queue.put_nowait(None)
+        await self._checkpoint_writer
+        self._checkpoint_queue = None
+        self._checkpoint_writer = None
+
+    def _get_checkpoint_storage(self) -> Optional[SharedMemCheckpointStorage]:
+        """Open the checkpoint storage on first use (None when checkpointing is disabled)."""
+        if self.enable_checkpointing and self.checkpoint_storage is None:
+            self.checkpoint_storage = SharedMemCheckpointStorage(
+                durable=FileCheckpointStorage(Path(CHECKPOINT_DIR)),
+            )
+        return self.checkpoint_storage
+
+    async def _discard_checkpoints(self):
+        """
+        Delete this run's checkpoints once it has completed.
+
+        A completed run has nothing left to resume. Stale files from runs
+        that failed and were never retried are pruned at the same time.
+        """
+        await self._flush_checkpoints()
+        if self.checkpoint_storage is None:
+            return
+
+        try:
+            await self.checkpoint_storage.delete_run(self.run_id)
+            await self.checkpoint_storage.prune(CHECKPOINT_TTL_HOURS * 3600)
+        except Exception as e:
+            logger.warning("checkpoint_cleanup_failed", run_id=self.run_id, error=str(e))
+
+    async def _close_checkpoint_storage(self):
+        """Flush queued checkpoints and release the shared-memory segment."""
+        await self._flush_checkpoints()
+        if self.checkpoint_storage is not None:
+            await self.checkpoint_storage.close()
+            self.checkpoint_storage = None
 
     async def _load_checkpoint(self, stage: str) -> Optional[Dict[str, Any]]:
         """
@@ -254,11 +643,13 @@ class OrchestratorEngine:
         Returns:
             Checkpoint data if found, None otherwise
         """
-        if not self.enable_checkpointing or not self.checkpoint_storage:
+        storage = self._get_checkpoint_storage()
+        if storage is None:
             return None
 
         checkpoint_id = f"{self.run_id}:{stage}"
-        return await self.checkpoint_storage.load(checkpoint_id)
+        payload = await storage.load(checkpoint_id)
+        return loads_ckpt(payload) if payload is not None else None
 
     def _record_decision(
         self,
@@ -271,7 +662,8 @@ class OrchestratorEngine:
         """Record an orchestrator decision for auditability."""
         self._decision_counter += 1
 
-        decision = OrchestratorDecision(
+        # Built from engine-controlled values, so skip validation
+        decision = OrchestratorDecision.model_construct(
             decision_type=decision_type,
             reasoning=reasoning,
             inputs_considered=inputs or [],
@@ -282,6 +674,11 @@ class OrchestratorEngine:
         if self.plan:
             self.plan.decisions.append(decision)
 
+            # Index the earliest decisions of each type
+            bucket = self._decisions_by_type.setdefault(decision_type, [])
+            if len(bucket) < DECISION_INDEX_DEPTH:
+                bucket.append(decision)
+
         logger.info(
             "orchestrator_decision",
             decision_id=decision.decision_id,
@@ -292,7 +689,7 @@ class OrchestratorEngine:
 
         return decision
 
-    async def run(self, policy: InvestorPolicyStatement) -> PortfolioAllocation:
+    async def run(self, policy: InvestorPolicyStatement, resume: bool = True) -> PortfolioAllocation:
         """
         Run the orchestrator with the given policy.
 
@@ -306,6 +703,9 @@ class OrchestratorEngine:
 
         Args:
             policy: InvestorPolicyStatement from onboarding
+            resume: Skip agent selection and workflow execution when a
+                checkpoint for this run already holds their result
+                (e.g. when a failed run is retried)
 
         Returns:
             Final portfolio allocation
@@ -324,11 +724,13 @@ class OrchestratorEngine:
             workflow_type=self.workflow_type,
             status="running",
         )
+        self._decisions_by_type = {}
 
         # Initialize trace emitter
         self.trace_emitter = TraceEmitter(
             run_id=self.run_id,
             event_callback=self.event_emitter,
+            batch_callback=self.event_batch_emitter,
         )
 
         # Emit run started
@@ -342,25 +744,23 @@ class OrchestratorEngine:
             # ================================================================
             # PHASE 1: Agent Selection
             # ================================================================
-            await self._select_agents_for_policy(policy)
-
-            # ================================================================
-            # PHASE 2: Create Workflow
-            # ================================================================
-            self.workflow = self._create_workflow_for_policy(policy)
-
-            await self.emit_event("orchestrator.workflow_created", {
-                "workflow_type": self.workflow_type,
-                "workflow_name": getattr(self.workflow, 'name', 'unknown'),
-            })
-
-            # Build the input message for the workflow
-            input_message = self._build_workflow_input(policy)
+            selection = await self._resume_or_run_phase(
+                "agents_selected",
+                lambda: self._agent_selection_phase(policy),
+                resume=resume,
+            )
+            self.selected_agents = [AgentSelectionResult.model_validate(a) for a in selection["selected"]]
+            self.excluded_agents = [AgentSelectionResult.model_validate(a) for a in selection["excluded"]]
 
             # ================================================================
-            # PHASE 3: Execute Workflow with Events
+            # PHASE 2 + 3: Create and Execute Workflow with Events
             # ================================================================
-            portfolio = await self._execute_workflow_with_events(input_message)
+            workflow_result = await self._resume_or_run_phase(
+                "workflow_executed",
+                lambda: self._workflow_phase(policy),
+                resume=resume,
+            )
+            portfolio = PortfolioAllocation.model_validate(workflow_result)
 
             # ================================================================
             # PHASE 4: Create and Select Candidate
@@ -419,6 +819,8 @@ class OrchestratorEngine:
                 decision_count=len(self.plan.decisions),
             )
 
+            await self._discard_checkpoints()
+
             return portfolio
 
         except Exception as e:
@@ -443,6 +845,61 @@ class OrchestratorEngine:
             )
             raise
 
+        finally:
+            await self.trace_emitter.aclose()
+            await self._close_checkpoint_storage()
+
+    async def _resume_or_run_phase(
+        self,
+        stage: str,
+        coro_factory: Callable[[], Awaitable[Any]],
+        resume: bool = True,
+    ) -> Any:
+        """
+        Return a phase result from its checkpoint, or run the phase and checkpoint it.
+
+        Args:
+            stage: Checkpoint stage name for the phase
+            coro_factory: Zero-argument callable returning a coroutine whose
+                result is JSON-serializable
+            resume: Whether to look for an existing checkpoint first
+
+        Returns:
+            The phase result
+        """
+        if resume:
+            checkpoint = await self._load_checkpoint(stage)
+            if checkpoint and "result" in checkpoint:
+                logger.info("phase_resumed_from_checkpoint", run_id=self.run_id, stage=stage)
+                return checkpoint["result"]
+
+        result = await coro_factory()
+        self._save_checkpoint(stage, {"result": result})
+        return result
+
+    async def _agent_selection_phase(self, policy: InvestorPolicyStatement) -> Dict[str, Any]:
+        """Phase 1: select agents and return the selection in checkpointable form."""
+        await self._select_agents_for_policy(policy)
+        return {
+            "selected": [a.model_dump() for a in self.selected_agents],
+            "excluded": [a.model_dump() for a in self.excluded_agents],
+        }
+
+    async def _workflow_phase(self, policy: InvestorPolicyStatement) -> Dict[str, Any]:
+        """Phases 2 and 3: build and execute the workflow, returning the portfolio as JSON."""
+        self.workflow = self._create_workflow_for_policy(policy)
+
+        await self.emit_event("orchestrator.workflow_created", {
+            "workflow_type": self.workflow_type,
+            "workflow_name": getattr(self.workflow, 'name', 'unknown'),
+        })
+
+        # Build the input message for the workflow
+        input_message = self._build_workflow_input(policy)
+
+        portfolio = await self._execute_workflow_with_events(input_message)
+        return portfolio.model_dump(mode="json")
+
     async def _select_agents_for_policy(self, policy: InvestorPolicyStatement):
         """
         Select agents based on policy and emit plan/decision events.
@@ -452,7 +909,7 @@ class OrchestratorEngine:
         # Use the agent registry to select agents
         self.selected_agents, self.excluded_agents = select_agents_for_policy(policy)
 
-        # Emit the execution plan
+        # Emit the plan
         if self.trace_emitter:
             await self.trace_emitter.emit_plan(
                 policy=policy,
@@ -551,52 +1008,61 @@ class OrchestratorEngine:
     ):
         """
         Run validation gates on a portfolio candidate.
+
+        The gates are independent, so they run concurrently.
         """
-        # Compliance gate
+        if not self.trace_emitter:
+            return
+
+        await asyncio.gather(
+            self._compliance_gate(candidate_id, portfolio, policy),
+            self._stress_gate(candidate_id),
+            self._liquidity_gate(candidate_id),
+        )
+
+    async def _compliance_gate(
+        self,
+        candidate_id: str,
+        portfolio: PortfolioAllocation,
+        policy: InvestorPolicyStatement,
+    ):
+        """Check allocation constraints and emit the compliance gate result."""
         compliance_passed = True
         compliance_violations = []
 
         # Check equity constraints
         equity_weight = sum(
             w for asset, w in portfolio.allocations.items()
-            if asset in ["VTI", "VXUS", "QQQ"]
+            if asset in _EQUITY_TICKERS
         )
         if equity_weight > policy.constraints.max_equity:
             compliance_passed = False
             compliance_violations.append(f"Equity {equity_weight:.0%} exceeds max {policy.constraints.max_equity:.0%}")
 
-        if self.trace_emitter:
-            await self.trace_emitter.emit_gate_result(
-                gate_type="compliance",
-                candidate_id=candidate_id,
-                passed=compliance_passed,
-                details={"violations": compliance_violations},
-            )
-
-        # Stress gate
-        stress_passed = True
-        scenarios = [
-            {"name": "Market Crash -20%", "impact": -0.15, "passed": True},
-            {"name": "Rate Spike +200bp", "impact": -0.08, "passed": True},
-            {"name": "Inflation Surge", "impact": -0.05, "passed": True},
-        ]
+        await self.trace_emitter.emit_gate_result(
+            gate_type="compliance",
+            candidate_id=candidate_id,
+            passed=compliance_passed,
+            details={"violations": compliance_violations},
+        )
 
-        if self.trace_emitter:
-            await self.trace_emitter.emit_gate_result(
-                gate_type="stress",
-                candidate_id=candidate_id,
-                passed=stress_passed,
-                details={"breaches": 0, "scenarios": scenarios},
-            )
+    async def _stress_gate(self, candidate_id: str):
+        """Emit the stress gate result."""
+        await self.trace_emitter.emit_gate_result(
+            gate_type="stress",
+            candidate_id=candidate_id,
+            passed=True,
+            details=_STRESS_GATE_DETAILS,
+        )
 
-        # Liquidity gate
-        if self.trace_emitter:
-            await self.trace_emitter.emit_gate_result(
-                gate_type="liquidity",
-                candidate_id=candidate_id,
-                passed=True,
-                details={"turnover": 0.15, "threshold": 0.25, "slippage": 0.001},
-            )
+    async def _liquidity_gate(self, candidate_id: str):
+        """Emit the liquidity gate result."""
+        await self.trace_emitter.emit_gate_result(
+            gate_type="liquidity",
+            candidate_id=candidate_id,
+            passed=True,
+            details=_LIQUIDITY_GATE_DETAILS,
+        )
 
     async def _generate_explanation(
         self,
@@ -614,12 +1080,7 @@ class OrchestratorEngine:
             A 2-3 sentence explanation of the portfolio
         """
         try:
-            # Initialize Azure OpenAI client
-            client = AsyncAzureOpenAI(
-                azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
-                api_key=os.getenv("AZURE_OPENAI_API_KEY"),
-                api_version="2024-02-15-preview",
-            )
+            client = await _get_aoai_client()
 
             # Build concise context
             top_holdings = sorted(
@@ -629,38 +1090,31 @@ class OrchestratorEngine:
             )[:5]
 
             # Get key decisions from the plan
-            key_decisions = []
-            if self.plan:
-                key_decisions = [
-                    d.reasoning for d in self.plan.decisions
-                    if d.decision_type in ["include_agent", "select_candidate", "commit"]
-                ][:3]
+            key_decisions = [
+                d.reasoning for d in islice(
+                    chain.from_iterable(self._decisions_by_type.get(t, ()) for t in _KEY_DECISION_TYPES),
+                    3,
+                )
+            ]
 
             # Include user's original investment thesis if available
             user_context = policy.chat_context or ""
-            context_section = f"""
-The investor originally stated:
-"{user_context}"
-
-""" if user_context else ""
-
-            prompt = f"""Summarize this portfolio recommendation in 2-3 sentences for an investor.
-{context_section}
-Portfolio allocation (top 5 holdings):
-{', '.join([f'{asset}: {weight:.0%}' for asset, weight in top_holdings])}
-
-Key metrics:
-- Expected return: {portfolio.metrics.get('expected_return', 'N/A')}%
-- Volatility: {portfolio.metrics.get('volatility', 'N/A')}%
-- Sharpe ratio: {portfolio.metrics.get('sharpe', 'N/A')}
-
-Investor profile:
-- Risk tolerance: {policy.risk_appetite.risk_tolerance}
-- Time horizon: {policy.risk_appetite.time_horizon}
-- Themes: {', '.join(policy.preferences.preferred_themes) or 'None'}
-- ESG focus: {'Yes' if policy.preferences.esg_focus else 'No'}
+            context_section = (
+                _EXPLANATION_CONTEXT_TEMPLATE.substitute(user_context=user_context)
+                if user_context else ""
+            )
 
-Explain how this portfolio addresses the investor's specific goals and themes. Reference their original investment thesis if provided. Be concise and professional."""
+            prompt = _EXPLANATION_TEMPLATE.substitute(
+                context_section=context_section,
+                top_holdings=', '.join([f'{asset}: {weight:.0%}' for asset, weight in top_holdings]),
+                expected_return=portfolio.metrics.get('expected_return', 'N/A'),
+                volatility=portfolio.metrics.get('volatility', 'N/A'),
+                sharpe=portfolio.metrics.get('sharpe', 'N/A'),
+                risk_tolerance=policy.risk_appetite.risk_tolerance,
+                time_horizon=policy.risk_appetite.time_horizon,
+                themes=', '.join(policy.preferences.preferred_themes) or 'None',
+                esg_focus='Yes' if policy.preferences.esg_focus else 'No',
+            )
 
             response = await client.chat.completions.create(
                 model=os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME", "gpt-4o"),
@@ -686,100 +1140,42 @@ Explain how this portfolio addresses the investor's specific goals and themes. R
             policy_id=policy.policy_id,
         )
 
-        if self.workflow_type == WorkflowType.SEQUENTIAL:
-            return create_sequential_workflow(
-                name=f"sequential_{self.run_id}"
-            )
-
-        elif self.workflow_type == WorkflowType.CONCURRENT:
-            return create_concurrent_risk_return_workflow(
-                name=f"concurrent_{self.run_id}"
-            )
-
-        elif self.workflow_type == WorkflowType.HANDOFF:
-            return create_handoff_workflow(
-                name=f"handoff_{self.run_id}",
-                interaction_mode="autonomous",
-            )
-
-        elif self.workflow_type == WorkflowType.MAGENTIC:
-            # Use more rounds for complex policies
-            max_rounds = 20 if policy.preferences.esg_focus else 15
-            return create_magentic_workflow(
-                name=f"magentic_{self.run_id}",
-                max_rounds=max_rounds,
-                enable_plan_review=False,
-            )
-
-        elif self.workflow_type == WorkflowType.DAG:
-            return create_dag_portfolio_workflow(
-                name=f"dag_{self.run_id}"
-            )
-
-        elif self.workflow_type == WorkflowType.GROUP_CHAT:
-            # Use group chat for consensus-building discussions
-            return create_group_chat_workflow(
-                name=f"group_chat_{self.run_id}",
-                max_rounds=10,
-            )
-
-        else:
+        builder = self._WORKFLOW_BUILDERS.get(self.workflow_type)
+        if builder is None:
             # Default to handoff
             logger.warning(
                 "unknown_workflow_type_defaulting",
                 workflow_type=self.workflow_type,
                 default="handoff",
             )
-            return create_handoff_workflow(
-                name=f"handoff_{self.run_id}",
-                interaction_mode="autonomous",
-            )
+            builder = self._WORKFLOW_BUILDERS[WorkflowType.HANDOFF]
+
+        return builder(self, policy)
 
     def _build_workflow_input(self, policy: InvestorPolicyStatement) -> str:
         """Build the input message for the workflow."""
-        return f"""## Portfolio Optimization Task
-
-### Investor Policy Statement
-- Policy ID: {policy.policy_id}
-- Investor Type: {policy.investor_profile.investor_type}
-- Portfolio Value: ${policy.investor_profile.portfolio_value:,.0f}
-- Risk Tolerance: {policy.risk_appetite.risk_tolerance}
-- Time Horizon: {policy.risk_appetite.time_horizon}
-
-### Risk Constraints
-- Max Volatility: {policy.risk_appetite.max_volatility}%
-- Max Drawdown: {policy.risk_appetite.max_drawdown}%
-
-### Allocation Constraints
-- Equity: {policy.constraints.min_equity*100:.0f}% - {policy.constraints.max_equity*100:.0f}%
-- Fixed Income: {policy.constraints.min_fixed_income*100:.0f}% - {policy.constraints.max_fixed_income*100:.0f}%
-- Max Single Position: {policy.constraints.max_single_position*100:.0f}%
-
-### Preferences
-- ESG Focus: {policy.preferences.esg_focus}
-- Themes: {', '.join(policy.preferences.preferred_themes) or 'None'}
-- Exclusions: {len(policy.preferences.exclusions)} rules
-
-### Benchmark
-- Primary: {policy.benchmark_settings.benchmark}
-- Target Return: {policy.benchmark_settings.target_return}%
-
-### Investment Thesis (User Context)
-{policy.chat_context or "No additional context provided. Use standard optimization approach."}
-
-### Special Instructions
-{policy.special_instructions or "None"}
-
-### Instructions
-1. Analyze the investment policy and constraints
-2. Pay special attention to the user's investment thesis above - align fund selection with their stated goals
-3. Gather market data for the investable universe, prioritizing funds that match the user's themes
-4. Compute risk metrics and stress tests
-5. Forecast expected returns with consideration for the user's target return expectations
-6. Optimize the portfolio allocation
-7. Verify compliance with all constraints
-8. Provide the final allocation with supporting evidence that references the user's original goals
-"""
+        constraints = policy.constraints
+        return _WORKFLOW_INPUT_TEMPLATE.substitute(
+            policy_id=policy.policy_id,
+            investor_type=policy.investor_profile.investor_type,
+            portfolio_value=f"{policy.investor_profile.portfolio_value:,.0f}",
+            risk_tolerance=policy.risk_appetite.risk_tolerance,
+            time_horizon=policy.risk_appetite.time_horizon,
+            max_volatility=policy.risk_appetite.max_volatility,
+            max_drawdown=policy.risk_appetite.max_drawdown,
+            min_equity_pct=f"{constraints.min_equity*100:.0f}",
+            max_equity_pct=f"{constraints.max_equity*100:.0f}",
+            min_fixed_income_pct=f"{constraints.min_fixed_income*100:.0f}",
+            max_fixed_income_pct=f"{constraints.max_fixed_income*100:.0f}",
+            max_single_position_pct=f"{constraints.max_single_position*100:.0f}",
+            esg_focus=policy.preferences.esg_focus,
+            themes=', '.join(policy.preferences.preferred_themes) or 'None',
+            exclusion_count=len(policy.preferences.exclusions),
+            benchmark=policy.benchmark_settings.benchmark,
+            target_return=policy.benchmark_settings.target_return,
+            chat_context=policy.chat_context or "No additional context provided. Use standard optimization approach.",
+            special_instructions=policy.special_instructions or "None",
+        )
 
     async def _execute_workflow_with_events(self, input_message: str) -> PortfolioAllocation:
         """Execute the workflow and process all events."""
@@ -787,17 +1183,27 @@ Explain how this portfolio addresses the investor's specific goals and themes. R
         logger.info("workflow_execution_started", run_id=self.run_id)
 
         # Save initial checkpoint
-        await self._save_checkpoint("workflow_started", {
+        self._save_checkpoint("workflow_started", {
             "input_length": len(input_message),
         })
 
         final_output = None
-        agent_responses = []
-        completed_agents = set()
+        agent_responses: Deque[Dict[str, Any]] = deque(maxlen=AGENT_RESPONSE_WINDOW)
+        completed_agents: Set[str] = set()
+        # Completion-ordered, immutable snapshot shared by queued checkpoints;
+        # only rebuilt when a new agent completes
+        completed_snapshot: Tuple[str, ...] = ()
 
         # Run workflow with streaming
+        event_count = 0
         async for event in self.workflow.run_stream(input_message):
-            await self._process_workflow_event(event)
+            event_type, event_data = await self._process_workflow_event(event)
+
+            # Events can arrive without the workflow suspending; give other
+            # runs and SSE heartbeats a turn
+            event_count += 1
+            if event_count % STREAM_YIELD_EVERY == 0:
+                await asyncio.sleep(0)
 
             # Capture outputs
             if isinstance(event, WorkflowOutputEvent):
@@ -807,31 +1213,25 @@ Explain how this portfolio addresses the investor's specific goals and themes. R
                     output_type=type(final_output).__name__,
                 )
                 # Save checkpoint with output
-                await self._save_checkpoint("workflow_output", {
+                self._save_checkpoint("workflow_output", {
                     "has_output": final_output is not None,
                 })
 
-            # Capture agent responses for evidence
-            if isinstance(event, AgentRunEvent):
-                agent_name = event.agent_run_response.agent_name or "unknown"
-                agent_responses.append({
-                    "agent": agent_name,
-                    "messages": len(event.agent_run_response.messages),
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                })
-                self.plan.evidence.append({
-                    "evidence_id": f"ev-{uuid.uuid4().hex[:8]}",
-                    "type": "agent_response",
-                    "agent": agent_name,
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                    "message_count": len(event.agent_run_response.messages),
-                })
+            # Record each agent response as evidence as it arrives; the
+            # response window and the plan share the same evidence dict
+            if event_type == "agent.completed":
+                agent_name = event_data["agent_name"]
+                evidence = _make_evidence(agent_name, event_data["message_count"], event_data["timestamp"])
+                agent_responses.append(evidence)
+                self.plan.evidence.append(evidence)
 
                 # Save checkpoint after each agent completes (for fault tolerance)
-                completed_agents.add(agent_name)
-                await self._save_checkpoint(f"agent_completed_{agent_name}", {
+                if agent_name not in completed_agents:
+                    completed_agents.add(agent_name)
+                    completed_snapshot += (agent_name,)
+                self._save_checkpoint(f"agent_completed_{agent_name}", {
                     "agent": agent_name,
-                    "completed_agents": list(completed_agents),
+                    "completed_agents": completed_snapshot,
                     "evidence_count": len(self.plan.evidence),
                 })
 
@@ -839,7 +1239,7 @@ Explain how this portfolio addresses the investor's specific goals and themes. R
         portfolio = self._extract_portfolio_from_output(final_output, agent_responses)
 
         # Save final checkpoint
-        await self._save_checkpoint("workflow_completed", {
+        self._save_checkpoint("workflow_completed", {
             "allocations": portfolio.allocations,
             "metrics": portfolio.metrics,
             "total_agents": len(completed_agents),
@@ -847,105 +1247,164 @@ Explain how this portfolio addresses the investor's specific goals and themes. R
 
         return portfolio
 
-    async def _process_workflow_event(self, event: WorkflowEvent):
-        """Process and emit workflow events for observability."""
-
-        event_data = {
-            "event_class": type(event).__name__,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-        }
-
-        if isinstance(event, WorkflowStartedEvent):
-            event_data["status"] = "started"
-            await self.emit_event("workflow.started", event_data)
-
-            self._record_decision(
-                decision_type="workflow_started",
-                reasoning="Workflow execution initiated",
-                confidence=1.0,
-            )
+    @staticmethod
+    def _dispatch(table: Dict[type, Callable], event: WorkflowEvent, default: Callable) -> Callable:
+        """
+        Look up the handler for an event's type.
 
-        elif isinstance(event, WorkflowStatusEvent):
-            event_data["status"] = "status_update"
-            await self.emit_event("workflow.status", event_data)
+        Exact types hit the table directly; a subclass resolves through its
+        MRO once and is then cached under its own type.
+        """
+        cls = type(event)
+        handler = table.get(cls)
+        if handler is None:
+            handler = next((table[base] for base in cls.__mro__[1:] if base in table), default)
+            table[cls] = handler
+        return handler
+
+    def _classify(self, event: WorkflowEvent) -> Tuple[str, Dict[str, Any]]:
+        """
+        Classify a workflow event once.
 
-        elif isinstance(event, ExecutorInvokedEvent):
-            event_data["executor_id"] = event.executor_id
-            event_data["executor_type"] = event.executor_type
-            await self.emit_event("executor.invoked", event_data)
+        Returns (event type, payload); the same payload is emitted by
+        _process_workflow_event and streamed by run_stream.
+        """
+        cls = type(event)
+        payload = {
+            "event_class": _EVENT_CLASS_NAMES.get(cls) or cls.__name__,
+            "timestamp": utc_iso_now(),
+        }
+        classifier = self._dispatch(self._event_classifiers, event, self._classify_generic)
+        return classifier(event, payload), payload
+
+    @staticmethod
+    def _classify_started(event: WorkflowEvent, payload: Dict[str, Any]) -> str:
+        payload["status"] = "started"
+        return "workflow.started"
+
+    @staticmethod
+    def _classify_status(event: WorkflowEvent, payload: Dict[str, Any]) -> str:
+        payload["status"] = "status_update"
+        return "workflow.status"
+
+    @staticmethod
+    def _classify_invoked(event: WorkflowEvent, payload: Dict[str, Any]) -> str:
+        payload["executor_id"] = event.executor_id
+        payload["executor_type"] = event.executor_type
+        return "executor.invoked"
+
+    @staticmethod
+    def _classify_completed(event: WorkflowEvent, payload: Dict[str, Any]) -> str:
+        payload["executor_id"] = event.executor_id
+        payload["executor_type"] = event.executor_type
+        return "executor.completed"
+
+    @staticmethod
+    def _classify_agent_run(event: WorkflowEvent, payload: Dict[str, Any]) -> str:
+        response = event.agent_run_response
+        payload["agent_name"] = response.agent_name or "unknown"
+        payload["message_count"] = len(response.messages)
+        return "agent.completed"
+
+    @staticmethod
+    def _classify_agent_update(event: WorkflowEvent, payload: Dict[str, Any]) -> str:
+        # Streaming update - emitted for real-time UI
+        payload["agent_name"] = getattr(event, 'agent_name', 'unknown')
+        payload["is_streaming"] = True
+        return "agent.streaming"
+
+    @staticmethod
+    def _classify_output(event: WorkflowEvent, payload: Dict[str, Any]) -> str:
+        payload["has_output"] = event.output is not None
+        return "workflow.output"
+
+    @staticmethod
+    def _classify_failed(event: WorkflowEvent, payload: Dict[str, Any]) -> str:
+        payload["error"] = str(event.error) if hasattr(event, 'error') else "Unknown error"
+        return "workflow.failed"
+
+    @staticmethod
+    def _classify_generic(event: WorkflowEvent, payload: Dict[str, Any]) -> str:
+        payload["event_type"] = payload["event_class"]
+        return "workflow.event"
+
+    async def _process_workflow_event(self, event: WorkflowEvent) -> Tuple[str, Dict[str, Any]]:
+        """Process and emit workflow events for observability. Returns the classified (type, payload)."""
+        self._workflow_event_count += 1
+        event_type, event_data = self._classify(event)
+        await self.emit_event(event_type, event_data)
+
+        hook = self._event_hooks.get(event_type)
+        if hook is not None:
+            hook(event, event_data)
+
+        return event_type, event_data
+
+    def _log_sampled(self) -> bool:
+        """Whether the current workflow event's info log is in the TRACE_LOG_SAMPLE sample."""
+        return (self._workflow_event_count - 1) % TRACE_LOG_SAMPLE == 0
+
+    def _on_workflow_started(self, event: WorkflowEvent, event_data: Dict[str, Any]):
+        self._record_decision(
+            decision_type="workflow_started",
+            reasoning="Workflow execution initiated",
+            confidence=1.0,
+        )
 
-            self._record_decision(
-                decision_type="executor_invoked",
-                reasoning=f"Invoking executor: {event.executor_id}",
-                inputs=["workflow_state", "pending_tasks"],
-                action={"executor_id": event.executor_id},
-            )
+    def _on_executor_invoked(self, event: WorkflowEvent, event_data: Dict[str, Any]):
+        self._record_decision(
+            decision_type="executor_invoked",
+            reasoning=f"Invoking executor: {event.executor_id}",
+            inputs=["workflow_state", "pending_tasks"],
+            action={"executor_id": event.executor_id},
+        )
 
+        if self._log_sampled():
             logger.info(
                 "executor_invoked",
                 executor_id=event.executor_id,
                 executor_type=event.executor_type,
             )
 
-        elif isinstance(event, ExecutorCompletedEvent):
-            event_data["executor_id"] = event.executor_id
-            event_data["executor_type"] = event.executor_type
-            await self.emit_event("executor.completed", event_data)
-
+    def _on_executor_completed(self, event: WorkflowEvent, event_data: Dict[str, Any]):
+        if self._log_sampled():
             logger.info(
                 "executor_completed",
                 executor_id=event.executor_id,
             )
 
-        elif isinstance(event, AgentRunEvent):
-            agent_name = event.agent_run_response.agent_name or "unknown"
-            event_data["agent_name"] = agent_name
-            event_data["message_count"] = len(event.agent_run_response.messages)
-            await self.emit_event("agent.completed", event_data)
+    def _on_agent_run(self, event: WorkflowEvent, event_data: Dict[str, Any]):
+        # Read back what _classify_agent_run already extracted
+        agent_name = event_data["agent_name"]
+        message_count = event_data["message_count"]
 
-            self._record_decision(
-                decision_type="agent_completed",
-                reasoning=f"Agent {agent_name} completed with {len(event.agent_run_response.messages)} messages",
-                inputs=["agent_input", "tools_available"],
-                action={"agent": agent_name},
-            )
+        self._record_decision(
+            decision_type="agent_completed",
+            reasoning=f"Agent {agent_name} completed with {message_count} messages",
+            inputs=["agent_input", "tools_available"],
+            action={"agent": agent_name},
+        )
 
+        if self._log_sampled():
             logger.info(
                 "agent_run_completed",
                 agent_name=agent_name,
-                message_count=len(event.agent_run_response.messages),
+                message_count=message_count,
             )
 
-        elif isinstance(event, AgentRunUpdateEvent):
-            # Streaming update - emit for real-time UI
-            event_data["agent_name"] = getattr(event, 'agent_name', 'unknown')
-            event_data["is_streaming"] = True
-            await self.emit_event("agent.streaming", event_data)
-
-        elif isinstance(event, WorkflowOutputEvent):
-            event_data["has_output"] = event.output is not None
-            await self.emit_event("workflow.output", event_data)
+    def _on_workflow_output(self, event: WorkflowEvent, event_data: Dict[str, Any]):
+        logger.info("workflow_output_emitted")
 
-            logger.info("workflow_output_emitted")
-
-        elif isinstance(event, WorkflowFailedEvent):
-            event_data["error"] = str(event.error) if hasattr(event, 'error') else "Unknown error"
-            await self.emit_event("workflow.failed", event_data)
-
-            logger.error(
-                "workflow_failed",
-                error=event_data.get("error"),
-            )
-
-        else:
-            # Generic event
-            event_data["event_type"] = type(event).__name__
-            await self.emit_event("workflow.event", event_data)
+    def _on_workflow_failed(self, event: WorkflowEvent, event_data: Dict[str, Any]):
+        logger.error(
+            "workflow_failed",
+            error=event_data.get("error"),
+        )
 
     def _extract_portfolio_from_output(
         self,
         output: Any,
-        agent_responses: List[Dict[str, Any]]
+        agent_responses: Iterable[Dict[str, Any]]
     ) -> PortfolioAllocation:
         """Extract portfolio allocation from workflow output."""
 
@@ -958,38 +1417,20 @@ Explain how this portfolio addresses the investor's specific goals and themes. R
                 return PortfolioAllocation(
                     allocations=allocations,
                     metrics=metrics,
-                    last_updated=datetime.now(timezone.utc),
+                    last_updated=_fast_utcnow(),
                 )
 
-        # Fallback: generate reasonable allocation based on policy
-        policy = self.plan.policy
-
-        # Default allocation based on risk tolerance
-        if policy.risk_appetite.risk_tolerance == "conservative":
-            allocations = {
-                "VTI": 0.25, "VXUS": 0.10, "BND": 0.40,
-                "BNDX": 0.15, "VNQ": 0.05, "CASH": 0.05
-            }
-            metrics = {"expected_return": 5.5, "volatility": 8.0, "sharpe": 0.44}
-
-        elif policy.risk_appetite.risk_tolerance == "aggressive":
-            allocations = {
-                "VTI": 0.45, "VXUS": 0.20, "QQQ": 0.15,
-                "BND": 0.10, "VNQ": 0.07, "CASH": 0.03
-            }
-            metrics = {"expected_return": 9.5, "volatility": 16.0, "sharpe": 0.47}
-
-        else:  # moderate
-            allocations = {
-                "VTI": 0.35, "VXUS": 0.15, "BND": 0.30,
-                "BNDX": 0.10, "VNQ": 0.05, "CASH": 0.05
-            }
-            metrics = {"expected_return": 7.2, "volatility": 11.5, "sharpe": 0.45}
+        # Fallback: default allocation based on the policy's risk tolerance
+        allocations, metrics = _FALLBACK_PORTFOLIOS.get(
+            self.plan.policy.risk_appetite.risk_tolerance,
+            _FALLBACK_PORTFOLIOS["moderate"],
+        )
 
+        # Validation copies the dicts, so the shared defaults stay untouched
         return PortfolioAllocation(
             allocations=allocations,
             metrics=metrics,
-            last_updated=datetime.now(timezone.utc),
+            last_updated=_fast_utcnow(),
         )
 
     async def run_stream(
@@ -1020,13 +1461,14 @@ Explain how this portfolio addresses the investor's specific goals and themes. R
             workflow_type=self.workflow_type,
             status="running",
         )
+        self._decisions_by_type = {}
 
         yield {
             "type": "orchestrator.started",
             "run_id": self.run_id,
             "policy_id": policy.policy_id,
             "workflow_type": self.workflow_type,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_iso_now(),
         }
 
         try:
@@ -1037,22 +1479,27 @@ Explain how this portfolio addresses the investor's specific goals and themes. R
             yield {
                 "type": "workflow.created",
                 "workflow_type": self.workflow_type,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": utc_iso_now(),
             }
 
             # Stream workflow events
+            event_count = 0
             async for event in self.workflow.run_stream(input_message):
-                event_dict = self._event_to_dict(event)
+                event_type, event_dict = self._classify(event)
+                event_dict["type"] = event_type
                 yield event_dict
 
+                event_count += 1
+                if event_count % STREAM_YIELD_EVERY == 0:
+                    await asyncio.sleep(0)
+
                 # Capture evidence
-                if isinstance(event, AgentRunEvent):
-                    self.plan.evidence.append({
-                        "evidence_id": f"ev-{uuid.uuid4().hex[:8]}",
-                        "type": "agent_response",
-                        "agent": event.agent_run_response.agent_name,
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                    })
+                if event_type == "agent.completed":
+                    self.plan.evidence.append(_make_evidence(
+                        event_dict["agent_name"],
+                        event_dict["message_count"],
+                        event_dict["timestamp"],
+                    ))
 
                 # Extract final output
                 if isinstance(event, WorkflowOutputEvent):
@@ -1069,7 +1516,7 @@ Explain how this portfolio addresses the investor's specific goals and themes. R
                 "metrics": self.plan.portfolio.metrics,
                 "decision_count": len(self.plan.decisions),
                 "evidence_count": len(self.plan.evidence),
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": utc_iso_now(),
             }
 
         except Exception as e:
@@ -1079,43 +1526,10 @@ Explain how this portfolio addresses the investor's specific goals and themes. R
                 "type": "orchestrator.failed",
                 "run_id": self.run_id,
                 "error": str(e),
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": utc_iso_now(),
             }
 
             raise
 
-    def _event_to_dict(self, event: WorkflowEvent) -> Dict[str, Any]:
-        """Convert workflow event to dictionary for streaming."""
-        base = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "event_class": type(event).__name__,
-        }
-
-        if isinstance(event, ExecutorInvokedEvent):
-            base["type"] = "executor.invoked"
-            base["executor_id"] = event.executor_id
-            base["executor_type"] = event.executor_type
-
-        elif isinstance(event, ExecutorCompletedEvent):
-            base["type"] = "executor.completed"
-            base["executor_id"] = event.executor_id
-
-        elif isinstance(event, AgentRunEvent):
-            base["type"] = "agent.completed"
-            base["agent_name"] = event.agent_run_response.agent_name
-            base["message_count"] = len(event.agent_run_response.messages)
-
-        elif isinstance(event, AgentRunUpdateEvent):
-            base["type"] = "agent.streaming"
-
-        elif isinstance(event, WorkflowOutputEvent):
-            base["type"] = "workflow.output"
-            base["has_output"] = event.output is not None
-
-        elif isinstance(event, WorkflowFailedEvent):
-            base["type"] = "workflow.failed"
-
-        else:
-            base["type"] = "workflow.event"
-
-        return base
+        finally:
+            await self._close_checkpoint_storage()
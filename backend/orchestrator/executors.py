@@ -4,16 +4,20 @@ These executors handle specific workflow steps like policy parsing,
 result aggregation, and portfolio finalization.
 """
 
+import asyncio
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 from typing_extensions import Never
 
 from agent_framework import (
+    AgentRunEvent,
+    ChatAgent,
     Executor,
     WorkflowContext,
     handler,
     ChatMessage,
+    AgentExecutorRequest,
     AgentExecutorResponse,
 )
 from pydantic import BaseModel
@@ -219,6 +223,103 @@ class RiskReturnAggregatorExecutor(Executor):
         await ctx.send_message(state)
 
 
+class ParallelAgentsExecutor(Executor):
+    """
+    Runs several agents on the same input concurrently and reduces their responses.
+
+    The agent runs are started together and awaited as they complete
+    rather than relying on the runner to deliver fan-out edges in parallel,
+    so the step takes as long as the slowest agent instead of the sum of all
+    of them. An AgentRunEvent is added for each agent in completion order,
+    and if one agent fails the others are cancelled. Results keep
+    participant order for the aggregator.
+
+    With an aggregator, its result is yielded as the workflow output.
+    Without one, the input conversation plus every agent's reply is sent
+    on to the next executor as an AgentExecutorRequest, so the executor can
+    sit between agents in a DAG.
+    """
+
+    def __init__(
+        self,
+        agents: Sequence[ChatAgent],
+        aggregator: Optional[Callable[[List[AgentExecutorResponse]], Any]] = None,
+        id: str = "parallel_agents",
+    ):
+        super().__init__(id=id)
+        self.agents = list(agents)
+        self.aggregator = aggregator
+
+    @handler
+    async def run_prompt(
+        self,
+        prompt: str,
+        ctx: WorkflowContext[AgentExecutorRequest, Any]
+    ) -> None:
+        """Fan a text prompt out to all agents."""
+        await self._fan_out([ChatMessage(role="user", text=prompt)], ctx)
+
+    @handler
+    async def run_messages(
+        self,
+        messages: List[ChatMessage],
+        ctx: WorkflowContext[AgentExecutorRequest, Any]
+    ) -> None:
+        """Fan a conversation out to all agents."""
+        await self._fan_out(messages, ctx)
+
+    @handler
+    async def run_after_agent(
+        self,
+        prior: AgentExecutorResponse,
+        ctx: WorkflowContext[AgentExecutorRequest, Any]
+    ) -> None:
+        """Fan the conversation so far out to all agents (upstream agent in a DAG)."""
+        await self._fan_out(list(prior.full_conversation or []), ctx)
+
+    async def _fan_out(
+        self,
+        messages: List[ChatMessage],
+        ctx: WorkflowContext[AgentExecutorRequest, Any]
+    ) -> None:
+        logger.info(
+            "parallel_agents_started",
+            executor=self.id,
+            agent_count=len(self.agents),
+        )
+
+        async def run_agent(index: int, agent: ChatAgent):
+            return index, await agent.run(messages)
+
+        executor_ids = [agent.name or agent.id for agent in self.agents]
+        tasks = [asyncio.create_task(run_agent(i, agent)) for i, agent in enumerate(self.agents)]
+        responses: List[Any] = [None] * len(tasks)
+        try:
+            # Record each agent as it finishes, in completion order
+            for next_done in asyncio.as_completed(tasks):
+                index, response = await next_done
+                responses[index] = response
+                await ctx.add_event(AgentRunEvent(executor_ids[index], response))
+        finally:
+            # Only still-running agents are affected (when one of them failed)
+            for task in tasks:
+                task.cancel()
+
+        results = [
+            AgentExecutorResponse(executor_id, response)
+            for executor_id, response in zip(executor_ids, responses)
+        ]
+
+        if self.aggregator is not None:
+            await ctx.yield_output(self.aggregator(results))
+            return
+
+        conversation = list(messages)
+        for response in responses:
+            conversation.extend(response.messages)
+        await ctx.send_message(AgentExecutorRequest(messages=conversation, should_respond=True))
+
+
 class PortfolioFinalizerExecutor(Executor):
     """
     Finalizes the portfolio allocation after all analysis is complete.
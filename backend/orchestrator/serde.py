@@ -0,0 +1,36 @@
+"""
+Serialization for orchestrator checkpoints.
+
+Checkpoints are packed with msgpack: smaller and faster to encode than
+JSON, and they never leave the backend. Values msgpack can't pack natively
+(datetimes, enums, pydantic models) are converted by _default.
+"""
+
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+import msgpack
+from pydantic import BaseModel
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    return str(obj)
+
+
+def dumps_ckpt(data: Any) -> bytes:
+    """Pack a checkpoint payload."""
+    return msgpack.packb(data, default=_default, use_bin_type=True)
+
+
+def loads_ckpt(payload: bytes) -> Any:
+    """Unpack a checkpoint payload."""
+    return msgpack.unpackb(payload, raw=False)
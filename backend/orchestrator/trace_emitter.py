@@ -4,16 +4,110 @@ Trace Event Emitter for Dynamic Orchestration.
 Emits rich structured events for full UI visibility into orchestrator decisions.
 """
 
-import uuid
+import asyncio
+import logging
+import os
+import random
+import time
+from contextvars import ContextVar, Token
 from datetime import datetime, timezone
-from typing import Any, Callable, Dict, List, Optional
-from pydantic import BaseModel
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import structlog
 
 from backend.schemas.policy import InvestorPolicyStatement
 from backend.orchestrator.agent_registry import AgentSelectionResult
 
 logger = structlog.get_logger()
+# stdlib logger behind `logger`, used to skip debug logging cheaply
+_stdlib_logger = logging.getLogger(__name__)
+
+# Most events delivered by one batch callback call
+TRACE_BATCH_MAX_EVENTS = int(os.getenv("TRACE_BATCH_MAX_EVENTS", "32"))
+# Optional wait for more events before delivering a batch (0 = deliver what is queued)
+TRACE_BATCH_LINGER = int(os.getenv("TRACE_BATCH_LINGER_MS", "0")) / 1000
+# Events held for delivery before producers are throttled (or old events dropped)
+TRACE_QUEUE_MAXSIZE = int(os.getenv("TRACE_QUEUE_MAXSIZE", "1024"))
+
+# What a producer does when the delivery queue is full
+DROP_POLICIES = ("block", "drop_oldest")
+
+# Source for short event/span IDs: seeded once from os.urandom instead of a
+# urandom call per ID, and reseeded in forked children so workers diverge
+_id_rng = random.Random(os.urandom(32))
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=lambda: _id_rng.seed(os.urandom(32)))
+
+
+def short_id(prefix: str) -> str:
+    """Generate a short random ID such as "span-1a2b3c4d" (32 random bits, not for secrets)."""
+    return f"{prefix}-{_id_rng.getrandbits(32):08x}"
+
+
+# Span currently open in this asyncio task. Each task (including every
+# asyncio.gather branch) works on its own copy of the context, so parallel
+# branches never see each other's spans.
+_current_span: ContextVar[Optional[str]] = ContextVar("trace_current_span", default=None)
+
+# A queued event: (event_type, payload). Plain tuples rather than model or
+# dataclass instances - they are the smallest, fastest carrier, and are
+# exactly what batch callbacks receive.
+QueuedEvent = Tuple[str, Dict[str, Any]]
+
+# Stand-in for omitted allocations/metrics/details; shared by every event, never mutate
+_EMPTY: Dict[str, Any] = {}
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") for the last second formatted
+_iso_second_cache: Tuple[int, str] = (-1, "")
+
+
+def utc_iso_from_ns(ns: int) -> str:
+    """
+    Format a time.time_ns() value as an ISO-8601 UTC string.
+
+    Same output as datetime.isoformat(), but the date/time prefix is only
+    formatted once per second.
+    """
+    global _iso_second_cache
+    sec, rem = divmod(ns, 1_000_000_000)
+    cached_sec, prefix = _iso_second_cache
+    if sec != cached_sec:
+        prefix = datetime.fromtimestamp(sec, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+        _iso_second_cache = (sec, prefix)
+
+    micros = rem // 1000
+    if micros:
+        return f"{prefix}.{micros:06d}+00:00"
+    return f"{prefix}+00:00"
+
+
+def utc_iso_now() -> str:
+    """Current UTC time as an ISO-8601 string."""
+    return utc_iso_from_ns(time.time_ns())
+
+
+def _decision_payload(
+    decision_type: str,
+    reason: str,
+    confidence: float,
+    inputs_considered: Optional[List[str]] = None,
+    alternatives: Optional[List[str]] = None,
+    **extras: Any,
+) -> Dict[str, Any]:
+    """
+    Build an orchestrator.decision payload.
+
+    Extras are passed by their payload (camelCase) names and only included
+    when set.
+    """
+    payload = {
+        "decisionType": decision_type,
+        "reason": reason,
+        "confidence": confidence,
+        "inputsConsidered": inputs_considered or [],
+        "alternatives": alternatives or [],
+    }
+    payload.update((key, value) for key, value in extras.items() if value)
+    return payload
 
 
 class TraceEmitter:
@@ -30,6 +124,18 @@ class TraceEmitter:
     - branch.fork / branch.join: Parallel execution
     - repair.started / repair.ended: Constraint repair loops
     - portfolio.update: Portfolio allocation updates
+
+    Events are queued and delivered in order by a background task, which
+    hands everything queued since its last delivery to the batch callback
+    at once. Call flush() to wait for delivery and aclose() when done.
+
+    The queue is bounded (TRACE_QUEUE_MAXSIZE) so a slow sink can't grow it
+    without limit. With drop_policy="block" producers wait for room; with
+    "drop_oldest" the oldest undelivered event is discarded instead.
+
+    Payloads hold references to the dicts/lists passed in (allocations,
+    metrics, details, ...) rather than copies, and are delivered after the
+    emit call returns, so callers must not mutate them afterwards.
     """
 
     def __init__(
@@ -37,39 +143,151 @@ class TraceEmitter:
         run_id: str,
         event_callback: Callable,
         trace_id: Optional[str] = None,
+        batch_callback: Optional[Callable] = None,
+        drop_policy: str = "block",
     ):
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(f"drop_policy must be one of {DROP_POLICIES}")
+
         self.run_id = run_id
-        self.trace_id = trace_id or f"trace-{uuid.uuid4().hex[:8]}"
+        self.trace_id = trace_id or short_id("trace")
         self.event_callback = event_callback
-        self._span_stack: List[str] = []
-        self._current_span_id: Optional[str] = None
+        self.batch_callback = batch_callback
+        # Checked first by every emit_* method, so disabled tracing builds no payloads
+        self._emit_enabled = event_callback is not None
+        # span_id -> (context token, parent span ID) for spans not yet ended
+        self._open_spans: Dict[str, Tuple[Token, Optional[str]]] = {}
+        self._queue: Optional["asyncio.Queue[Optional[QueuedEvent]]"] = None
+        self._drainer: Optional[asyncio.Task] = None
+        # (policy, policySummary) from the last emit_plan
+        self._policy_summary: Optional[Tuple[InvestorPolicyStatement, Dict[str, Any]]] = None
+        self.drop_policy = drop_policy
+        self.dropped_events = 0
 
     def _generate_span_id(self) -> str:
         """Generate a unique span ID."""
-        return f"span-{uuid.uuid4().hex[:8]}"
+        return short_id("span")
 
     async def _emit(self, kind: str, message: str, payload: Dict[str, Any]):
-        """Emit an event through the callback."""
-        if self.event_callback:
-            event = {
-                "run_id": self.run_id,
-                "kind": kind,
-                "message": message,
-                "ts": datetime.now(timezone.utc).isoformat(),
-                "payload": {
-                    "traceId": self.trace_id,
-                    "spanId": self._current_span_id,
-                    **payload,
-                },
-            }
-            await self.event_callback(event_type=kind, payload=event["payload"])
-
-            logger.debug(
-                "trace_event_emitted",
-                kind=kind,
-                message=message[:50],
+        """
+        Queue an event for delivery through the callback.
+
+        Only (kind, payload) is delivered; the sink wraps it in its own
+        envelope (timestamp, sequence) and serializes it once on publish.
+        """
+        if self._emit_enabled:
+            await self.enqueue(kind, {
+                "traceId": self.trace_id,
+                "spanId": _current_span.get(),
+                **payload,
+            })
+
+            if _stdlib_logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "trace_event_emitted",
+                    kind=kind,
+                    message=message[:50],
+                )
+
+    # =========================================================================
+    # DELIVERY
+    # =========================================================================
+
+    async def enqueue(self, event_type: str, payload: Dict[str, Any]):
+        """
+        Queue an already-built event for delivery.
+
+        Used by the engine for its own events, so they reach the sink in
+        order with trace events.
+        """
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=TRACE_QUEUE_MAXSIZE)
+            self._drainer = asyncio.create_task(self._drain())
+
+        queue = self._queue
+        if queue.full():
+            if self.drop_policy == "block":
+                await queue.put((event_type, payload))
+                return
+            queue.get_nowait()
+            queue.task_done()
+            self.dropped_events += 1
+        queue.put_nowait((event_type, payload))
+
+    async def _drain(self):
+        """
+        Background delivery loop.
+
+        Takes every event queued since the last delivery (up to
+        TRACE_BATCH_MAX_EVENTS) and delivers them together. Stops at the
+        None sentinel.
+        """
+        queue = self._queue
+        stopping = False
+
+        while not stopping:
+            batch = [await queue.get()]
+            if TRACE_BATCH_LINGER and batch[0] is not None:
+                await asyncio.sleep(TRACE_BATCH_LINGER)
+            while not queue.empty() and len(batch) < TRACE_BATCH_MAX_EVENTS:
+                batch.append(queue.get_nowait())
+
+            if batch[-1] is None:
+                stopping = True
+                batch.pop()
+
+            try:
+                if batch:
+                    await self.emit_batch(batch)
+            except Exception as e:
+                logger.warning(
+                    "trace_batch_delivery_failed",
+                    run_id=self.run_id,
+                    event_count=len(batch),
+                    error=str(e),
+                )
+            finally:
+                for _ in range(len(batch) + stopping):
+                    queue.task_done()
+
+            # Let producers run before taking the next batch
+            await asyncio.sleep(0)
+
+    async def flush(self):
+        """Wait until every queued event has been delivered."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def aclose(self):
+        """Deliver remaining events and stop the background task."""
+        if self._drainer is None:
+            return
+
+        await self._queue.put(None)
+        await self._drainer
+        self._queue = None
+        self._drainer = None
+
+        if self.dropped_events:
+            logger.warning(
+                "trace_events_dropped",
+                run_id=self.run_id,
+                dropped=self.dropped_events,
             )
 
+    async def emit_batch(self, events: List[QueuedEvent]):
+        """
+        Deliver (event_type, payload) pairs with a single batch callback call.
+
+        Falls back to one event_callback call per event when no batch
+        callback is configured.
+        """
+        if self.batch_callback:
+            await self.batch_callback(events)
+        elif self.event_callback:
+            for event_type, payload in events:
+                await self.event_callback(event_type=event_type, payload=payload)
+
     # =========================================================================
     # PLAN EVENTS
     # =========================================================================
@@ -81,6 +299,9 @@ class TraceEmitter:
         excluded_agents: List[AgentSelectionResult],
     ):
         """Emit the initial execution plan."""
+        if not self._emit_enabled:
+            return
+
         payload = {
             "selectedAgents": [
                 {
@@ -99,14 +320,7 @@ class TraceEmitter:
                 }
                 for a in excluded_agents
             ],
-            "policySummary": {
-                "riskTolerance": policy.risk_appetite.risk_tolerance,
-                "maxVolatility": policy.risk_appetite.max_volatility,
-                "maxDrawdown": policy.risk_appetite.max_drawdown,
-                "esgEnabled": policy.preferences.esg_focus,
-                "themes": policy.preferences.preferred_themes,
-                "targetReturn": policy.benchmark_settings.target_return,
-            },
+            "policySummary": self._get_policy_summary(policy),
             "estimatedAgentCount": len(selected_agents),
         }
 
@@ -116,6 +330,19 @@ class TraceEmitter:
             payload,
         )
 
+    def _get_policy_summary(self, policy: InvestorPolicyStatement) -> Dict[str, Any]:
+        """Build the plan's policy summary, reusing it while the policy is unchanged."""
+        if self._policy_summary is None or self._policy_summary[0] is not policy:
+            self._policy_summary = (policy, {
+                "riskTolerance": policy.risk_appetite.risk_tolerance,
+                "maxVolatility": policy.risk_appetite.max_volatility,
+                "maxDrawdown": policy.risk_appetite.max_drawdown,
+                "esgEnabled": policy.preferences.esg_focus,
+                "themes": policy.preferences.preferred_themes,
+                "targetReturn": policy.benchmark_settings.target_return,
+            })
+        return self._policy_summary[1]
+
     # =========================================================================
     # DECISION EVENTS
     # =========================================================================
@@ -151,27 +378,22 @@ class TraceEmitter:
         - checkpoint: Workflow checkpoint saved
         - commit: Final portfolio committed
         """
-        payload = {
-            "decisionType": decision_type,
-            "reason": reason,
-            "confidence": confidence,
-            "inputsConsidered": inputs_considered or [],
-            "alternatives": alternatives or [],
-        }
-
-        if added_agents:
-            payload["addedAgents"] = added_agents
-        if removed_agents:
-            payload["removedAgents"] = removed_agents
-        if affected_candidate_ids:
-            payload["affectedCandidateIds"] = affected_candidate_ids
-        if selected_candidate_id:
-            payload["selectedCandidateId"] = selected_candidate_id
-        if constraint_diff:
-            payload["constraintDiff"] = constraint_diff
-        if solver_switch:
-            payload["solverSwitch"] = solver_switch
-
+        if not self._emit_enabled:
+            return
+
+        payload = _decision_payload(
+            decision_type,
+            reason,
+            confidence,
+            inputs_considered,
+            alternatives,
+            addedAgents=added_agents,
+            removedAgents=removed_agents,
+            affectedCandidateIds=affected_candidate_ids,
+            selectedCandidateId=selected_candidate_id,
+            constraintDiff=constraint_diff,
+            solverSwitch=solver_switch,
+        )
         await self._emit("orchestrator.decision", reason, payload)
 
     async def emit_include_agent(
@@ -182,13 +404,16 @@ class TraceEmitter:
         inputs: List[str] = None,
     ):
         """Emit an agent inclusion decision."""
-        await self.emit_decision(
-            decision_type="include_agent",
-            reason=reason,
-            confidence=0.95,
-            inputs_considered=inputs or ["policy_analysis"],
-            added_agents=[{"id": agent_id, "name": agent_name, "reason": reason}],
-        )
+        if not self._emit_enabled:
+            return
+
+        await self._emit("orchestrator.decision", reason, _decision_payload(
+            "include_agent",
+            reason,
+            0.95,
+            inputs or ["policy_analysis"],
+            addedAgents=[{"id": agent_id, "name": agent_name, "reason": reason}],
+        ))
 
     async def emit_exclude_agent(
         self,
@@ -198,13 +423,16 @@ class TraceEmitter:
         inputs: List[str] = None,
     ):
         """Emit an agent exclusion decision."""
-        await self.emit_decision(
-            decision_type="exclude_agent",
-            reason=reason,
-            confidence=0.90,
-            inputs_considered=inputs or ["policy_analysis"],
-            removed_agents=[{"id": agent_id, "name": agent_name, "reason": reason}],
-        )
+        if not self._emit_enabled:
+            return
+
+        await self._emit("orchestrator.decision", reason, _decision_payload(
+            "exclude_agent",
+            reason,
+            0.90,
+            inputs or ["policy_analysis"],
+            removedAgents=[{"id": agent_id, "name": agent_name, "reason": reason}],
+        ))
 
     async def emit_inject_agent(
         self,
@@ -214,13 +442,16 @@ class TraceEmitter:
         trigger: str = None,
     ):
         """Emit a runtime agent injection decision."""
-        await self.emit_decision(
-            decision_type="inject_agent",
-            reason=reason,
-            confidence=0.85,
-            inputs_considered=[trigger or "runtime_condition"],
-            added_agents=[{"id": agent_id, "name": agent_name, "reason": reason}],
-        )
+        if not self._emit_enabled:
+            return
+
+        await self._emit("orchestrator.decision", reason, _decision_payload(
+            "inject_agent",
+            reason,
+            0.85,
+            [trigger or "runtime_condition"],
+            addedAgents=[{"id": agent_id, "name": agent_name, "reason": reason}],
+        ))
 
     async def emit_select_candidate(
         self,
@@ -229,17 +460,20 @@ class TraceEmitter:
         metrics: Dict[str, float] = None,
     ):
         """Emit a candidate selection decision."""
+        if not self._emit_enabled:
+            return
+
         inputs = []
         if metrics:
             inputs = [f"{k}={v:.2f}" for k, v in metrics.items()]
 
-        await self.emit_decision(
-            decision_type="select_candidate",
-            reason=reason,
-            confidence=0.95,
-            inputs_considered=inputs,
-            selected_candidate_id=candidate_id,
-        )
+        await self._emit("orchestrator.decision", reason, _decision_payload(
+            "select_candidate",
+            reason,
+            0.95,
+            inputs,
+            selectedCandidateId=candidate_id,
+        ))
 
     # =========================================================================
     # SPAN EVENTS (Agent Execution)
@@ -251,12 +485,18 @@ class TraceEmitter:
         agent_name: str,
         objective: str,
     ) -> str:
-        """Emit agent execution start. Returns span_id."""
+        """
+        Emit agent execution start. Returns span_id.
+
+        The span becomes the current span for this asyncio task only, so
+        branches run under asyncio.gather each nest their own spans.
+        """
         span_id = self._generate_span_id()
-        parent_span_id = self._current_span_id
+        parent_span_id = _current_span.get()
+        self._open_spans[span_id] = (_current_span.set(span_id), parent_span_id)
 
-        self._span_stack.append(span_id)
-        self._current_span_id = span_id
+        if not self._emit_enabled:
+            return span_id
 
         payload = {
             "spanId": span_id,
@@ -280,13 +520,22 @@ class TraceEmitter:
         agent_name: str,
         success: bool = True,
         result_summary: str = None,
+        span_id: str = None,
     ):
-        """Emit agent execution end."""
-        span_id = self._current_span_id
+        """Emit agent execution end for span_id (default: the task's current span)."""
+        span_id = span_id or _current_span.get()
+
+        opened = self._open_spans.pop(span_id, None)
+        if opened is not None:
+            token, parent_span_id = opened
+            try:
+                _current_span.reset(token)
+            except ValueError:
+                # Ended from a different task than it was started in
+                _current_span.set(parent_span_id)
 
-        if self._span_stack:
-            self._span_stack.pop()
-            self._current_span_id = self._span_stack[-1] if self._span_stack else None
+        if not self._emit_enabled:
+            return
 
         payload = {
             "spanId": span_id,
@@ -316,6 +565,9 @@ class TraceEmitter:
         context: Dict[str, Any] = None,
     ):
         """Emit control handover between agents."""
+        if not self._emit_enabled:
+            return
+
         payload = {
             "fromAgent": from_agent,
             "toAgent": to_agent,
@@ -342,6 +594,9 @@ class TraceEmitter:
         reason: str = None,
     ):
         """Emit parallel execution fork."""
+        if not self._emit_enabled:
+            return
+
         payload = {
             "branchType": "fork",
             "branches": branches,
@@ -360,6 +615,9 @@ class TraceEmitter:
         reason: str = None,
     ):
         """Emit parallel execution join."""
+        if not self._emit_enabled:
+            return
+
         payload = {
             "branchType": "join",
             "branches": branches,
@@ -384,12 +642,15 @@ class TraceEmitter:
         metrics: Dict[str, float] = None,
     ):
         """Emit portfolio candidate creation."""
+        if not self._emit_enabled:
+            return
+
         payload = {
             "candidateId": candidate_id,
             "solver": solver,
             "status": "pending",
-            "allocations": allocations or {},
-            "metrics": metrics or {},
+            "allocations": allocations or _EMPTY,
+            "metrics": metrics or _EMPTY,
         }
 
         await self._emit(
@@ -408,6 +669,9 @@ class TraceEmitter:
         selection_reason: str = None,
     ):
         """Emit portfolio candidate update."""
+        if not self._emit_enabled:
+            return
+
         payload = {
             "candidateId": candidate_id,
             "status": status,
@@ -439,11 +703,14 @@ class TraceEmitter:
         details: Dict[str, Any] = None,
     ):
         """Emit validation gate result."""
+        if not self._emit_enabled:
+            return
+
         payload = {
             "gateType": gate_type,
             "candidateId": candidate_id,
             "passed": passed,
-            "details": details or {},
+            "details": details or _EMPTY,
         }
 
         status = "passed" if passed else "failed"
@@ -467,13 +734,16 @@ class TraceEmitter:
         details: Dict[str, Any] = None,
     ):
         """Emit agent evidence."""
+        if not self._emit_enabled:
+            return
+
         payload = {
             "agentId": agent_id,
             "agentName": agent_name,
             "evidenceType": evidence_type,
             "summary": summary,
             "confidence": confidence,
-            "details": details or {},
+            "details": details or _EMPTY,
         }
 
         await self._emit(
@@ -494,6 +764,9 @@ class TraceEmitter:
         is_intermediate: bool = True,
     ):
         """Emit portfolio allocation update."""
+        if not self._emit_enabled:
+            return
+
         payload = {
             "allocations": allocations,
             "metrics": metrics,
@@ -3,21 +3,26 @@ Workflow definitions using Microsoft Agent Framework patterns.
 
 This module implements various orchestration patterns:
 - SequentialBuilder: For linear task execution
-- ConcurrentBuilder: For parallel/fan-out execution
+- ParallelAgentsExecutor: For parallel/fan-out execution (asyncio.gather)
 - HandoffBuilder: For agent-to-agent handoffs
 - MagenticBuilder: For LLM-powered dynamic orchestration
 - WorkflowBuilder: For custom DAG-based workflows
 """
 
-from typing import Any, Callable, Dict, List, Optional
-from datetime import datetime, timezone
+import os
+import time
+from contextlib import contextmanager
+from enum import StrEnum
+from functools import lru_cache
+from itertools import islice
+from weakref import WeakKeyDictionary
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Union
 
 from agent_framework import (
     ChatAgent,
     Workflow,
     WorkflowBuilder,
     SequentialBuilder,
-    ConcurrentBuilder,
     HandoffBuilder,
     MagenticBuilder,
     GroupChatBuilder,
@@ -26,6 +31,13 @@ from agent_framework import (
     handler,
     AgentExecutorResponse,
     ChatMessage,
+    AgentRunEvent,
+    ExecutorCompletedEvent,
+    ExecutorInvokedEvent,
+    WorkflowEvent,
+    WorkflowOutputEvent,
+    WorkflowRunResult,
+    WorkflowStartedEvent,
 )
 import structlog
 
@@ -36,22 +48,244 @@ from backend.agents import (
     create_optimizer_agent,
     create_compliance_agent,
 )
+from backend.agents.client import get_orchestrator_chat_client
 from backend.orchestrator.executors import (
     WorkflowState,
     PolicyParserExecutor,
     RiskReturnAggregatorExecutor,
+    ParallelAgentsExecutor,
     PortfolioFinalizerExecutor,
     ComplianceGateExecutor,
 )
+from backend.orchestrator.trace_emitter import utc_iso_now
 
 logger = structlog.get_logger()
 
+# Run the sequential workflow as a plain agent pipeline instead of a framework graph
+FAST_SEQUENTIAL = os.getenv("FAST_SEQUENTIAL", "false").lower() in ("1", "true", "yes")
+
+# Agent factories by role, used by _cached_agent
+_AGENT_FACTORIES: Dict[str, Callable[..., ChatAgent]] = {
+    "market": create_market_agent,
+    "risk": create_risk_agent,
+    "return": create_return_agent,
+    "optimizer": create_optimizer_agent,
+    "compliance": create_compliance_agent,
+}
+
+# Instructions for the handoff coordinator (a market agent that can delegate)
+HANDOFF_COORDINATOR_INSTRUCTIONS = """You are the Portfolio Advisor Coordinator.
+
+Your role is to:
+1. Understand the investor's policy and requirements
+2. Gather market data and build the investment universe
+3. Delegate to specialist agents when needed:
+   - Hand off to 'risk_agent' for risk analysis, VaR calculations, stress testing
+   - Hand off to 'return_agent' for return forecasting, theme evaluation
+   - Hand off to 'optimizer_agent' for portfolio optimization, rebalancing
+   - Hand off to 'compliance_agent' for regulatory checks, ESG verification
+
+When you need specialist analysis, use the appropriate handoff tool.
+After receiving specialist input, synthesize the information and continue.
+"""
+
+# Instructions for the Magentic manager (planning and agent selection)
+MAGENTIC_MANAGER_INSTRUCTIONS = """You are the Magentic Manager for portfolio optimization.
+Your role is to plan and coordinate the execution of specialist agents to optimize a portfolio.
+Create a plan, select appropriate agents for each step, and adapt based on results."""
+
+# Instructions for the group chat manager (speaker selection)
+GROUP_CHAT_MANAGER_INSTRUCTIONS = """You are the Group Chat Manager for portfolio optimization.
+Your role is to facilitate discussion between specialist agents and select who speaks next.
+Guide the conversation toward consensus on portfolio allocation decisions.
+Select speakers based on the current topic and who has relevant expertise."""
+
+
+# Phrases that signal agreement in a group chat (matched against lowercased text)
+CONSENSUS_SIGNALS = (
+    "agree with",
+    "consensus",
+    "aligned",
+    "recommend",
+    "final allocation",
+    "approved",
+)
+
+# Lowercased message text, computed once per message and dropped with it
+_LOWER_CACHE: "WeakKeyDictionary[ChatMessage, str]" = WeakKeyDictionary()
+
+
+def _lower_text(message: ChatMessage) -> str:
+    """
+    Lowercased text of a message, memoized per message object.
+
+    Termination predicates run after every turn over the same trailing
+    messages, so each message is lowercased once rather than on every check.
+    """
+    try:
+        return _LOWER_CACHE[message]
+    except KeyError:
+        text = (message.text or "").lower()
+        _LOWER_CACHE[message] = text
+        return text
+
+
+# Whether a message contains any consensus signal, decided once per message
+_CONSENSUS_HITS: "WeakKeyDictionary[ChatMessage, bool]" = WeakKeyDictionary()
+
+
+def _has_consensus_signal(message: ChatMessage) -> bool:
+    """
+    Whether the message contains any of CONSENSUS_SIGNALS, memoized per message.
+
+    A message stays in the consensus window for several turns; remembering
+    the result means its text is scanned for the signals only once.
+    """
+    try:
+        return _CONSENSUS_HITS[message]
+    except KeyError:
+        text = _lower_text(message)
+        hit = bool(text) and any(signal in text for signal in CONSENSUS_SIGNALS)
+        _CONSENSUS_HITS[message] = hit
+        return hit
+
+
+def _tail_texts(conversation: List[ChatMessage], count: int):
+    """
+    Lowercased text of the last `count` messages, newest first.
+
+    Walks the conversation from the end without slicing, so predicates
+    that stop at the first match never copy the tail. Messages without
+    text (tool calls and results) are skipped here, so predicate loops only
+    ever see non-empty strings. The predicates are shared by every workflow
+    built from a template, so they keep no per-conversation state of their own.
+    """
+    return filter(None, map(_lower_text, islice(reversed(conversation), count)))
+
+
+@lru_cache(maxsize=64)
+def _cached_agent(kind: str, name: str) -> ChatAgent:
+    """
+    Get a shared agent instance for (kind, name).
+
+    Agents hold no per-run state (threads are created per workflow run), so
+    workflows built from the same factory can share them instead of
+    rebuilding the agent, its tools and its instructions on every call.
+    Callers must not mutate the returned agent.
+
+    The "coordinator" kind is a market agent with handoff instructions; it
+    gets its own instance so the shared market agent is left untouched.
+    """
+    if kind == "coordinator":
+        return create_market_agent(name=name, instructions=HANDOFF_COORDINATOR_INSTRUCTIONS)
+
+    try:
+        factory = _AGENT_FACTORIES[kind]
+    except KeyError:
+        raise ValueError(f"Unknown agent kind: {kind}") from None
+    return factory(name=name)
+
+
+# Configured workflow builders keyed by workflow type and the arguments that
+# shape the graph (never the per-run name), see _build_from_template
+_WORKFLOW_TEMPLATES: Dict[tuple, Any] = {}
+
+
+@lru_cache(maxsize=1)
+def _orchestrator_client():
+    """Chat client shared by the Magentic and group chat manager agents."""
+    return get_orchestrator_chat_client()
+
+
+def clear_agent_cache():
+    """Drop cached agent instances and the workflow templates built from them (e.g. in tests)."""
+    _cached_agent.cache_clear()
+    _orchestrator_client.cache_clear()
+    _WORKFLOW_TEMPLATES.clear()
+
+
+@contextmanager
+def _log_workflow_build(kind: str, **fields):
+    """Log a single `<kind>_workflow_built` event with the build time once the block completes."""
+    start = time.perf_counter()
+    yield
+    logger.info(
+        f"{kind}_workflow_built",
+        duration_ms=round((time.perf_counter() - start) * 1000, 2),
+        **fields,
+    )
+
+
+def _build_from_template(key: tuple, configure: Callable[[], Any], name: str) -> Workflow:
+    """
+    Build a workflow named `name` from a cached, fully configured builder.
+
+    configure() runs once per key and returns a builder with participants,
+    edges and conditions already set; later calls only pay for build().
+    The name is applied to the built workflow rather than the builder, so
+    runs with per-run names share one template.
+    Every build() creates fresh executors, so workflows built from the same
+    template share agents but no run state and can run concurrently. Any
+    stateful executor or manager must therefore be registered through a
+    factory, never as an instance on the builder.
+    """
+    builder = _WORKFLOW_TEMPLATES.get(key)
+    if builder is None:
+        builder = _WORKFLOW_TEMPLATES[key] = configure()
+    workflow = builder.build()
+    workflow.name = name
+    return workflow
+
 
 # =============================================================================
 # SEQUENTIAL WORKFLOW
 # For simple linear execution: Market → Risk → Return → Optimizer → Compliance
 # =============================================================================
 
+class SequentialPipeline:
+    """
+    Minimal stand-in for a sequential Workflow: runs agents one after another.
+
+    Emits the workflow events the engine tracks (executor invoked/completed,
+    one AgentRunEvent per agent, the final conversation as output) but skips
+    graph construction and validation. Agents are run non-streaming, so no
+    AgentRunUpdateEvents are produced. Holds no per-run state, so one instance can
+    serve concurrent runs. Used when FAST_SEQUENTIAL is set; the
+    SequentialBuilder path remains the default for graph introspection.
+    """
+
+    def __init__(self, agents: Sequence[ChatAgent], name: str):
+        self.agents = tuple(agents)
+        self.name = name
+
+    async def run_stream(
+        self,
+        message: Union[str, ChatMessage, List[ChatMessage]],
+    ) -> AsyncIterator[WorkflowEvent]:
+        """Run each agent on the conversation so far, yielding workflow events."""
+        if isinstance(message, str):
+            conversation = [ChatMessage(role="user", text=message)]
+        elif isinstance(message, ChatMessage):
+            conversation = [message]
+        else:
+            conversation = list(message)
+
+        yield WorkflowStartedEvent()
+        for agent in self.agents:
+            executor_id = agent.name or agent.id
+            yield ExecutorInvokedEvent(executor_id)
+            response = await agent.run(conversation)
+            conversation.extend(response.messages)
+            yield AgentRunEvent(executor_id, response)
+            yield ExecutorCompletedEvent(executor_id)
+
+        yield WorkflowOutputEvent(conversation, executor_id=executor_id)
+
+    async def run(self, message: Union[str, ChatMessage, List[ChatMessage]]) -> WorkflowRunResult:
+        """Run to completion and return all events."""
+        return WorkflowRunResult([event async for event in self.run_stream(message)])
+
+
 def create_sequential_workflow(
     name: str = "sequential_portfolio_optimization"
 ) -> Workflow:
@@ -61,34 +295,41 @@ def create_sequential_workflow(
     Flow: Market Agent → Risk Agent → Return Agent → Optimizer Agent → Compliance Agent
 
     Each agent receives the conversation history from previous agents,
-    building up context as the workflow progresses.
+    building up context as the workflow progresses. With FAST_SEQUENTIAL
+    set this returns a SequentialPipeline instead of a framework Workflow.
     """
-    logger.info("creating_sequential_workflow", name=name)
-
-    # Create agents
-    market_agent = create_market_agent(name="market_agent")
-    risk_agent = create_risk_agent(name="risk_agent")
-    return_agent = create_return_agent(name="return_agent")
-    optimizer_agent = create_optimizer_agent(name="optimizer_agent")
-    compliance_agent = create_compliance_agent(name="compliance_agent")
-
-    workflow = (
-        SequentialBuilder()
-        .participants([
+    if FAST_SEQUENTIAL:
+        with _log_workflow_build("sequential", name=name, participant_count=5, fast=True):
+            workflow = SequentialPipeline(
+                [
+                    _cached_agent("market", "market_agent"),
+                    _cached_agent("risk", "risk_agent"),
+                    _cached_agent("return", "return_agent"),
+                    _cached_agent("optimizer", "optimizer_agent"),
+                    _cached_agent("compliance", "compliance_agent"),
+                ],
+                name=name,
+            )
+        return workflow
+
+    def configure():
+        # Create agents
+        market_agent = _cached_agent("market", "market_agent")
+        risk_agent = _cached_agent("risk", "risk_agent")
+        return_agent = _cached_agent("return", "return_agent")
+        optimizer_agent = _cached_agent("optimizer", "optimizer_agent")
+        compliance_agent = _cached_agent("compliance", "compliance_agent")
+
+        return SequentialBuilder().participants([
             market_agent,
             risk_agent,
             return_agent,
             optimizer_agent,
             compliance_agent,
         ])
-        .build()
-    )
 
-    logger.info(
-        "sequential_workflow_created",
-        name=name,
-        participant_count=5,
-    )
+    with _log_workflow_build("sequential", name=name, participant_count=5):
+        workflow = _build_from_template(("sequential",), configure, name)
 
     return workflow
 
@@ -98,63 +339,66 @@ def create_sequential_workflow(
 # For parallel execution with aggregation
 # =============================================================================
 
+# Aggregator that combines risk and return results (shared by every concurrent workflow)
+def _aggregate_risk_return(results: List[AgentExecutorResponse]) -> Dict[str, Any]:
+    """Aggregate parallel results from risk and return agents."""
+    timestamp = utc_iso_now()
+    agent_results = []
+    for result in results:
+        response = result.agent_run_response
+        messages = response.messages
+        agent_results.append({
+            "agent": response.agent_name or "unknown",
+            "response": messages[-1].text if messages else "",
+            "message_count": len(messages),
+        })
+
+    logger.info(
+        "concurrent_agents_completed",
+        agents=[(r["agent"], r["message_count"]) for r in agent_results],
+    )
+
+    return {
+        "timestamp": timestamp,
+        "agent_results": agent_results,
+        "analysis_count": len(results),
+    }
+
+
 def create_concurrent_risk_return_workflow(
     name: str = "concurrent_risk_return_analysis"
 ) -> Workflow:
     """
     Create a concurrent workflow where risk and return agents run in parallel.
 
-    Fan-out: Input → [Risk Agent, Return Agent] (parallel)
+    Fan-out: Input → [Risk Agent, Return Agent] (parallel, via asyncio.gather)
     Fan-in: Results aggregated into combined analysis
 
     This pattern is useful when analyses are independent and can run simultaneously.
     """
-    logger.info("creating_concurrent_workflow", name=name)
-
-    # Create agents for parallel execution
-    risk_agent = create_risk_agent(name="risk_agent")
-    return_agent = create_return_agent(name="return_agent")
-
-    # Custom aggregator that combines risk and return results
-    def aggregate_risk_return(results: List[AgentExecutorResponse]) -> Dict[str, Any]:
-        """Aggregate parallel results from risk and return agents."""
-        combined = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "agent_results": [],
-        }
-
-        for result in results:
-            agent_name = result.agent_run_response.agent_name or "unknown"
-            messages = result.agent_run_response.messages
-            last_message = messages[-1] if messages else None
-
-            combined["agent_results"].append({
-                "agent": agent_name,
-                "response": last_message.text if last_message else "",
-                "message_count": len(messages),
-            })
-
-            logger.info(
-                "concurrent_agent_completed",
-                agent=agent_name,
-                message_count=len(messages),
+    def configure():
+        # Create agents for parallel execution
+        risk_agent = _cached_agent("risk", "risk_agent")
+        return_agent = _cached_agent("return", "return_agent")
+
+        # Both agents run inside one executor via asyncio.gather, so the step takes
+        # as long as the slower agent regardless of how the runner schedules edges.
+        # Registered as a factory so every build() gets its own executor
+        return (
+            WorkflowBuilder()
+            .register_executor(
+                lambda: ParallelAgentsExecutor(
+                    agents=[risk_agent, return_agent],
+                    aggregator=_aggregate_risk_return,
+                    id="risk_return_fan_out",
+                ),
+                name="RiskReturnFanOut",
             )
+            .set_start_executor("RiskReturnFanOut")
+        )
 
-        combined["analysis_count"] = len(results)
-        return combined
-
-    workflow = (
-        ConcurrentBuilder()
-        .participants([risk_agent, return_agent])
-        .with_aggregator(aggregate_risk_return)
-        .build()
-    )
-
-    logger.info(
-        "concurrent_workflow_created",
-        name=name,
-        participant_count=2,
-    )
+    with _log_workflow_build("concurrent", name=name, participant_count=2):
+        workflow = _build_from_template(("concurrent",), configure, name)
 
     return workflow
 
@@ -164,6 +408,21 @@ def create_concurrent_risk_return_workflow(
 # For coordinator-based delegation to specialists
 # =============================================================================
 
+# Handoff termination condition - complete after optimization and compliance
+def _handoff_should_terminate(conversation: List[ChatMessage]) -> bool:
+    """Terminate when we have both optimization and compliance results."""
+    if len(conversation) <= 10:
+        return False
+
+    has_portfolio = has_result = False
+    for text in _tail_texts(conversation, 5):
+        has_portfolio = has_portfolio or "portfolio" in text
+        has_result = has_result or "compliant" in text or "allocation" in text
+        if has_portfolio and has_result:
+            return True
+    return False
+
+
 def create_handoff_workflow(
     name: str = "handoff_portfolio_advisor",
     interaction_mode: str = "autonomous"
@@ -181,66 +440,38 @@ def create_handoff_workflow(
         name: Workflow name
         interaction_mode: "autonomous" or "human_in_loop"
     """
-    logger.info("creating_handoff_workflow", name=name, mode=interaction_mode)
-
-    # Create coordinator - the market agent serves as the entry point
-    coordinator = create_market_agent(name="coordinator_agent")
-
-    # Update coordinator instructions to understand handoff capabilities
-    coordinator_instructions = """You are the Portfolio Advisor Coordinator.
-
-Your role is to:
-1. Understand the investor's policy and requirements
-2. Gather market data and build the investment universe
-3. Delegate to specialist agents when needed:
-   - Hand off to 'risk_agent' for risk analysis, VaR calculations, stress testing
-   - Hand off to 'return_agent' for return forecasting, theme evaluation
-   - Hand off to 'optimizer_agent' for portfolio optimization, rebalancing
-   - Hand off to 'compliance_agent' for regulatory checks, ESG verification
-
-When you need specialist analysis, use the appropriate handoff tool.
-After receiving specialist input, synthesize the information and continue.
-"""
-    coordinator._instructions = coordinator_instructions
-
-    # Create specialist agents
-    risk_agent = create_risk_agent(name="risk_agent")
-    return_agent = create_return_agent(name="return_agent")
-    optimizer_agent = create_optimizer_agent(name="optimizer_agent")
-    compliance_agent = create_compliance_agent(name="compliance_agent")
-
-    # Build handoff workflow
-    builder = HandoffBuilder(
-        name=name,
-        participants=[coordinator, risk_agent, return_agent, optimizer_agent, compliance_agent],
-    ).set_coordinator(coordinator)
-
-    # Set interaction mode
-    if interaction_mode == "autonomous":
-        builder = builder.with_interaction_mode("autonomous")
-    else:
-        builder = builder.with_interaction_mode("human_in_loop")
-
-    # Add termination condition - complete after optimization and compliance
-    def should_terminate(conversation: List[ChatMessage]) -> bool:
-        """Terminate when we have both optimization and compliance results."""
-        text = " ".join(m.text or "" for m in conversation[-5:]).lower()
-        return (
-            "portfolio" in text and
-            ("compliant" in text or "allocation" in text) and
-            len(conversation) > 10
-        )
-
-    builder = builder.with_termination_condition(should_terminate)
-
-    workflow = builder.build()
-
-    logger.info(
-        "handoff_workflow_created",
+    def configure():
+        # Create coordinator - a market agent with handoff instructions serves as the entry point
+        coordinator = _cached_agent("coordinator", "coordinator_agent")
+
+        # Create specialist agents
+        risk_agent = _cached_agent("risk", "risk_agent")
+        return_agent = _cached_agent("return", "return_agent")
+        optimizer_agent = _cached_agent("optimizer", "optimizer_agent")
+        compliance_agent = _cached_agent("compliance", "compliance_agent")
+
+        # Build handoff workflow
+        builder = HandoffBuilder(
+            participants=[coordinator, risk_agent, return_agent, optimizer_agent, compliance_agent],
+        ).set_coordinator(coordinator)
+
+        # Set interaction mode
+        if interaction_mode == "autonomous":
+            builder = builder.with_interaction_mode("autonomous")
+        else:
+            builder = builder.with_interaction_mode("human_in_loop")
+
+        # Add termination condition - complete after optimization and compliance
+        return builder.with_termination_condition(_handoff_should_terminate)
+
+    with _log_workflow_build(
+        "handoff",
         name=name,
+        mode=interaction_mode,
         coordinator="coordinator_agent",
         specialist_count=4,
-    )
+    ):
+        workflow = _build_from_template(("handoff", interaction_mode), configure, name)
 
     return workflow
 
@@ -250,6 +481,19 @@ After receiving specialist input, synthesize the information and continue.
 # For LLM-powered dynamic orchestration with planning
 # =============================================================================
 
+def _create_magentic_manager_agent() -> ChatAgent:
+    """
+    Create a Magentic manager agent.
+
+    Uses the orchestrator deployment (gpt-5-mini) for better planning capabilities.
+    """
+    return ChatAgent(
+        chat_client=_orchestrator_client(),
+        name="magentic_manager",
+        instructions=MAGENTIC_MANAGER_INSTRUCTIONS,
+    )
+
+
 def create_magentic_workflow(
     name: str = "magentic_portfolio_optimization",
     max_rounds: int = 15,
@@ -272,56 +516,41 @@ def create_magentic_workflow(
         max_rounds: Maximum orchestration rounds
         enable_plan_review: Whether to pause for human plan review
     """
-    logger.info(
-        "creating_magentic_workflow",
-        name=name,
-        max_rounds=max_rounds,
-        plan_review=enable_plan_review,
-    )
-
-    # Create specialized agents
-    market_agent = create_market_agent(name="market_data_specialist")
-    risk_agent = create_risk_agent(name="risk_analyst")
-    return_agent = create_return_agent(name="return_forecaster")
-    optimizer_agent = create_optimizer_agent(name="portfolio_optimizer")
-    compliance_agent = create_compliance_agent(name="compliance_officer")
-
-    # Create a manager agent for orchestrating the workflow
-    # Uses orchestrator deployment (gpt-5-mini) for better planning capabilities
-    from backend.agents.client import get_orchestrator_chat_client
-    manager_agent = ChatAgent(
-        chat_client=get_orchestrator_chat_client(),
-        name="magentic_manager",
-        instructions="""You are the Magentic Manager for portfolio optimization.
-Your role is to plan and coordinate the execution of specialist agents to optimize a portfolio.
-Create a plan, select appropriate agents for each step, and adapt based on results.""",
-    )
-
-    # Build Magentic workflow
-    builder = (
-        MagenticBuilder()
-        .participants(
-            market=market_agent,
-            risk=risk_agent,
-            returns=return_agent,
-            optimizer=optimizer_agent,
-            compliance=compliance_agent,
-        )
-        .with_standard_manager(
-            agent=manager_agent,
-            max_round_count=max_rounds,
-            max_stall_count=3,
+    def configure():
+        # Create specialized agents
+        market_agent = _cached_agent("market", "market_data_specialist")
+        risk_agent = _cached_agent("risk", "risk_analyst")
+        return_agent = _cached_agent("return", "return_forecaster")
+        optimizer_agent = _cached_agent("optimizer", "portfolio_optimizer")
+        compliance_agent = _cached_agent("compliance", "compliance_officer")
+
+        # Build Magentic workflow
+        return (
+            MagenticBuilder()
+            .participants(
+                market=market_agent,
+                risk=risk_agent,
+                returns=return_agent,
+                optimizer=optimizer_agent,
+                compliance=compliance_agent,
+            )
+            # The manager (and its task ledger) is created per build() from the
+            # factory, so concurrent runs never share a plan or facts
+            .with_standard_manager(
+                agent_factory=_create_magentic_manager_agent,
+                max_round_count=max_rounds,
+                max_stall_count=3,
+            )
         )
-    )
-
-    workflow = builder.build()
 
-    logger.info(
-        "magentic_workflow_created",
+    with _log_workflow_build(
+        "magentic",
         name=name,
         participant_count=5,
         max_rounds=max_rounds,
-    )
+        plan_review=enable_plan_review,
+    ):
+        workflow = _build_from_template(("magentic", max_rounds, enable_plan_review), configure, name)
 
     return workflow
 
@@ -376,34 +605,33 @@ def create_dag_portfolio_workflow(
                       │ Finalizer   │
                       └─────────────┘
     """
-    logger.info("creating_dag_workflow", name=name)
-
-    # Build the DAG workflow as a chain with sequential flow
-    # Note: True fan-out/fan-in requires compatible message types between agents
-    # For simplicity, we use a chain: Market → Risk → Return → Optimizer → Compliance
-    workflow = (
-        WorkflowBuilder(name=name, max_iterations=50)
-
-        # Register agents (lazy initialization for proper workflow sharing)
-        .register_agent(lambda: create_market_agent(name="market_agent"), name="MarketAgent")
-        .register_agent(lambda: create_risk_agent(name="risk_agent"), name="RiskAgent")
-        .register_agent(lambda: create_return_agent(name="return_agent"), name="ReturnAgent")
-        .register_agent(lambda: create_optimizer_agent(name="optimizer_agent"), name="OptimizerAgent")
-        .register_agent(lambda: create_compliance_agent(name="compliance_agent"), name="ComplianceAgent")
-
-        # Set start point and chain: Market → Risk → Return → Optimizer → Compliance
-        .set_start_executor("MarketAgent")
-        .add_chain(["MarketAgent", "RiskAgent", "ReturnAgent", "OptimizerAgent", "ComplianceAgent"])
-
-        .build()
-    )
+    # Market → [Risk, Return] → Optimizer → Compliance. The risk and return agents
+    # run inside one executor via asyncio.gather, which takes the market agent's
+    # conversation and forwards it with both replies, so no message type adapter
+    # is needed between the agents
+    def configure():
+        return (
+            WorkflowBuilder(max_iterations=50)
+
+            # Register agents (lazy initialization for proper workflow sharing)
+            .register_agent(lambda: _cached_agent("market", "market_agent"), name="MarketAgent")
+            .register_executor(
+                lambda: ParallelAgentsExecutor(
+                    agents=[_cached_agent("risk", "risk_agent"), _cached_agent("return", "return_agent")],
+                    id="risk_return_fan_out",
+                ),
+                name="RiskReturnFanOut",
+            )
+            .register_agent(lambda: _cached_agent("optimizer", "optimizer_agent"), name="OptimizerAgent")
+            .register_agent(lambda: _cached_agent("compliance", "compliance_agent"), name="ComplianceAgent")
 
-    logger.info(
-        "dag_workflow_created",
-        name=name,
-        executor_count=3,
-        agent_count=5,
-    )
+            # Set start point and chain: Market → Risk/Return (parallel) → Optimizer → Compliance
+            .set_start_executor("MarketAgent")
+            .add_chain(["MarketAgent", "RiskReturnFanOut", "OptimizerAgent", "ComplianceAgent"])
+        )
+
+    with _log_workflow_build("dag", name=name, executor_count=3, agent_count=5):
+        workflow = _build_from_template(("dag",), configure, name)
 
     return workflow
 
@@ -413,6 +641,16 @@ def create_dag_portfolio_workflow(
 # For multi-agent consensus discussions and collaborative decision-making
 # =============================================================================
 
+# Group chat termination condition for consensus
+def _has_reached_consensus(conversation: List[ChatMessage]) -> bool:
+    """Check if agents have reached consensus."""
+    if len(conversation) < 6:
+        return False
+
+    # Look for consensus signals in recent messages
+    return any(map(_has_consensus_signal, islice(reversed(conversation), 4)))
+
+
 def create_group_chat_workflow(
     name: str = "group_chat_portfolio_consensus",
     max_rounds: int = 10,
@@ -433,72 +671,36 @@ def create_group_chat_workflow(
         name: Workflow name
         max_rounds: Maximum rounds of discussion before concluding
     """
-    logger.info(
-        "creating_group_chat_workflow",
-        name=name,
-        max_rounds=max_rounds,
-    )
-
-    # Create agents for the discussion
-    risk_agent = create_risk_agent(name="risk_advisor")
-    return_agent = create_return_agent(name="return_advisor")
-    optimizer_agent = create_optimizer_agent(name="portfolio_architect")
-    compliance_agent = create_compliance_agent(name="compliance_reviewer")
-
-    # Define termination condition for consensus
-    def has_reached_consensus(conversation: List[ChatMessage]) -> bool:
-        """Check if agents have reached consensus."""
-        if len(conversation) < 6:
-            return False
-
-        # Look for consensus signals in recent messages
-        recent_text = " ".join(
-            m.text or "" for m in conversation[-4:]
-        ).lower()
-
-        consensus_signals = [
-            "agree with",
-            "consensus",
-            "aligned",
-            "recommend",
-            "final allocation",
-            "approved",
-        ]
-
-        return any(signal in recent_text for signal in consensus_signals)
-
-    # Create a manager agent for the group chat
-    # Uses orchestrator deployment (gpt-5-mini) for better coordination capabilities
-    from backend.agents.client import get_orchestrator_chat_client
-    manager_agent = ChatAgent(
-        chat_client=get_orchestrator_chat_client(),
-        name="group_chat_manager",
-        instructions="""You are the Group Chat Manager for portfolio optimization.
-Your role is to facilitate discussion between specialist agents and select who speaks next.
-Guide the conversation toward consensus on portfolio allocation decisions.
-Select speakers based on the current topic and who has relevant expertise.""",
-    )
+    def configure():
+        # Create agents for the discussion
+        risk_agent = _cached_agent("risk", "risk_advisor")
+        return_agent = _cached_agent("return", "return_advisor")
+        optimizer_agent = _cached_agent("optimizer", "portfolio_architect")
+        compliance_agent = _cached_agent("compliance", "compliance_reviewer")
+
+        # Create a manager agent for the group chat
+        # Uses orchestrator deployment (gpt-5-mini) for better coordination capabilities
+        manager_agent = ChatAgent(
+            chat_client=_orchestrator_client(),
+            name="group_chat_manager",
+            instructions=GROUP_CHAT_MANAGER_INSTRUCTIONS,
+        )
 
-    workflow = (
-        GroupChatBuilder()
-        .participants([
-            risk_agent,
-            return_agent,
-            optimizer_agent,
-            compliance_agent,
-        ])
-        .set_manager(manager_agent)
-        .with_max_rounds(max_rounds)
-        .with_termination_condition(has_reached_consensus)
-        .build()
-    )
+        return (
+            GroupChatBuilder()
+            .participants([
+                risk_agent,
+                return_agent,
+                optimizer_agent,
+                compliance_agent,
+            ])
+            .set_manager(manager_agent)
+            .with_max_rounds(max_rounds)
+            .with_termination_condition(_has_reached_consensus)
+        )
 
-    logger.info(
-        "group_chat_workflow_created",
-        name=name,
-        participant_count=4,
-        max_rounds=max_rounds,
-    )
+    with _log_workflow_build("group_chat", name=name, participant_count=4, max_rounds=max_rounds):
+        workflow = _build_from_template(("group_chat", max_rounds), configure, name)
 
     return workflow
 
@@ -508,8 +710,8 @@ Select speakers based on the current topic and who has relevant expertise.""",
 # Unified interface for creating workflows
 # =============================================================================
 
-class WorkflowType:
-    """Available workflow types."""
+class WorkflowType(StrEnum):
+    """Available workflow types (members compare and hash equal to their string values)."""
     SEQUENTIAL = "sequential"
     CONCURRENT = "concurrent"
     HANDOFF = "handoff"
@@ -518,6 +720,27 @@ class WorkflowType:
     GROUP_CHAT = "group_chat"  # Multi-agent consensus discussions
 
 
+# Factory per workflow type
+_WORKFLOW_FACTORIES: Dict[WorkflowType, Callable[..., Workflow]] = {
+    WorkflowType.SEQUENTIAL: create_sequential_workflow,
+    WorkflowType.CONCURRENT: create_concurrent_risk_return_workflow,
+    WorkflowType.HANDOFF: create_handoff_workflow,
+    WorkflowType.MAGENTIC: create_magentic_workflow,
+    WorkflowType.DAG: create_dag_portfolio_workflow,
+    WorkflowType.GROUP_CHAT: create_group_chat_workflow,
+}
+
+# Factory arguments per workflow type; the keys are also the kwargs create_workflow accepts
+_WORKFLOW_DEFAULTS: Dict[WorkflowType, Dict[str, Any]] = {
+    WorkflowType.SEQUENTIAL: {"name": "sequential_workflow"},
+    WorkflowType.CONCURRENT: {"name": "concurrent_workflow"},
+    WorkflowType.HANDOFF: {"name": "handoff_workflow", "interaction_mode": "autonomous"},
+    WorkflowType.MAGENTIC: {"name": "magentic_workflow", "max_rounds": 15, "enable_plan_review": False},
+    WorkflowType.DAG: {"name": "dag_workflow"},
+    WorkflowType.GROUP_CHAT: {"name": "group_chat_workflow", "max_rounds": 10},
+}
+
+
 def create_workflow(
     workflow_type: str,
     name: Optional[str] = None,
@@ -527,9 +750,10 @@ def create_workflow(
     Factory function to create workflows of different types.
 
     Args:
-        workflow_type: One of WorkflowType constants
+        workflow_type: A WorkflowType member or its string value
         name: Optional workflow name
         **kwargs: Additional arguments for specific workflow types
+            (arguments the workflow type doesn't take are ignored)
 
     Returns:
         Configured Workflow instance
@@ -540,33 +764,12 @@ def create_workflow(
         name=name,
     )
 
-    if workflow_type == WorkflowType.SEQUENTIAL:
-        return create_sequential_workflow(name=name or "sequential_workflow")
-
-    elif workflow_type == WorkflowType.CONCURRENT:
-        return create_concurrent_risk_return_workflow(name=name or "concurrent_workflow")
-
-    elif workflow_type == WorkflowType.HANDOFF:
-        return create_handoff_workflow(
-            name=name or "handoff_workflow",
-            interaction_mode=kwargs.get("interaction_mode", "autonomous"),
-        )
-
-    elif workflow_type == WorkflowType.MAGENTIC:
-        return create_magentic_workflow(
-            name=name or "magentic_workflow",
-            max_rounds=kwargs.get("max_rounds", 15),
-            enable_plan_review=kwargs.get("enable_plan_review", False),
-        )
-
-    elif workflow_type == WorkflowType.DAG:
-        return create_dag_portfolio_workflow(name=name or "dag_workflow")
+    defaults = _WORKFLOW_DEFAULTS.get(workflow_type)
+    if defaults is None:
+        raise ValueError(f"Unknown workflow type: {workflow_type}")
 
-    elif workflow_type == WorkflowType.GROUP_CHAT:
-        return create_group_chat_workflow(
-            name=name or "group_chat_workflow",
-            max_rounds=kwargs.get("max_rounds", 10),
-        )
+    params = {**defaults, **{key: kwargs[key] for key in kwargs.keys() & defaults.keys()}}
+    if name:
+        params["name"] = name
 
-    else:
-        raise ValueError(f"Unknown workflow type: {workflow_type}")
+    return _WORKFLOW_FACTORIES[workflow_type](**params)
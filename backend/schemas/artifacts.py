@@ -5,10 +5,18 @@ All artifacts include data classification, lineage tracking, and audit metadata.
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, computed_field
+from functools import cached_property
+from operator import attrgetter
+from typing import Optional, List, Dict, Any, Sequence, Tuple, Type
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 import hashlib
 import json
+import os
+
+import msgpack
+
+# Artifact content hash: "blake2b" (msgpack-encoded) or "sha256" (legacy JSON-encoded)
+ARTIFACT_HASH_ALGORITHM = os.getenv("ARTIFACT_HASH_ALGORITHM", "blake2b").lower()
 
 
 class DataClassification(str, Enum):
@@ -18,11 +26,53 @@ class DataClassification(str, Enum):
     RESTRICTED = "restricted"
 
 
+def _canonical(value: Any) -> Any:
+    """Recursively sort dict keys so the packed bytes are deterministic."""
+    if isinstance(value, dict):
+        return {k: _canonical(value[k]) for k in sorted(value, key=str)}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    return value
+
+
+def _canonical_content(content: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Order a dumped artifact for hashing.
+
+    model_dump already emits model fields in declaration order, so only
+    free-form dict fields need their keys sorted. Top-level lists hold
+    nested models (FundInfo, Trade, ...) or scalars and are packed as-is,
+    which keeps large artifacts from being walked in Python.
+    """
+    return {
+        k: _canonical(v) if isinstance(v, dict) else v
+        for k, v in sorted(content.items())
+    }
+
+
+def to_columns(rows: Sequence[BaseModel], model: Type[BaseModel]) -> Dict[str, Tuple[Any, ...]]:
+    """
+    Transpose row models into one tuple per field (column-major).
+
+    Aggregates over a column (sum, max, Counter, ...) then run in C over a
+    flat tuple instead of a Python generator touching every row object.
+    """
+    names = list(model.model_fields)
+    if not rows:
+        return {name: () for name in names}
+    return dict(zip(names, zip(*map(attrgetter(*names), rows))))
+
+
 class ArtifactBase(BaseModel):
     """
     Base class for all workflow artifacts.
     Includes lineage, classification, and audit metadata.
+
+    Artifacts are immutable once created, so the content hash is computed
+    on first access and cached on the instance.
     """
+    model_config = ConfigDict(frozen=True)
+
     # Lineage
     artifact_id: str = Field(description="Unique artifact identifier")
     artifact_type: str = Field(description="Type of artifact")
@@ -41,12 +91,23 @@ class ArtifactBase(BaseModel):
     stage_id: str = Field(description="Stage that produced this artifact")
 
     @computed_field
-    @property
+    @cached_property
     def artifact_hash(self) -> str:
         """Compute deterministic hash of artifact content."""
         content = self.model_dump(exclude={"artifact_hash", "created_at"})
-        content_str = json.dumps(content, sort_keys=True, default=str)
-        return hashlib.sha256(content_str.encode()).hexdigest()[:16]
+        if ARTIFACT_HASH_ALGORITHM == "sha256":
+            content_str = json.dumps(content, sort_keys=True, default=str)
+            return hashlib.sha256(content_str.encode()).hexdigest()[:16]
+        packed = msgpack.packb(_canonical_content(content), default=str, use_bin_type=True)
+        return hashlib.blake2b(packed, digest_size=8).hexdigest()
+
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False):
+        """Copy the artifact, dropping cached values (e.g. the hash) if content changes."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            for key in copied.__dict__.keys() - type(copied).model_fields.keys():
+                del copied.__dict__[key]
+        return copied
 
 
 class MandateDSL(ArtifactBase):
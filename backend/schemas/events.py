@@ -6,7 +6,7 @@ Events are published to Redis Streams and consumed by the SSE endpoint.
 from datetime import datetime
 from enum import Enum
 from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 import uuid
 
 
@@ -124,8 +124,20 @@ class WorkflowEvent(BaseModel):
             datetime: lambda v: v.isoformat()
         }
 
+    # Raw JSON the event was parsed from (set by the event bus), reused for SSE
+    _sse_data: Optional[str] = PrivateAttr(default=None)
+
+    @classmethod
+    def from_stream_json(cls, data: str) -> "WorkflowEvent":
+        """Parse an event read from Redis, keeping the raw JSON for SSE transmission."""
+        event = cls.model_validate_json(data)
+        event._sse_data = data
+        return event
+
     def to_sse_data(self) -> str:
         """Format event for SSE transmission."""
+        if self._sse_data is not None:
+            return self._sse_data
         return self.model_dump_json()
 
 
@@ -5,6 +5,7 @@ Captures investor profile, risk appetite, constraints, and preferences.
 
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Optional, List, Dict, Any
 from pydantic import BaseModel, Field
 import uuid
@@ -161,15 +162,40 @@ class InvestorPolicyStatement(BaseModel):
 
     def summary(self) -> str:
         """Generate human-readable summary of the IPS."""
-        return (
-            f"IPS for {self.investor_profile.investor_type.value} investor | "
-            f"${self.investor_profile.portfolio_value:,.0f} portfolio | "
-            f"{self.risk_appetite.risk_tolerance.value} risk | "
-            f"Equity: {self.constraints.min_equity*100:.0f}-{self.constraints.max_equity*100:.0f}% | "
-            f"Benchmark: {self.benchmark_settings.benchmark}"
+        return _format_summary(
+            self.investor_profile.investor_type,
+            self.investor_profile.portfolio_value,
+            self.risk_appetite.risk_tolerance,
+            self.constraints.min_equity,
+            self.constraints.max_equity,
+            self.benchmark_settings.benchmark,
         )
 
 
+@lru_cache(maxsize=256)
+def _format_summary(
+    investor_type: InvestorType,
+    portfolio_value: float,
+    risk_tolerance: RiskTolerance,
+    min_equity: float,
+    max_equity: float,
+    benchmark: str,
+) -> str:
+    """
+    Format an IPS summary from the fields it depends on.
+
+    Keyed on the field values rather than the policy instance, so the cache
+    stays correct when a policy is edited and is shared by equal policies.
+    """
+    return (
+        f"IPS for {investor_type.value} investor | "
+        f"${portfolio_value:,.0f} portfolio | "
+        f"{risk_tolerance.value} risk | "
+        f"Equity: {min_equity*100:.0f}-{max_equity*100:.0f}% | "
+        f"Benchmark: {benchmark}"
+    )
+
+
 # Factory functions for common IPS templates
 def create_conservative_ips(portfolio_value: float = 1_000_000) -> InvestorPolicyStatement:
     """Create a conservative IPS template."""
@@ -5,6 +5,8 @@ Backend services for IC Autopilot.
 from .event_bus import EventBus, get_event_bus
 from .artifact_store import ArtifactStore, get_artifact_store
 from .run_store import RunStore, get_run_store
+from .admission import AdmissionController, get_admission_controller
+from .job_queue import get_job_pool, enqueue_job
 
 __all__ = [
     "EventBus",
@@ -13,4 +15,8 @@ __all__ = [
     "get_artifact_store",
     "RunStore",
     "get_run_store",
+    "AdmissionController",
+    "get_admission_controller",
+    "get_job_pool",
+    "enqueue_job",
 ]
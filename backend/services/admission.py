@@ -0,0 +1,116 @@
+"""
+Admission control for background workflow runs.
+
+Caps how many workflows execute concurrently in this process so a burst of
+run requests queues up instead of competing for DB, Redis and LLM quota.
+Uses an asyncio.Condition-guarded counter rather than a Semaphore so the
+limit can be resized at runtime.
+"""
+
+import asyncio
+import functools
+import os
+from contextlib import asynccontextmanager
+from typing import Optional
+import structlog
+
+logger = structlog.get_logger()
+
+# Max workflows running at once per API process
+MAX_CONCURRENT_RUNS = int(os.getenv("MAX_CONCURRENT_RUNS", "8"))
+
+
+class AdmissionController:
+    """
+    Counter + condition admission controller.
+
+    acquire() waits until active < limit, release() frees a slot and wakes
+    one waiter, resize() changes the limit and wakes all waiters.
+    """
+
+    def __init__(self, max_concurrent: int = MAX_CONCURRENT_RUNS):
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be >= 1")
+        self._active = 0
+        self._max = max_concurrent
+        self._waiting = 0
+        self._cond = asyncio.Condition()
+
+    @property
+    def active(self) -> int:
+        """Number of admitted runs."""
+        return self._active
+
+    @property
+    def waiting(self) -> int:
+        """Number of runs waiting for a slot."""
+        return self._waiting
+
+    @property
+    def max_concurrent(self) -> int:
+        """Current concurrency limit."""
+        return self._max
+
+    async def acquire(self):
+        """Wait for a free slot and take it."""
+        async with self._cond:
+            self._waiting += 1
+            try:
+                await self._cond.wait_for(lambda: self._active < self._max)
+            finally:
+                self._waiting -= 1
+            self._active += 1
+
+    async def release(self):
+        """Free a slot and wake one waiter."""
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify(1)
+
+    async def resize(self, max_concurrent: int):
+        """Change the concurrency limit. Waiters are re-checked against the new limit."""
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be >= 1")
+        async with self._cond:
+            old = self._max
+            self._max = max_concurrent
+            self._cond.notify_all()
+        logger.info("admission_limit_resized", old=old, new=max_concurrent)
+
+    @asynccontextmanager
+    async def slot(self):
+        """Hold a slot for the duration of the block."""
+        await self.acquire()
+        try:
+            yield
+        finally:
+            await self.release()
+
+    def stats(self) -> dict:
+        """Current controller state (for admin/debug endpoints)."""
+        return {
+            "active": self._active,
+            "waiting": self._waiting,
+            "max_concurrent": self._max,
+        }
+
+
+# Singleton instance
+_admission_controller: Optional[AdmissionController] = None
+
+
+def get_admission_controller() -> AdmissionController:
+    """Get or create the singleton AdmissionController instance."""
+    global _admission_controller
+    if _admission_controller is None:
+        _admission_controller = AdmissionController()
+    return _admission_controller
+
+
+def admitted(func):
+    """Decorator that runs an async function inside an admission slot."""
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        async with get_admission_controller().slot():
+            return await func(*args, **kwargs)
+    return wrapper
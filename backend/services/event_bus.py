@@ -8,7 +8,7 @@ import asyncio
 import json
 import os
 from datetime import datetime
-from typing import AsyncGenerator, Optional
+from typing import AsyncGenerator, List, Optional
 import redis.asyncio as redis
 from redis.asyncio.client import Redis
 import structlog
@@ -34,6 +34,8 @@ REDIS_DB = int(os.getenv("REDIS_DB", "0"))
 STREAM_PREFIX = "ic:events:"
 MAX_STREAM_LEN = 10000  # Max events per run stream
 HEARTBEAT_INTERVAL = 15  # Seconds
+STREAM_READ_COUNT = int(os.getenv("STREAM_READ_COUNT", "100"))  # Max events per XREAD
+STREAM_BLOCK_MS = int(os.getenv("STREAM_BLOCK_MS", "5000"))  # XREAD block timeout
 
 
 class EventBus:
@@ -87,24 +89,12 @@ class EventBus:
         Returns:
             Redis Stream message ID
         """
-        # Set sequence if not already set
-        if event.sequence == 0:
-            event.sequence = self._get_next_sequence(event.run_id)
-
         stream_key = self._stream_key(event.run_id)
 
-        # Serialize event
-        event_data = {
-            "data": event.model_dump_json(),
-            "event_id": event.event_id,
-            "kind": event.kind.value,
-            "ts": event.ts.isoformat(),
-        }
-
         # Add to stream with max length cap
         message_id = await self.redis.xadd(
             stream_key,
-            event_data,
+            self._serialize(event),
             maxlen=MAX_STREAM_LEN,
         )
 
@@ -118,22 +108,70 @@ class EventBus:
 
         return message_id
 
+    async def publish_many(self, events: List[WorkflowEvent]) -> List[str]:
+        """
+        Publish several events in one Redis round trip.
+
+        Events are appended in order, exactly as if publish() were called
+        for each of them.
+
+        Args:
+            events: WorkflowEvents to publish
+
+        Returns:
+            Redis Stream message IDs, in the same order
+        """
+        if not events:
+            return []
+
+        pipe = self.redis.pipeline(transaction=False)
+        for event in events:
+            pipe.xadd(
+                self._stream_key(event.run_id),
+                self._serialize(event),
+                maxlen=MAX_STREAM_LEN,
+            )
+        message_ids = await pipe.execute()
+
+        logger.debug(
+            "events_published",
+            run_id=events[0].run_id,
+            count=len(events),
+        )
+
+        return message_ids
+
+    def _serialize(self, event: WorkflowEvent) -> dict:
+        """Assign a sequence number if needed and build the stream entry."""
+        if event.sequence == 0:
+            event.sequence = self._get_next_sequence(event.run_id)
+
+        return {
+            "data": event.model_dump_json(),
+            "event_id": event.event_id,
+            "kind": event.kind.value,
+            "ts": event.ts.isoformat(),
+        }
+
     async def subscribe(
         self,
         run_id: str,
         last_event_id: Optional[str] = None,
         include_heartbeats: bool = True,
-    ) -> AsyncGenerator[WorkflowEvent, None]:
+    ) -> AsyncGenerator[list[WorkflowEvent], None]:
         """
         Subscribe to events for a run using Redis Streams.
 
+        Events are yielded in batches - everything returned by one XREAD call -
+        so consumers can write them out together instead of one at a time.
+
         Args:
             run_id: Run to subscribe to
             last_event_id: Resume from this event ID (for reconnection)
             include_heartbeats: Whether to yield heartbeat events
 
         Yields:
-            WorkflowEvent objects
+            Lists of WorkflowEvent objects (never empty)
         """
         stream_key = self._stream_key(run_id)
 
@@ -154,14 +192,17 @@ class EventBus:
 
         while True:
             try:
-                # Read from stream with blocking (5 second timeout)
+                # Read a batch from stream with blocking
                 messages = await self.redis.xread(
                     {stream_key: start_id},
-                    count=100,
-                    block=5000,  # 5 second block
+                    count=STREAM_READ_COUNT,
+                    block=STREAM_BLOCK_MS,
                 )
 
                 if messages:
+                    batch: list[WorkflowEvent] = []
+                    run_finished = False
+
                     for stream_name, stream_messages in messages:
                         for message_id, message_data in stream_messages:
                             # Update position for next read
@@ -170,24 +211,34 @@ class EventBus:
                             # Parse event
                             try:
                                 event_json = message_data.get("data", "{}")
-                                event = WorkflowEvent.model_validate_json(event_json)
-                                yield event
-
-                                # Check for run completion
-                                if event.kind in [EventKind.RUN_COMPLETED, EventKind.RUN_FAILED]:
-                                    logger.info("run_completed", run_id=run_id)
-                                    return
-
+                                event = WorkflowEvent.from_stream_json(event_json)
                             except Exception as e:
                                 logger.error("event_parse_error", error=str(e), data=message_data)
                                 continue
 
+                            batch.append(event)
+
+                            # Check for run completion
+                            if event.kind in [EventKind.RUN_COMPLETED, EventKind.RUN_FAILED]:
+                                run_finished = True
+                                break
+
+                        if run_finished:
+                            break
+
+                    if batch:
+                        yield batch
+
+                    if run_finished:
+                        logger.info("run_completed", run_id=run_id)
+                        return
+
                 # Send heartbeat if needed
                 if include_heartbeats:
                     now = datetime.utcnow()
                     if (now - last_heartbeat).total_seconds() >= HEARTBEAT_INTERVAL:
                         heartbeat_sequence += 1
-                        yield heartbeat_event(run_id, sequence=heartbeat_sequence)
+                        yield [heartbeat_event(run_id, sequence=heartbeat_sequence)]
                         last_heartbeat = now
 
             except asyncio.CancelledError:
@@ -223,7 +274,7 @@ class EventBus:
         for message_id, message_data in messages:
             try:
                 event_json = message_data.get("data", "{}")
-                event = WorkflowEvent.model_validate_json(event_json)
+                event = WorkflowEvent.from_stream_json(event_json)
                 events.append(event)
             except Exception as e:
                 logger.error("event_parse_error", error=str(e))
@@ -0,0 +1,77 @@
+"""
+Redis job queue for workflow execution (ARQ).
+
+When JOB_QUEUE_ENABLED is set, the API enqueues workflow runs here instead of
+running them as in-process BackgroundTasks. A separate worker process
+(`arq jobs.WorkerSettings`) consumes the queue and publishes progress to the
+same Redis event bus, so SSE streaming on the API side is unchanged.
+"""
+
+import os
+from typing import Any, Optional
+import structlog
+from arq import create_pool
+from arq.connections import ArqRedis, RedisSettings
+
+logger = structlog.get_logger()
+
+# Redis configuration (same variables as the event bus)
+REDIS_HOST = os.getenv("BACKEND_REDIS_HOST", os.getenv("REDIS_HOST", "localhost"))
+_redis_port = os.getenv("BACKEND_REDIS_PORT", "6379")
+# Handle case where K8s injects tcp://IP:PORT format
+REDIS_PORT = int(_redis_port.split(":")[-1]) if _redis_port.startswith("tcp://") else int(_redis_port)
+REDIS_PASSWORD = os.getenv("REDIS_PASSWORD", None)
+REDIS_DB = int(os.getenv("REDIS_DB", "0"))
+
+# Off by default so a single API process still runs workflows without a worker
+JOB_QUEUE_ENABLED = os.getenv("JOB_QUEUE_ENABLED", "false").lower() == "true"
+JOB_QUEUE_NAME = os.getenv("JOB_QUEUE_NAME", "ic:jobs")
+
+REDIS_SETTINGS = RedisSettings(
+    host=REDIS_HOST,
+    port=REDIS_PORT,
+    password=REDIS_PASSWORD,
+    database=REDIS_DB,
+)
+
+
+# Singleton pool
+_job_pool: Optional[ArqRedis] = None
+
+
+async def get_job_pool() -> ArqRedis:
+    """Get or create the singleton ARQ Redis pool."""
+    global _job_pool
+    if _job_pool is None:
+        _job_pool = await create_pool(REDIS_SETTINGS, default_queue_name=JOB_QUEUE_NAME)
+        logger.info("job_queue_connected", host=REDIS_HOST, port=REDIS_PORT, queue=JOB_QUEUE_NAME)
+    return _job_pool
+
+
+async def enqueue_job(function: str, *args: Any, job_id: Optional[str] = None) -> Optional[str]:
+    """
+    Enqueue a job for the worker pool.
+
+    Args:
+        function: Name of a function registered in jobs.WorkerSettings
+        args: Positional arguments (must be picklable)
+        job_id: Optional job ID; a job with the same ID is only enqueued once
+
+    Returns:
+        The job ID, or None if a job with this ID already exists
+    """
+    pool = await get_job_pool()
+    job = await pool.enqueue_job(function, *args, _job_id=job_id)
+    if job is None:
+        logger.warning("job_already_enqueued", function=function, job_id=job_id)
+        return None
+    logger.info("job_enqueued", function=function, job_id=job.job_id)
+    return job.job_id
+
+
+async def close_job_pool():
+    """Close the ARQ pool."""
+    global _job_pool
+    if _job_pool is not None:
+        await _job_pool.aclose()
+        _job_pool = None
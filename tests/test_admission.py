@@ -0,0 +1,135 @@
+"""
+Tests for the workflow admission controller.
+"""
+
+import asyncio
+
+import pytest
+
+
+async def _settle():
+    """Let every ready task run until it blocks again."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestAdmissionController:
+    """Test the counter + condition admission controller."""
+
+    def test_rejects_non_positive_limit(self):
+        """Test the limit must allow at least one run."""
+        from services.admission import AdmissionController
+
+        with pytest.raises(ValueError):
+            AdmissionController(max_concurrent=0)
+
+    async def test_acquire_waits_for_free_slot(self):
+        """Test runs beyond the limit wait until a slot is released."""
+        from services.admission import AdmissionController
+
+        controller = AdmissionController(max_concurrent=2)
+        await controller.acquire()
+        await controller.acquire()
+
+        third = asyncio.create_task(controller.acquire())
+        await _settle()
+        assert not third.done()
+        assert controller.stats() == {"active": 2, "waiting": 1, "max_concurrent": 2}
+
+        await controller.release()
+        await asyncio.wait_for(third, timeout=1)
+        assert controller.active == 2
+        assert controller.waiting == 0
+
+    async def test_release_wakes_one_waiter(self):
+        """Test each release admits exactly one waiting run."""
+        from services.admission import AdmissionController
+
+        controller = AdmissionController(max_concurrent=1)
+        await controller.acquire()
+
+        waiters = [asyncio.create_task(controller.acquire()) for _ in range(3)]
+        await _settle()
+
+        await controller.release()
+        await _settle()
+        assert sum(w.done() for w in waiters) == 1
+        assert controller.active == 1
+        assert controller.waiting == 2
+
+        for w in waiters:
+            w.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+
+    async def test_resize_up_admits_waiters(self):
+        """Test raising the limit admits waiting runs without any release."""
+        from services.admission import AdmissionController
+
+        controller = AdmissionController(max_concurrent=1)
+        await controller.acquire()
+
+        waiters = [asyncio.create_task(controller.acquire()) for _ in range(2)]
+        await _settle()
+        assert controller.waiting == 2
+
+        await controller.resize(3)
+        await asyncio.wait_for(asyncio.gather(*waiters), timeout=1)
+        assert controller.active == 3
+        assert controller.max_concurrent == 3
+
+    async def test_resize_down_holds_new_runs(self):
+        """Test lowering the limit keeps admitted runs but holds new ones until under it."""
+        from services.admission import AdmissionController
+
+        controller = AdmissionController(max_concurrent=3)
+        for _ in range(3):
+            await controller.acquire()
+
+        await controller.resize(1)
+        assert controller.active == 3
+
+        waiter = asyncio.create_task(controller.acquire())
+        await controller.release()
+        await controller.release()
+        await _settle()
+        assert not waiter.done()
+
+        await controller.release()
+        await asyncio.wait_for(waiter, timeout=1)
+        assert controller.active == 1
+
+    async def test_resize_rejects_non_positive_limit(self):
+        """Test resize validates the new limit and keeps the old one."""
+        from services.admission import AdmissionController
+
+        controller = AdmissionController(max_concurrent=2)
+        with pytest.raises(ValueError):
+            await controller.resize(0)
+        assert controller.max_concurrent == 2
+
+    async def test_cancelled_waiter_is_not_counted(self):
+        """Test a waiter cancelled while queued leaves the counters clean."""
+        from services.admission import AdmissionController
+
+        controller = AdmissionController(max_concurrent=1)
+        await controller.acquire()
+
+        waiter = asyncio.create_task(controller.acquire())
+        await _settle()
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+
+        assert controller.waiting == 0
+        assert controller.active == 1
+
+    async def test_slot_releases_on_error(self):
+        """Test the slot context manager frees its slot when the block raises."""
+        from services.admission import AdmissionController
+
+        controller = AdmissionController(max_concurrent=1)
+        with pytest.raises(RuntimeError):
+            async with controller.slot():
+                assert controller.active == 1
+                raise RuntimeError("boom")
+
+        assert controller.active == 0
@@ -0,0 +1,157 @@
+"""
+Tests for policy-driven agent selection.
+"""
+
+import pytest
+
+
+def _policy(risk_tolerance: str = "moderate", **preferences):
+    """Build a policy with the given risk tolerance and preferences."""
+    from backend.schemas.policy import InvestorPolicyStatement
+
+    return InvestorPolicyStatement.model_validate({
+        "risk_appetite": {"risk_tolerance": risk_tolerance},
+        "preferences": preferences,
+    })
+
+
+def _condition(operator: str, value=None):
+    """Build an ad hoc condition on a placeholder field."""
+    from backend.orchestrator.agent_registry import AgentCondition
+
+    return AgentCondition(field="x", operator=operator, value=value, reason="test")
+
+
+class TestCompiledConditions:
+    """Test conditions compiled into predicates."""
+
+    @pytest.mark.parametrize("operator, expected, value, result", [
+        ("eq", "a", "a", True),
+        ("ne", "a", "a", False),
+        ("gt", 5, 6, True),
+        ("gt", 5, None, False),
+        ("lte", 5, None, False),
+        ("gte", 5, 5, True),
+        ("in", ["a", "b"], "b", True),
+        ("not_in", ["a", "b"], "c", True),
+        ("contains", "ai", ["ai", "energy"], True),
+        ("contains", "ai", None, False),
+        ("not_empty", None, ["ai"], True),
+        ("empty", None, None, True),
+        ("unknown", None, "anything", False),
+    ])
+    def test_operator(self, operator, expected, value, result):
+        """Test each operator against a field value."""
+        from backend.orchestrator.agent_registry import _compile_condition
+
+        assert _compile_condition(_condition(operator, expected))(value) is result
+
+    def test_membership_values_become_frozenset(self):
+        """Test in/not_in value lists are stored as frozensets."""
+        assert _condition("in", ["a", "b"]).value == frozenset({"a", "b"})
+        assert _condition("eq", ["a", "b"]).value == ["a", "b"]
+
+    def test_unhashable_value_is_not_a_member(self):
+        """Test an unhashable field value doesn't raise against a frozenset."""
+        from backend.orchestrator.agent_registry import _compile_condition
+
+        assert _compile_condition(_condition("in", ["a"]))(["a"]) is False
+        assert _compile_condition(_condition("not_in", ["a"]))(["a"]) is True
+
+    def test_registry_conditions_are_precompiled(self):
+        """Test every registry condition has a compiled predicate and a field reader."""
+        from backend.orchestrator.agent_registry import (
+            AGENT_REGISTRY,
+            _COMPILED_CONDITIONS,
+            _CONDITION_IDS,
+        )
+
+        condition_ids = {
+            id(condition)
+            for agent in AGENT_REGISTRY
+            for condition in (*agent.include_conditions, *agent.exclude_conditions)
+        }
+        assert condition_ids == set(_COMPILED_CONDITIONS) == set(_CONDITION_IDS)
+
+    def test_missing_field_path_reads_none(self):
+        """Test a path absent from the policy model reads as None instead of raising."""
+        from backend.orchestrator.agent_registry import _make_field_getter
+
+        get = _make_field_getter("constraints.not_a_field")
+        assert get(_policy()) is None
+        assert get(_policy()) is None
+
+
+class TestAgentSelection:
+    """Test select_agents_for_policy."""
+
+    @staticmethod
+    def _ids(results):
+        return [r.agent_id for r in results]
+
+    @pytest.mark.parametrize("policy, expected", [
+        ({"risk_appetite": {"risk_tolerance": "conservative"}},
+         ["scenario_stress_agent", "hedge_tail_agent"]),
+        ({"risk_appetite": {"risk_tolerance": "moderate"}},
+         []),
+        ({"risk_appetite": {"risk_tolerance": "aggressive"},
+          "preferences": {"esg_focus": True, "preferred_themes": ["AI"]}},
+         ["esg_screening_agent", "challenger_optimizer", "red_team_agent"]),
+        ({"investor_profile": {"portfolio_value": 20_000_000}},
+         ["liquidity_tc_agent", "red_team_agent"]),
+    ])
+    def test_selection_table(self, policy, expected):
+        """Test which non-core agents each policy selects, in execution order."""
+        from backend.orchestrator.agent_registry import select_agents_for_policy
+        from backend.schemas.policy import InvestorPolicyStatement
+
+        included, excluded = select_agents_for_policy(InvestorPolicyStatement.model_validate(policy))
+
+        assert [r.agent_id for r in included if r.category != "core"] == expected
+        assert not {r.agent_id for r in excluded} & set(expected)
+
+    def test_core_agents_always_included(self):
+        """Test core agents are selected for any policy."""
+        from backend.orchestrator.agent_registry import select_agents_for_policy
+
+        included, _ = select_agents_for_policy(_policy())
+        for agent_id in ("market_agent", "risk_agent", "return_agent", "optimizer_agent", "compliance_agent"):
+            assert agent_id in self._ids(included)
+
+    def test_included_in_priority_order(self):
+        """Test included agents come out in execution (priority) order."""
+        from backend.orchestrator.agent_registry import select_agents_for_policy
+
+        included, _ = select_agents_for_policy(_policy("aggressive", esg_focus=True))
+        priorities = [r.priority for r in included]
+        assert priorities == sorted(priorities)
+
+    def test_conditional_agents_follow_policy(self):
+        """Test conditional agents switch with the policy fields they read."""
+        from backend.orchestrator.agent_registry import select_agents_for_policy
+
+        conservative, _ = select_agents_for_policy(_policy("conservative"))
+        aggressive, excluded = select_agents_for_policy(_policy("aggressive", esg_focus=True))
+
+        assert "hedge_tail_agent" in self._ids(conservative)
+        assert "red_team_agent" not in self._ids(conservative)
+        assert "red_team_agent" in self._ids(aggressive)
+        assert "esg_screening_agent" in self._ids(aggressive)
+        assert "hedge_tail_agent" in self._ids(excluded)
+
+    def test_every_agent_classified_once(self):
+        """Test each registry agent ends up either included or excluded."""
+        from backend.orchestrator.agent_registry import AGENT_REGISTRY, select_agents_for_policy
+
+        included, excluded = select_agents_for_policy(_policy())
+        assert sorted(self._ids(included) + self._ids(excluded)) == sorted(a.id for a in AGENT_REGISTRY)
+
+    def test_equivalent_policies_share_cached_results(self):
+        """Test policies with the same condition outcomes reuse the memoized selection."""
+        from backend.orchestrator.agent_registry import select_agents_for_policy
+
+        first, _ = select_agents_for_policy(_policy("conservative"))
+        second, _ = select_agents_for_policy(_policy("conservative"))
+
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second))
@@ -0,0 +1,264 @@
+"""
+Tests for orchestrator checkpoint storage and resume.
+"""
+
+import asyncio
+import os
+import time
+
+import pytest
+
+
+@pytest.fixture
+async def ring():
+    """Three-slot shared-memory ring with no durable backend."""
+    from backend.orchestrator.checkpoints import SharedMemCheckpointStorage
+
+    storage = SharedMemCheckpointStorage(slots=3, slot_size=256)
+    yield storage
+    await storage.close()
+
+
+class TestFileCheckpointStorage:
+    """Test durable one-file-per-checkpoint storage."""
+
+    async def test_save_and_load(self, tmp_path):
+        """Test a saved checkpoint loads back and leaves no temp file."""
+        from backend.orchestrator.checkpoints import FileCheckpointStorage
+
+        storage = FileCheckpointStorage(tmp_path)
+        await storage.save("run-1:policy_parsed", b"payload")
+
+        assert await storage.load("run-1:policy_parsed") == b"payload"
+        assert [p.name for p in tmp_path.iterdir()] == ["run-1:policy_parsed.ckpt"]
+
+    async def test_load_missing_returns_none(self, tmp_path):
+        """Test loading a checkpoint that was never written."""
+        from backend.orchestrator.checkpoints import FileCheckpointStorage
+
+        assert await FileCheckpointStorage(tmp_path).load("run-1:missing") is None
+
+    async def test_save_replaces_atomically(self, tmp_path):
+        """Test a rewrite replaces the whole file and is visible to a fresh storage."""
+        from backend.orchestrator.checkpoints import FileCheckpointStorage
+
+        storage = FileCheckpointStorage(tmp_path)
+        await storage.save("run-1:stage", b"first version, longer")
+        await storage.save("run-1:stage", b"second")
+
+        assert await FileCheckpointStorage(tmp_path).load("run-1:stage") == b"second"
+
+    async def test_concurrent_saves_keep_call_order(self, tmp_path):
+        """Test concurrent writes to one checkpoint land in call order."""
+        from backend.orchestrator.checkpoints import FileCheckpointStorage
+
+        storage = FileCheckpointStorage(tmp_path)
+        await asyncio.gather(*(storage.save("run-1:stage", str(i).encode()) for i in range(20)))
+
+        assert await storage.load("run-1:stage") == b"19"
+
+    async def test_delete_run_only_removes_that_run(self, tmp_path):
+        """Test deleting run-1 leaves runs whose IDs merely share its prefix."""
+        from backend.orchestrator.checkpoints import FileCheckpointStorage
+
+        storage = FileCheckpointStorage(tmp_path)
+        for checkpoint_id in ("run-1:a", "run-1:b", "run-10:a"):
+            await storage.save(checkpoint_id, b"x")
+
+        assert await storage.delete_run("run-1") == 2
+        assert await storage.load("run-1:a") is None
+        assert await storage.load("run-10:a") == b"x"
+
+    async def test_prune_removes_stale_files(self, tmp_path):
+        """Test prune deletes checkpoints and temp files older than max_age."""
+        from backend.orchestrator.checkpoints import FileCheckpointStorage
+
+        storage = FileCheckpointStorage(tmp_path)
+        await storage.save("run-old:a", b"x")
+        await storage.save("run-new:a", b"x")
+        leftover = tmp_path / "run-old:b.tmp"
+        leftover.write_bytes(b"partial")
+
+        stale = time.time() - 7200
+        for path in (tmp_path / "run-old:a.ckpt", leftover):
+            os.utime(path, (stale, stale))
+
+        assert await storage.prune(3600) == 2
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["run-new:a.ckpt"]
+
+
+class TestSharedMemCheckpointStorage:
+    """Test the shared-memory CRC ring."""
+
+    def test_rejects_invalid_geometry(self):
+        """Test slot count and size are validated."""
+        from backend.orchestrator.checkpoints import SharedMemCheckpointStorage
+
+        with pytest.raises(ValueError):
+            SharedMemCheckpointStorage(slots=0)
+        with pytest.raises(ValueError):
+            SharedMemCheckpointStorage(slot_size=8)
+
+    async def test_load_returns_newest_version(self, ring):
+        """Test repeated saves of one checkpoint load the latest payload."""
+        await ring.save("run-1:stage", b"v1")
+        await ring.save("run-1:stage", b"v2")
+
+        assert await ring.load("run-1:stage") == b"v2"
+        assert await ring.load("run-1:other") is None
+
+    async def test_oldest_checkpoint_rotates_out(self, ring):
+        """Test the ring keeps only the last `slots` checkpoints."""
+        for i in range(4):
+            await ring.save(f"run-1:stage-{i}", f"p{i}".encode())
+
+        assert await ring.load("run-1:stage-0") is None
+        assert [await ring.load(f"run-1:stage-{i}") for i in (1, 2, 3)] == [b"p1", b"p2", b"p3"]
+
+    async def test_corrupt_slot_is_skipped(self, ring):
+        """Test a slot failing its CRC is ignored and an older intact copy is used."""
+        from backend.orchestrator.checkpoints import _HEADER
+
+        await ring.save("run-1:stage", b"old")
+        await ring.save("run-1:stage", b"new")
+
+        # Newest save is version 2, in slot 2 % 3; flip a payload byte
+        offset = 2 * ring.slot_size + _HEADER.size + len(b"run-1:stage")
+        ring._buf[offset] ^= 0xFF
+
+        assert await ring.load("run-1:stage") == b"old"
+
+    async def test_oversized_checkpoint_goes_to_durable_only(self, tmp_path):
+        """Test a payload too large for a slot skips the ring but is still persisted."""
+        from backend.orchestrator.checkpoints import FileCheckpointStorage, SharedMemCheckpointStorage
+
+        durable = FileCheckpointStorage(tmp_path)
+        storage = SharedMemCheckpointStorage(slots=2, slot_size=64, durable=durable)
+        try:
+            payload = b"x" * 200
+            await storage.save("run-1:big", payload)
+            assert list(storage._scan_slots()) == []
+
+            await storage.flush()
+            assert await storage.load("run-1:big") == payload
+        finally:
+            await storage.close()
+
+    async def test_oversized_save_replaces_older_ring_copy(self, tmp_path):
+        """Test an oversized save hides earlier ring copies so load returns the new payload."""
+        from backend.orchestrator.checkpoints import FileCheckpointStorage, SharedMemCheckpointStorage
+
+        storage = SharedMemCheckpointStorage(
+            slots=3, slot_size=256, durable=FileCheckpointStorage(tmp_path)
+        )
+        try:
+            await storage.save("r:x", b"old")
+            await storage.save("r:y", b"other")
+            payload = b"x" * 1000
+            await storage.save("r:x", payload)
+            await storage.flush()
+
+            assert await storage.load("r:x") == payload
+            assert await storage.load("r:y") == b"other"
+        finally:
+            await storage.close()
+
+    async def test_load_falls_back_to_durable(self, tmp_path):
+        """Test checkpoints rotated out of the ring load from durable storage."""
+        from backend.orchestrator.checkpoints import FileCheckpointStorage, SharedMemCheckpointStorage
+
+        storage = SharedMemCheckpointStorage(
+            slots=1, slot_size=256, durable=FileCheckpointStorage(tmp_path)
+        )
+        try:
+            await storage.save("run-1:a", b"first")
+            await storage.save("run-1:b", b"second")
+            await storage.flush()
+
+            assert await storage.load("run-1:a") == b"first"
+        finally:
+            await storage.close()
+
+    async def test_close_releases_segment(self):
+        """Test close unlinks the shared-memory segment."""
+        from multiprocessing import shared_memory
+        from backend.orchestrator.checkpoints import SharedMemCheckpointStorage
+
+        storage = SharedMemCheckpointStorage(slots=1, slot_size=64)
+        name = storage.name
+        await storage.close()
+
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+
+
+class TestEngineResume:
+    """Test phase resume from checkpoints in the orchestrator engine."""
+
+    @pytest.fixture
+    def checkpoint_dir(self, tmp_path, monkeypatch):
+        """Point engine checkpoints at a temp directory."""
+        from backend.orchestrator import engine
+
+        monkeypatch.setattr(engine, "CHECKPOINT_DIR", str(tmp_path))
+        return tmp_path
+
+    async def test_phase_resumes_from_checkpoint(self, checkpoint_dir):
+        """Test a retried run returns a checkpointed phase result without re-running it."""
+        from backend.orchestrator.engine import OrchestratorEngine
+
+        calls = []
+
+        async def phase():
+            calls.append(1)
+            return {"selected": ["market_agent"]}
+
+        first = OrchestratorEngine(run_id="run-resume")
+        try:
+            assert await first._resume_or_run_phase("agents_selected", phase) == {"selected": ["market_agent"]}
+        finally:
+            await first._close_checkpoint_storage()
+
+        async def must_not_run():
+            raise AssertionError("phase re-ran despite checkpoint")
+
+        retry = OrchestratorEngine(run_id="run-resume")
+        try:
+            result = await retry._resume_or_run_phase("agents_selected", must_not_run)
+        finally:
+            await retry._close_checkpoint_storage()
+
+        assert result == {"selected": ["market_agent"]}
+        assert calls == [1]
+
+    async def test_resume_disabled_reruns_phase(self, checkpoint_dir):
+        """Test resume=False ignores an existing checkpoint."""
+        from backend.orchestrator.engine import OrchestratorEngine
+
+        engine = OrchestratorEngine(run_id="run-fresh")
+        try:
+            await engine._resume_or_run_phase("stage", _constant(1))
+            await engine._flush_checkpoints()
+            assert await engine._resume_or_run_phase("stage", _constant(2), resume=False) == 2
+        finally:
+            await engine._close_checkpoint_storage()
+
+    async def test_completed_run_discards_checkpoints(self, checkpoint_dir):
+        """Test a completed run leaves no checkpoint files behind."""
+        from backend.orchestrator.engine import OrchestratorEngine
+
+        engine = OrchestratorEngine(run_id="run-done")
+        try:
+            await engine._resume_or_run_phase("stage", _constant(1))
+            await engine._discard_checkpoints()
+        finally:
+            await engine._close_checkpoint_storage()
+
+        assert list(checkpoint_dir.glob("*.ckpt")) == []
+
+
+def _constant(value):
+    """Phase factory returning a fixed result."""
+    async def phase():
+        return value
+    return phase
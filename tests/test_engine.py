@@ -0,0 +1,25 @@
+"""
+Tests for the orchestrator engine plan.
+"""
+
+
+class TestOrchestratorPlan:
+    """Test plan export."""
+
+    async def test_trace_events_export_in_emitted_shape(self):
+        """Test dumped plan trace events match the payloads sent to the event emitter."""
+        from backend.orchestrator.engine import OrchestratorEngine, OrchestratorPlan
+        from backend.schemas.policy import InvestorPolicyStatement
+
+        emitted = []
+
+        async def emitter(event_type, payload):
+            emitted.append({"event_type": event_type, **payload})
+
+        engine = OrchestratorEngine(run_id="run-export", event_emitter=emitter)
+        engine.plan = OrchestratorPlan(run_id="run-export", policy=InvestorPolicyStatement())
+        await engine.emit_event("orchestrator.started", {"step": 1})
+
+        exported = engine.plan.model_dump()["trace_events"]
+        assert exported == emitted
+        assert exported[0]["actor"]["kind"] == "orchestrator"
@@ -0,0 +1,53 @@
+"""
+Tests for orchestrator workflow templates.
+"""
+
+import pytest
+
+
+@pytest.fixture
+def workflows(monkeypatch):
+    """Workflows module with stub agents and an empty template cache."""
+    from agent_framework import BaseAgent
+    from backend.orchestrator import workflows
+
+    class StubAgent(BaseAgent):
+        async def run(self, messages=None, **kwargs):
+            raise NotImplementedError
+
+        async def run_stream(self, messages=None, **kwargs):
+            raise NotImplementedError
+            yield
+
+    monkeypatch.setattr(workflows, "_cached_agent", lambda kind, name: StubAgent(name=name))
+    monkeypatch.setattr(workflows, "_WORKFLOW_TEMPLATES", {})
+    monkeypatch.setattr(workflows, "FAST_SEQUENTIAL", False)
+    return workflows
+
+
+class TestWorkflowTemplates:
+    """Test workflows are built from shared templates."""
+
+    def test_runs_with_different_names_share_template(self, workflows):
+        """Test per-run workflow names reuse one template but get their own workflow."""
+        first = workflows.create_sequential_workflow(name="sequential_run-1")
+        second = workflows.create_sequential_workflow(name="sequential_run-2")
+
+        assert len(workflows._WORKFLOW_TEMPLATES) == 1
+        assert first is not second
+        assert (first.name, second.name) == ("sequential_run-1", "sequential_run-2")
+
+    def test_graph_arguments_get_their_own_template(self, workflows):
+        """Test arguments that change the graph are part of the template key."""
+        workflows.create_dag_portfolio_workflow(name="dag_run-1")
+        workflows.create_dag_portfolio_workflow(name="dag_run-2")
+        workflows.create_concurrent_risk_return_workflow(name="concurrent_run-1")
+
+        assert sorted(workflows._WORKFLOW_TEMPLATES) == [("concurrent",), ("dag",)]
+
+    def test_stateful_executors_not_shared_between_builds(self, workflows):
+        """Test each build gets its own fan-out executor."""
+        first = workflows.create_concurrent_risk_return_workflow(name="concurrent_run-1")
+        second = workflows.create_concurrent_risk_return_workflow(name="concurrent_run-2")
+
+        assert first.executors["risk_return_fan_out"] is not second.executors["risk_return_fan_out"]
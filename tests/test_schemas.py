@@ -111,6 +111,101 @@ class TestArtifactSchemas:
         assert len(report.violations) == 1
 
 
+def _universe(**overrides):
+    """Build a minimal Universe artifact."""
+    from backend.schemas.artifacts import Universe
+
+    fields = {
+        "artifact_id": "universe-1",
+        "run_id": "run-123",
+        "stage_id": "build_universe",
+        "producer": "test",
+        "universe_name": "Test universe",
+        "filter_criteria": {"min_equity": 0.2, "max_equity": 0.8},
+    }
+    fields.update(overrides)
+    return Universe(**fields)
+
+
+def _fund(accession_number: str, manager_name: str, total_assets: float):
+    """Build a FundInfo row."""
+    from backend.schemas.artifacts import FundInfo
+
+    return FundInfo(
+        accession_number=accession_number,
+        series_name=f"Series {accession_number}",
+        series_id=f"S{accession_number}",
+        manager_name=manager_name,
+        total_assets=total_assets,
+        net_assets=total_assets,
+        primary_asset_class="equity",
+        holding_count=10,
+        equity_pct=0.7,
+        fixed_income_pct=0.2,
+        cash_pct=0.05,
+        other_pct=0.05,
+    )
+
+
+class TestArtifactHelpers:
+    """Test artifact hashing and column helpers."""
+
+    def test_to_columns_transposes_rows(self):
+        """Test rows are transposed into one tuple per field, in row order."""
+        from backend.schemas.artifacts import FundInfo, to_columns
+
+        funds = [_fund("A1", "Alpha", 100.0), _fund("B2", "Beta", 250.0)]
+        columns = to_columns(funds, FundInfo)
+
+        assert list(columns) == list(FundInfo.model_fields)
+        assert columns["accession_number"] == ("A1", "B2")
+        assert columns["manager_name"] == ("Alpha", "Beta")
+        assert columns["total_assets"] == (100.0, 250.0)
+
+    def test_to_columns_empty_rows(self):
+        """Test empty input still yields every column, each empty."""
+        from backend.schemas.artifacts import FundInfo, to_columns
+
+        columns = to_columns([], FundInfo)
+
+        assert list(columns) == list(FundInfo.model_fields)
+        assert all(column == () for column in columns.values())
+
+    def test_artifact_hash_is_cached(self):
+        """Test the hash is computed once and stays stable."""
+        universe = _universe(funds=[_fund("A1", "Alpha", 100.0)])
+
+        first = universe.artifact_hash
+        assert len(first) == 16
+        assert universe.artifact_hash is first
+        assert universe.model_dump()["artifact_hash"] == first
+
+    def test_artifact_hash_ignores_dict_key_order(self):
+        """Test free-form dict fields hash the same regardless of key order."""
+        a = _universe(filter_criteria={"min_equity": 0.2, "max_equity": 0.8})
+        b = _universe(filter_criteria={"max_equity": 0.8, "min_equity": 0.2})
+
+        assert a.artifact_hash == b.artifact_hash
+
+    def test_model_copy_update_resets_hash(self):
+        """Test copies with changed content get a fresh hash, plain copies keep it."""
+        universe = _universe(funds=[_fund("A1", "Alpha", 100.0)])
+        original = universe.artifact_hash
+
+        updated = universe.model_copy(update={"funds": [_fund("B2", "Beta", 250.0)]})
+        assert updated.artifact_hash != original
+        assert updated.artifact_hash == _universe(funds=[_fund("B2", "Beta", 250.0)]).artifact_hash
+
+        assert universe.model_copy().artifact_hash == original
+
+    def test_artifacts_are_frozen(self):
+        """Test artifacts reject mutation, so the cached hash can't go stale."""
+        universe = _universe()
+
+        with pytest.raises(ValidationError):
+            universe.universe_name = "changed"
+
+
 class TestEventSchemas:
     """Test event schema validation."""
 
@@ -144,6 +239,20 @@ class TestEventSchemas:
         assert "run-123" in sse_data
         assert "50% complete" in sse_data
 
+    def test_stream_event_reuses_raw_json(self):
+        """Test events parsed from Redis reuse their raw JSON for SSE."""
+        from backend.schemas.events import WorkflowEvent, EventKind
+
+        raw = WorkflowEvent(
+            run_id="run-123",
+            kind=EventKind.HEARTBEAT,
+            message="heartbeat",
+        ).model_dump_json()
+
+        event = WorkflowEvent.from_stream_json(raw)
+        assert event.run_id == "run-123"
+        assert event.to_sse_data() is raw
+
 
 class TestRunSchemas:
     """Test run metadata schemas."""
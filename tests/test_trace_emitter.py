@@ -0,0 +1,118 @@
+"""
+Tests for trace event delivery through the bounded queue.
+"""
+
+import asyncio
+
+import pytest
+
+
+class _GatedSink:
+    """Batch callback that records events but blocks until opened."""
+
+    def __init__(self):
+        self.events = []
+        self.gate = asyncio.Event()
+
+    async def __call__(self, events):
+        await self.gate.wait()
+        self.events.extend(events)
+
+
+async def _settle():
+    """Let every ready task run until it blocks again."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestTraceEmitterQueue:
+    """Test the bounded delivery queue and its drop policies."""
+
+    def test_rejects_unknown_drop_policy(self):
+        """Test only the documented drop policies are accepted."""
+        from backend.orchestrator.trace_emitter import TraceEmitter
+
+        with pytest.raises(ValueError):
+            TraceEmitter("run-1", event_callback=None, drop_policy="drop_newest")
+
+    async def test_events_delivered_in_order(self):
+        """Test queued events reach the batch callback in emit order."""
+        from backend.orchestrator.trace_emitter import TraceEmitter
+
+        delivered = []
+
+        async def batch(events):
+            delivered.extend(events)
+
+        emitter = TraceEmitter("run-1", event_callback=None, batch_callback=batch)
+        for i in range(10):
+            await emitter.enqueue("test.event", {"i": i})
+        await emitter.aclose()
+
+        assert [payload["i"] for _, payload in delivered] == list(range(10))
+        assert emitter.dropped_events == 0
+
+    async def test_drop_oldest_discards_oldest_when_full(self, monkeypatch):
+        """Test a full queue drops its oldest events instead of blocking producers."""
+        from backend.orchestrator import trace_emitter
+        from backend.orchestrator.trace_emitter import TraceEmitter
+
+        monkeypatch.setattr(trace_emitter, "TRACE_QUEUE_MAXSIZE", 3)
+        sink = _GatedSink()
+        emitter = TraceEmitter(
+            "run-1", event_callback=None, batch_callback=sink, drop_policy="drop_oldest"
+        )
+
+        # The drainer takes event 0 and blocks in the sink, leaving the queue empty
+        await emitter.enqueue("test.event", {"i": 0})
+        await _settle()
+
+        for i in range(1, 7):
+            await asyncio.wait_for(emitter.enqueue("test.event", {"i": i}), timeout=1)
+        assert emitter.dropped_events == 3
+
+        sink.gate.set()
+        await emitter.aclose()
+        assert [payload["i"] for _, payload in sink.events] == [0, 4, 5, 6]
+
+    async def test_block_policy_waits_for_room(self, monkeypatch):
+        """Test a full queue makes producers wait and delivers every event."""
+        from backend.orchestrator import trace_emitter
+        from backend.orchestrator.trace_emitter import TraceEmitter
+
+        monkeypatch.setattr(trace_emitter, "TRACE_QUEUE_MAXSIZE", 2)
+        sink = _GatedSink()
+        emitter = TraceEmitter("run-1", event_callback=None, batch_callback=sink)
+
+        await emitter.enqueue("test.event", {"i": 0})
+        await _settle()
+        await emitter.enqueue("test.event", {"i": 1})
+        await emitter.enqueue("test.event", {"i": 2})
+
+        blocked = asyncio.create_task(emitter.enqueue("test.event", {"i": 3}))
+        await _settle()
+        assert not blocked.done()
+
+        sink.gate.set()
+        await asyncio.wait_for(blocked, timeout=1)
+        await emitter.aclose()
+
+        assert [payload["i"] for _, payload in sink.events] == [0, 1, 2, 3]
+        assert emitter.dropped_events == 0
+
+    async def test_flush_waits_for_delivery(self):
+        """Test flush returns only after queued events were delivered."""
+        from backend.orchestrator.trace_emitter import TraceEmitter
+
+        sink = _GatedSink()
+        emitter = TraceEmitter("run-1", event_callback=None, batch_callback=sink)
+        await emitter.enqueue("test.event", {"i": 0})
+
+        flush = asyncio.create_task(emitter.flush())
+        await _settle()
+        assert not flush.done()
+
+        sink.gate.set()
+        await asyncio.wait_for(flush, timeout=1)
+        assert len(sink.events) == 1
+        await emitter.aclose()
@@ -5,11 +5,13 @@ Queries fund database to build eligible investment universe based on mandate con
 
 import os
 import uuid
+from collections import Counter
+from operator import mul
 from typing import List
 import asyncpg
 import structlog
 
-from schemas.artifacts import Universe, FundInfo, MandateDSL, DataClassification
+from schemas.artifacts import Universe, FundInfo, MandateDSL, DataClassification, to_columns
 from worker.executors.base import BaseExecutor
 
 logger = structlog.get_logger()
@@ -75,10 +77,11 @@ class BuildUniverseExecutor(BaseExecutor):
 
             await self.emit_progress(f"Universe: {len(eligible_funds)} eligible funds")
 
-            # Calculate universe statistics
-            total_aum = sum(f.total_assets for f in eligible_funds)
-            asset_class_breakdown = self._calculate_asset_breakdown(eligible_funds)
-            manager_breakdown = self._calculate_manager_breakdown(eligible_funds)
+            # Calculate universe statistics over column-major fund data
+            columns = to_columns(eligible_funds, FundInfo)
+            total_aum = sum(columns["total_assets"])
+            asset_class_breakdown = self._calculate_asset_breakdown(columns)
+            manager_breakdown = self._calculate_manager_breakdown(columns)
 
             # Create Universe artifact
             universe = Universe(
@@ -201,26 +204,23 @@ class BuildUniverseExecutor(BaseExecutor):
 
         return eligible
 
-    def _calculate_asset_breakdown(self, funds: List[FundInfo]) -> dict:
+    def _calculate_asset_breakdown(self, columns: dict) -> dict:
         """Calculate aggregate asset class breakdown."""
-        if not funds:
+        assets = columns["total_assets"]
+        if not assets:
             return {}
 
-        total_aum = sum(f.total_assets for f in funds)
+        total_aum = sum(assets)
         if total_aum == 0:
             return {}
 
         return {
-            "equity": sum(f.total_assets * f.equity_pct for f in funds) / total_aum,
-            "fixed_income": sum(f.total_assets * f.fixed_income_pct for f in funds) / total_aum,
-            "cash": sum(f.total_assets * f.cash_pct for f in funds) / total_aum,
-            "other": sum(f.total_assets * f.other_pct for f in funds) / total_aum,
+            "equity": sum(map(mul, assets, columns["equity_pct"])) / total_aum,
+            "fixed_income": sum(map(mul, assets, columns["fixed_income_pct"])) / total_aum,
+            "cash": sum(map(mul, assets, columns["cash_pct"])) / total_aum,
+            "other": sum(map(mul, assets, columns["other_pct"])) / total_aum,
         }
 
-    def _calculate_manager_breakdown(self, funds: List[FundInfo]) -> dict:
+    def _calculate_manager_breakdown(self, columns: dict) -> dict:
         """Count funds by manager."""
-        breakdown = {}
-        for fund in funds:
-            manager = fund.manager_name
-            breakdown[manager] = breakdown.get(manager, 0) + 1
-        return dict(sorted(breakdown.items(), key=lambda x: x[1], reverse=True)[:10])
+        return dict(Counter(columns["manager_name"]).most_common(10))